@@ -0,0 +1 @@
+"""Paquete con scripts de medición de rendimiento y memoria del juego."""
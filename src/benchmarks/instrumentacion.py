@@ -0,0 +1,286 @@
+"""Módulo con la instrumentación opcional de los caminos críticos del juego.
+
+Cuenta y mide las llamadas a los métodos de OBJETIVOS (jugar, validar_victoria,
+terminado, los chequeos de líneas y el envío y recepción por socket) sin usar
+un profiler externo. Mientras está desactivada no cuesta nada: activar()
+reemplaza los métodos de las clases por envolturas que miden y desactivar()
+restaura los originales, así que fuera de ese intervalo se ejecuta el mismo
+código de siempre.
+
+Uso::
+
+    from src.benchmarks import instrumentacion
+
+    with instrumentacion.medir():
+        ...  # partidas, red, etc.
+    instrumentacion.imprimir(instrumentacion.instantanea())
+
+Los tiempos son inclusivos: una llamada a HyperCat.jugar incluye las llamadas a
+intentar_jugar y _linea_ganadora que haga. Se ejecuta como script con
+``python -m src.benchmarks.instrumentacion`` para medir los casos de
+rendimiento.py.
+"""
+
+import random
+import time
+from collections.abc import Callable, Iterator
+from contextlib import ExitStack, contextmanager
+from functools import wraps
+
+from src.core import (
+    BaseGato,
+    EstadoHyperCat,
+    Gato,
+    GatoBitboard,
+    GatoNxN,
+    HyperCat,
+    HyperCatRecursivo,
+)
+from src.network import BaseSocket
+
+OBJETIVOS: tuple[tuple[type, tuple[str, ...]], ...] = (
+    (
+        BaseGato,
+        ("validar_victoria", "terminado", "_actualizar_resultado"),
+    ),
+    (
+        Gato,
+        ("jugar", "intentar_jugar", "_actualizar_resultado", "_linea_ganadora"),
+    ),
+    (GatoBitboard, ("intentar_jugar", "_actualizar_resultado", "_linea_ganadora")),
+    (GatoNxN, ("intentar_jugar", "_actualizar_resultado")),
+    (HyperCat, ("jugar", "intentar_jugar", "_linea_ganadora")),
+    (HyperCatRecursivo, ("jugar", "intentar_jugar", "_linea_ganadora")),
+    (EstadoHyperCat, ("jugar", "terminado")),
+    (
+        BaseSocket,
+        ("_send_json", "_send_payload", "_recv_payload", "_recv_exact", "_llenar"),
+    ),
+)
+"""Métodos instrumentados por defecto, agrupados por la clase que los define."""
+
+MUESTRAS_MAXIMAS: int = 4096
+"""Duraciones guardadas por método para calcular percentiles."""
+
+_PERCENTILES: tuple[int, ...] = (50, 90, 99)
+
+
+class Medicion:
+    """
+    Contadores y muestras de duración de un método instrumentado.
+
+    Guarda a lo sumo MUESTRAS_MAXIMAS duraciones elegidas al azar entre todas
+    las llamadas (muestreo de reservorio), de modo que la memoria no crece con
+    el tiempo que lleva activa la instrumentación.
+
+    Attributes:
+        llamadas: Cantidad de llamadas.
+        total_ns: Suma de las duraciones en nanosegundos.
+        maximo_ns: La duración más larga.
+        muestras: Muestra de las duraciones.
+    """
+
+    __slots__ = ("llamadas", "total_ns", "maximo_ns", "muestras", "_azar")
+
+    def __init__(self) -> None:
+        """Inicializa la medición sin llamadas."""
+        self.reiniciar()
+
+    def reiniciar(self) -> None:
+        """Descarta las llamadas registradas."""
+        self.llamadas = 0
+        self.total_ns = 0
+        self.maximo_ns = 0
+        self.muestras: list[int] = []
+        self._azar = random.Random(0)
+
+    def registrar(self, duracion_ns: int) -> None:
+        """
+        Registra una llamada.
+
+        Args:
+            duracion_ns: La duración de la llamada en nanosegundos.
+        """
+        self.llamadas += 1
+        self.total_ns += duracion_ns
+        if duracion_ns > self.maximo_ns:
+            self.maximo_ns = duracion_ns
+
+        if len(self.muestras) < MUESTRAS_MAXIMAS:
+            self.muestras.append(duracion_ns)
+        elif (i := self._azar.randrange(self.llamadas)) < MUESTRAS_MAXIMAS:
+            self.muestras[i] = duracion_ns
+
+    def resumen(self) -> dict[str, float]:
+        """
+        Resume la medición en microsegundos.
+
+        Returns:
+            Diccionario con las llamadas, el tiempo total en milisegundos y la
+            media, los percentiles 50, 90 y 99 y el máximo en microsegundos.
+        """
+        ordenadas = sorted(self.muestras)
+        resumen = {
+            "llamadas": self.llamadas,
+            "total_ms": self.total_ns / 1e6,
+            "media_us": self.total_ns / self.llamadas / 1e3 if self.llamadas else 0.0,
+        }
+        for p in _PERCENTILES:
+            indice = min(len(ordenadas) - 1, len(ordenadas) * p // 100)
+            resumen[f"p{p}_us"] = ordenadas[indice] / 1e3 if ordenadas else 0.0
+        resumen["max_us"] = self.maximo_ns / 1e3
+        return resumen
+
+
+_mediciones: dict[str, Medicion] = {}
+_originales: dict[tuple[type, str], Callable] = {}
+
+
+def _envolver(metodo: Callable, medicion: Medicion) -> Callable:
+    """
+    Crea la envoltura que mide las llamadas a un método.
+
+    Args:
+        metodo: La función original.
+        medicion: Donde registrar cada llamada.
+
+    Returns:
+        Una función con la misma firma que registra la duración de cada llamada,
+        incluso si lanza una excepción.
+    """
+    reloj = time.perf_counter_ns
+
+    @wraps(metodo)
+    def envoltura(*args, **kwargs):
+        inicio = reloj()
+        try:
+            return metodo(*args, **kwargs)
+        finally:
+            medicion.registrar(reloj() - inicio)
+
+    return envoltura
+
+
+def activa() -> bool:
+    """
+    Indica si la instrumentación está activa.
+
+    Returns:
+        True si hay métodos instrumentados.
+    """
+    return bool(_originales)
+
+
+def activar(
+    objetivos: tuple[tuple[type, tuple[str, ...]], ...] = OBJETIVOS,
+) -> None:
+    """
+    Instala las envolturas de medición en los métodos indicados.
+
+    Solo se envuelven los métodos definidos en la propia clase; las subclases
+    que no los redefinen quedan medidas a través de la clase base. Las
+    mediciones acumuladas se conservan hasta llamar a reiniciar().
+
+    Args:
+        objetivos: Pares (clase, nombres de métodos), por defecto OBJETIVOS.
+
+    Raises:
+        RuntimeError: Si la instrumentación ya está activa.
+        AttributeError: Si una clase no define alguno de los métodos.
+    """
+    if _originales:
+        raise RuntimeError("La instrumentación ya está activa.")
+
+    for clase, nombres in objetivos:
+        for nombre in nombres:
+            if nombre not in vars(clase):
+                raise AttributeError(f"{clase.__name__} no define {nombre}.")
+
+    for clase, nombres in objetivos:
+        for nombre in nombres:
+            original = vars(clase)[nombre]
+            clave = f"{clase.__name__}.{nombre}"
+            medicion = _mediciones.setdefault(clave, Medicion())
+            _originales[(clase, nombre)] = original
+            setattr(clase, nombre, _envolver(original, medicion))
+
+
+def desactivar() -> None:
+    """Restaura los métodos originales. No hace nada si no está activa."""
+    for (clase, nombre), original in _originales.items():
+        setattr(clase, nombre, original)
+    _originales.clear()
+
+
+def reiniciar() -> None:
+    """Descarta todas las mediciones acumuladas."""
+    for medicion in _mediciones.values():
+        medicion.reiniciar()
+
+
+@contextmanager
+def medir(
+    objetivos: tuple[tuple[type, tuple[str, ...]], ...] = OBJETIVOS,
+) -> Iterator[None]:
+    """
+    Activa la instrumentación dentro de un bloque with.
+
+    Args:
+        objetivos: Pares (clase, nombres de métodos), por defecto OBJETIVOS.
+    """
+    activar(objetivos)
+    try:
+        yield
+    finally:
+        desactivar()
+
+
+def instantanea() -> dict[str, dict[str, float]]:
+    """
+    Obtiene el resumen de todos los métodos que recibieron llamadas.
+
+    Returns:
+        Diccionario ``"Clase.metodo"`` -> resumen (ver Medicion.resumen),
+        ordenado por tiempo total de mayor a menor.
+    """
+    resumenes = {
+        clave: medicion.resumen()
+        for clave, medicion in _mediciones.items()
+        if medicion.llamadas
+    }
+    return dict(sorted(resumenes.items(), key=lambda par: -par[1]["total_ms"]))
+
+
+def imprimir(resumenes: dict[str, dict[str, float]]) -> None:
+    """
+    Imprime una instantánea como tabla.
+
+    Args:
+        resumenes: El resultado de instantanea().
+    """
+    columnas = ("media_us", *(f"p{p}_us" for p in _PERCENTILES), "max_us")
+    print(
+        f"{'Método':<36}{'Llamadas':>12}{'Total ms':>11}"
+        + "".join(f"{c.removesuffix('_us') + ' µs':>11}" for c in columnas)
+    )
+    for clave, resumen in resumenes.items():
+        print(
+            f"{clave:<36}{resumen['llamadas']:>12,}{resumen['total_ms']:>11.1f}"
+            + "".join(f"{resumen[c]:>11.2f}" for c in columnas)
+        )
+
+
+def main():
+    """Mide una vez cada caso de rendimiento.py con la instrumentación activa."""
+    from src.benchmarks.rendimiento import CASOS
+
+    with ExitStack() as recursos:
+        lotes = [caso.preparar(recursos)[0] for caso in CASOS]
+        with medir():
+            for lote in lotes:
+                lote()
+    imprimir(instantanea())
+
+
+if __name__ == "__main__":
+    main()
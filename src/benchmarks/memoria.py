@@ -0,0 +1,116 @@
+"""Script que mide la memoria ocupada por cada partida en curso.
+
+Se ejecuta con ``python -m src.benchmarks.memoria``. Crea muchas partidas,
+mide con tracemalloc los bytes asignados y los divide por la cantidad de
+partidas; también compara clone() con copy.deepcopy().
+"""
+
+import copy
+import random
+import time
+import tracemalloc
+from collections.abc import Callable
+
+from src.core import BaseGato, Gato, GatoBitboard, HyperCat
+
+
+def bytes_por_partida(fabrica: Callable[[], object], partidas: int = 1000) -> float:
+    """
+    Mide la memoria promedio de los objetos creados por una fábrica.
+
+    Args:
+        fabrica: Función que crea una partida.
+        partidas: Cantidad de partidas a crear para promediar.
+
+    Returns:
+        Los bytes asignados por partida mientras todas siguen vivas.
+    """
+    tracemalloc.start()
+    inicio = tracemalloc.get_traced_memory()[0]
+    vivas = [fabrica() for _ in range(partidas)]
+    fin = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del vivas
+    return (fin - inicio) / partidas
+
+
+def partida_en_curso(jugadas: int, semilla: int = 0) -> HyperCat:
+    """
+    Crea una partida de HyperCat con jugadas aleatorias reproducibles.
+
+    Args:
+        jugadas: Cantidad máxima de jugadas a realizar.
+        semilla: Semilla del generador aleatorio.
+
+    Returns:
+        La partida, detenida antes si terminó.
+    """
+    generador = random.Random(semilla)
+    juego = HyperCat()
+    for _ in range(jugadas):
+        if juego.terminado():
+            break
+        fila, columna = generador.choice(juego.movimientos_legales())
+        juego.jugar(fila % 3, columna % 3, fila // 3, columna // 3)
+    return juego
+
+
+def microsegundos(funcion: Callable[[], object], repeticiones: int) -> float:
+    """
+    Mide el tiempo promedio de una función.
+
+    Args:
+        funcion: La función a medir.
+        repeticiones: Cantidad de llamadas.
+
+    Returns:
+        Los microsegundos promedio por llamada.
+    """
+    inicio = time.perf_counter()
+    for _ in range(repeticiones):
+        funcion()
+    return (time.perf_counter() - inicio) / repeticiones * 1e6
+
+
+def _sin_historial(jugadas: int) -> HyperCat:
+    """
+    Crea una partida en curso y descarta su historial de jugadas.
+
+    Args:
+        jugadas: Cantidad máxima de jugadas a realizar.
+
+    Returns:
+        La partida sin historial (ya no puede deshacer).
+    """
+    juego = partida_en_curso(jugadas)
+    juego.historial.clear()
+    return juego
+
+
+def main():
+    """Imprime la memoria por partida y el costo de copiarlas."""
+    en_curso = partida_en_curso(20)
+
+    casos: list[tuple[str, Callable[[], BaseGato]]] = [
+        ("Gato", Gato),
+        ("GatoBitboard", GatoBitboard),
+        ("HyperCat nueva", HyperCat),
+        ("HyperCat con 20 jugadas", lambda: partida_en_curso(20)),
+        ("HyperCat con 20 jugadas, sin historial", lambda: _sin_historial(20)),
+        ("clone() de HyperCat con 20 jugadas", en_curso.clone),
+    ]
+
+    print(f"{'Partida':<42}{'Bytes':>10}")
+    for nombre, fabrica in casos:
+        print(f"{nombre:<42}{bytes_por_partida(fabrica):>10.0f}")
+
+    print()
+    print(f"{'Copia de HyperCat con 20 jugadas':<42}{'µs':>10}")
+    print(f"{'clone()':<42}{microsegundos(en_curso.clone, 10_000):>10.2f}")
+    print(
+        f"{'copy.deepcopy()':<42}{microsegundos(lambda: copy.deepcopy(en_curso), 200):>10.2f}"
+    )
+
+
+if __name__ == "__main__":
+    main()
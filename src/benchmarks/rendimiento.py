@@ -0,0 +1,578 @@
+"""Script que mide el rendimiento de los caminos críticos del juego.
+
+Se ejecuta con ``python -m src.benchmarks.rendimiento``. Cada caso prepara sus
+datos con una semilla fija, de modo que todas las corridas hacen exactamente el
+mismo trabajo, y se repite varias veces quedándose con la más rápida. Los
+resultados (operaciones por segundo) se escriben en JSON y se comparan con una
+línea base guardada; si algún caso es más lento que la línea base por encima de
+la tolerancia, o no figura en ella, el script termina con código 1.
+
+Ejemplos::
+
+    python -m src.benchmarks.rendimiento --salida resultados.json
+    python -m src.benchmarks.rendimiento --guardar-linea-base
+    python -m src.benchmarks.rendimiento --casos socket_json --guardar-linea-base
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import platform
+import random
+import socket
+import statistics
+import struct
+import sys
+import time
+from collections.abc import Callable
+from functools import partial
+from pathlib import Path
+from typing import NamedTuple, override
+
+from src.benchmarks.memoria import partida_en_curso
+from src.core import BaseGato, Gato, HyperCat
+from src.network import BaseSocket, MessageSocket, TypeStatus
+from src.ui.cli import print_gato
+
+SEMILLA: int = 2024
+"""Semilla de todos los datos aleatorios de los casos."""
+
+LINEA_BASE: Path = Path(__file__).with_name("linea_base.json")
+"""Ruta por defecto de la línea base."""
+
+_VERSION_FORMATO: int = 1
+
+Lote = Callable[[], object]
+"""Función sin argumentos que ejecuta un lote de operaciones."""
+
+
+class Caso(NamedTuple):
+    """
+    Caso de medición.
+
+    Attributes:
+        nombre: Identificador del caso en el JSON de resultados.
+        unidad: Qué cuenta como una operación (jugadas, partidas, ...).
+        preparar: Función que crea los datos y devuelve el lote a medir junto
+            con la cantidad de operaciones que realiza. Recibe una pila donde
+            registra los recursos (sockets, por ejemplo) a cerrar tras medir.
+    """
+
+    nombre: str
+    unidad: str
+    preparar: Callable[[contextlib.ExitStack], tuple[Lote, int]]
+
+
+class _ExtremoLocal(BaseSocket):
+    """Extremo de un par de sockets conectados localmente, sin servidor."""
+
+    def __init__(self, conn: socket.socket) -> None:
+        """
+        Envuelve un socket ya conectado.
+
+        Args:
+            conn: Uno de los sockets devueltos por socket.socketpair().
+        """
+        self.conn = conn
+
+    @override
+    def close(self):
+        """Cierra el socket."""
+        if self.conn:
+            self.conn.close()
+            self.conn = None
+
+
+def _par_local(recursos: contextlib.ExitStack) -> tuple[_ExtremoLocal, _ExtremoLocal]:
+    """
+    Crea un par de extremos conectados con socket.socketpair().
+
+    Args:
+        recursos: Pila donde se registra el cierre de ambos extremos.
+
+    Returns:
+        Los dos extremos del par.
+    """
+    izquierdo, derecho = (_ExtremoLocal(s) for s in socket.socketpair())
+    recursos.callback(derecho.close)
+    recursos.callback(izquierdo.close)
+    return izquierdo, derecho
+
+
+def _jugadas_gato(partidas: int) -> list[list[tuple[int, int]]]:
+    """
+    Genera partidas completas de Gato con jugadas aleatorias reproducibles.
+
+    Args:
+        partidas: Cantidad de partidas a generar.
+
+    Returns:
+        Las jugadas (fila, columna) de cada partida, hasta que termina.
+    """
+    generador = random.Random(SEMILLA)
+    secuencias = []
+    for _ in range(partidas):
+        juego = Gato()
+        secuencia = []
+        while not juego.terminado():
+            fila, columna = generador.choice(juego.movimientos_legales())
+            juego.jugar(fila, columna)
+            secuencia.append((fila, columna))
+        secuencias.append(secuencia)
+    return secuencias
+
+
+def _jugadas_hyper_cat(partidas: int) -> list[list[tuple[int, int, int, int]]]:
+    """
+    Genera partidas completas de HyperCat con jugadas aleatorias reproducibles.
+
+    Args:
+        partidas: Cantidad de partidas a generar.
+
+    Returns:
+        Los argumentos (subfila, subcolumna, fila, columna) de jugar() de cada
+        partida, hasta que termina.
+    """
+    secuencias = []
+    for i in range(partidas):
+        juego = partida_en_curso(10_000, SEMILLA + i)
+        secuencias.append(
+            [(r.subfila, r.subcolumna, r.fila, r.columna) for r in juego.historial]
+        )
+    return secuencias
+
+
+def _preparar_gato_jugar(recursos: contextlib.ExitStack) -> tuple[Lote, int]:
+    """
+    Prepara el caso de Gato.jugar() sobre partidas completas.
+
+    Args:
+        recursos: Pila de recursos a cerrar; este caso no abre ninguno.
+
+    Returns:
+        El lote y la cantidad de jugadas que realiza.
+    """
+    secuencias = _jugadas_gato(2000)
+    repeticiones = 10
+
+    def lote():
+        for _ in range(repeticiones):
+            for secuencia in secuencias:
+                juego = Gato()
+                for fila, columna in secuencia:
+                    juego.jugar(fila, columna)
+
+    return lote, sum(map(len, secuencias)) * repeticiones
+
+
+def _preparar_hyper_cat_jugar(recursos: contextlib.ExitStack) -> tuple[Lote, int]:
+    """
+    Prepara el caso de HyperCat.jugar() sobre partidas completas.
+
+    Args:
+        recursos: Pila de recursos a cerrar; este caso no abre ninguno.
+
+    Returns:
+        El lote y la cantidad de jugadas que realiza.
+    """
+    secuencias = _jugadas_hyper_cat(200)
+
+    def lote():
+        for secuencia in secuencias:
+            juego = HyperCat()
+            for subfila, subcolumna, fila, columna in secuencia:
+                juego.jugar(subfila, subcolumna, fila, columna)
+
+    return lote, sum(map(len, secuencias))
+
+
+def _preparar_validar_victoria(recursos: contextlib.ExitStack) -> tuple[Lote, int]:
+    """
+    Prepara el caso de validar_victoria() sobre partidas y sub-tableros.
+
+    Args:
+        recursos: Pila de recursos a cerrar; este caso no abre ninguno.
+
+    Returns:
+        El lote y la cantidad de llamadas que realiza.
+    """
+    juegos: list[BaseGato] = []
+    for i in range(100):
+        juego = partida_en_curso(30, SEMILLA + i)
+        juegos.append(juego)
+        juegos.extend(gato for fila in juego.tablero for gato in fila)
+    repeticiones = 1000
+
+    def lote():
+        for _ in range(repeticiones):
+            for juego in juegos:
+                juego.validar_victoria()
+
+    return lote, len(juegos) * repeticiones
+
+
+def _preparar_partidas_aleatorias(recursos: contextlib.ExitStack) -> tuple[Lote, int]:
+    """
+    Prepara el caso de partidas aleatorias completas de HyperCat.
+
+    Cada partida elige sus jugadas entre movimientos_legales() y las juega.
+
+    Args:
+        recursos: Pila de recursos a cerrar; este caso no abre ninguno.
+
+    Returns:
+        El lote y la cantidad de partidas que juega.
+    """
+    partidas = 100
+
+    def lote():
+        for i in range(partidas):
+            partida_en_curso(10_000, SEMILLA + i)
+
+    return lote, partidas
+
+
+def _preparar_socket_json(recursos: contextlib.ExitStack) -> tuple[Lote, int]:
+    """
+    Prepara el caso de ida y vuelta de _send_json()/_recv_json() por loopback.
+
+    Usa un par de sockets conectados del sistema operativo; cada operación
+    es un mensaje de MessageSocket de ida y su respuesta de vuelta.
+
+    Args:
+        recursos: Pila donde se registra el par de sockets para cerrarlo.
+
+    Returns:
+        El lote y la cantidad de idas y vueltas que realiza.
+    """
+    izquierdo, derecho = _par_local(recursos)
+    mensaje = MessageSocket.create_message(
+        {"subfila": 1, "subcolumna": 2, "fila": 0, "columna": 2},
+        TypeStatus.ENVIO_DATOS,
+    )
+    respuesta = MessageSocket.create_message("", TypeStatus.SUCCESS)
+    idas_y_vueltas = 2000
+
+    def lote():
+        for _ in range(idas_y_vueltas):
+            izquierdo._send_json(mensaje)
+            derecho._recv_json()
+            derecho._send_json(respuesta)
+            izquierdo._recv_json()
+
+    return lote, idas_y_vueltas
+
+
+def _preparar_socket_ventana(recursos: contextlib.ExitStack) -> tuple[Lote, int]:
+    """
+    Prepara el caso de send_data_pipelined() por loopback con ventanas de 50.
+
+    Cada ventana son 50 mensajes enviados sin esperar, que el otro extremo
+    recibe y confirma antes de que flush_pipeline() recoja las confirmaciones.
+    Por loopback no hay latencia que ocultar, así que mide el costo por mensaje
+    de numerar y emparejar confirmaciones.
+
+    Args:
+        recursos: Pila donde se registra el par de sockets para cerrarlo.
+
+    Returns:
+        El lote y la cantidad de mensajes confirmados.
+    """
+    izquierdo, derecho = _par_local(recursos)
+    jugada = {"subfila": 1, "subcolumna": 2, "fila": 0, "columna": 2}
+    izquierdo.ventana = por_ventana = 50
+    ventanas = 40
+
+    def lote():
+        for _ in range(ventanas):
+            for _ in range(por_ventana):
+                izquierdo.send_data_pipelined(jugada)
+            for _ in range(por_ventana):
+                derecho.receive_data()
+                derecho.respond_success()
+            izquierdo.flush_pipeline()
+
+    return lote, ventanas * por_ventana
+
+
+def _preparar_socket_rafaga(recursos: contextlib.ExitStack) -> tuple[Lote, int]:
+    """
+    Prepara el caso de recibir por loopback ráfagas de jugadas ya enviadas.
+
+    Cada ráfaga son 200 mensajes de MessageSocket enviados con un solo
+    sendall(), como el historial que recibe un espectador al llegar, y se
+    leen con _receive_message().
+
+    Args:
+        recursos: Pila donde se registra el par de sockets para cerrarlo.
+
+    Returns:
+        El lote y la cantidad de mensajes que recibe.
+    """
+    izquierdo, derecho = _par_local(recursos)
+    payload = MessageSocket.encode({"fila": 4, "columna": 7}, TypeStatus.JUGADA, False)
+    por_rafaga = 200
+    rafaga = (struct.pack("!I", len(payload)) + payload) * por_rafaga
+    rafagas = 50
+
+    def lote():
+        for _ in range(rafagas):
+            izquierdo.conn.sendall(rafaga)
+            for _ in range(por_rafaga):
+                derecho._receive_message()
+
+    return lote, rafagas * por_rafaga
+
+
+def _preparar_mensaje(
+    binario: bool, recursos: contextlib.ExitStack
+) -> tuple[Lote, int]:
+    """
+    Prepara el caso de codificar y decodificar una jugada con MessageSocket.
+
+    Args:
+        binario: True para el formato binario, False para JSON.
+        recursos: Pila de recursos a cerrar; este caso no abre ninguno.
+
+    Returns:
+        El lote y la cantidad de jugadas que codifica y decodifica.
+    """
+    jugada = {"fila": 4, "columna": 7}
+    mensajes = 20_000
+
+    def lote():
+        for _ in range(mensajes):
+            MessageSocket.decode(
+                MessageSocket.encode(jugada, TypeStatus.JUGADA, binario)
+            )
+
+    return lote, mensajes
+
+
+def _preparar_print_gato(recursos: contextlib.ExitStack) -> tuple[Lote, int]:
+    """
+    Prepara el caso de print_gato() sin consola, sobre un buffer en memoria.
+
+    Args:
+        recursos: Pila de recursos a cerrar; este caso no abre ninguno.
+
+    Returns:
+        El lote y la cantidad de tableros que imprime.
+    """
+    juegos: list[BaseGato] = [partida_en_curso(30, SEMILLA + i) for i in range(20)]
+    juegos += [gato for fila in juegos[0].tablero for gato in fila]
+    repeticiones = 50
+
+    def lote():
+        with contextlib.redirect_stdout(io.StringIO()):
+            for _ in range(repeticiones):
+                for juego in juegos:
+                    print_gato(juego)
+
+    return lote, len(juegos) * repeticiones
+
+
+CASOS: tuple[Caso, ...] = (
+    Caso("gato_jugar", "jugadas", _preparar_gato_jugar),
+    Caso("hyper_cat_jugar", "jugadas", _preparar_hyper_cat_jugar),
+    Caso("validar_victoria", "llamadas", _preparar_validar_victoria),
+    Caso("partidas_aleatorias", "partidas", _preparar_partidas_aleatorias),
+    Caso("socket_json", "idas y vueltas", _preparar_socket_json),
+    Caso("socket_ventana", "mensajes", _preparar_socket_ventana),
+    Caso("socket_rafaga", "mensajes", _preparar_socket_rafaga),
+    Caso("mensaje_json", "jugadas", partial(_preparar_mensaje, False)),
+    Caso("mensaje_binario", "jugadas", partial(_preparar_mensaje, True)),
+    Caso("print_gato", "tableros", _preparar_print_gato),
+)
+"""Casos medidos por defecto, en orden."""
+
+
+def medir(caso: Caso, repeticiones: int = 5) -> dict[str, object]:
+    """
+    Mide un caso repitiendo su lote varias veces.
+
+    Args:
+        caso: El caso a medir.
+        repeticiones: Cantidad de veces que se ejecuta el lote.
+
+    Returns:
+        Diccionario con la unidad, las operaciones por lote y las operaciones
+        por segundo de la repetición más rápida y de la mediana.
+    """
+    with contextlib.ExitStack() as recursos:
+        lote, operaciones = caso.preparar(recursos)
+        lote()  # Calentamiento: cachés, tablas y asignaciones iniciales
+
+        tiempos = []
+        for _ in range(repeticiones):
+            inicio = time.perf_counter()
+            lote()
+            tiempos.append(time.perf_counter() - inicio)
+
+    return {
+        "unidad": caso.unidad,
+        "operaciones": operaciones,
+        "por_segundo": operaciones / min(tiempos),
+        "por_segundo_mediana": operaciones / statistics.median(tiempos),
+    }
+
+
+def ejecutar(
+    casos: tuple[Caso, ...] = CASOS, repeticiones: int = 5
+) -> dict[str, object]:
+    """
+    Mide todos los casos.
+
+    Args:
+        casos: Los casos a medir.
+        repeticiones: Cantidad de repeticiones de cada caso.
+
+    Returns:
+        Los resultados en el formato del JSON de salida.
+    """
+    return {
+        "version": _VERSION_FORMATO,
+        "python": platform.python_version(),
+        "plataforma": platform.platform(),
+        "semilla": SEMILLA,
+        "repeticiones": repeticiones,
+        "casos": {caso.nombre: medir(caso, repeticiones) for caso in casos},
+    }
+
+
+def comparar(
+    resultados: dict[str, object], linea_base: dict[str, object], tolerancia: float
+) -> list[str]:
+    """
+    Compara los resultados con una línea base.
+
+    Args:
+        resultados: Los resultados de ejecutar().
+        linea_base: Resultados guardados previamente.
+        tolerancia: Fracción de caída aceptada, por ejemplo 0.25 para un 25 %.
+
+    Returns:
+        Los nombres de los casos que rinden menos que la línea base por encima
+        de la tolerancia o que no figuran en ella, ya que un caso sin línea
+        base no está protegido contra regresiones.
+    """
+    regresiones = []
+    base = linea_base["casos"]
+    for nombre, medicion in resultados["casos"].items():
+        if nombre not in base:
+            regresiones.append(nombre)
+        elif medicion["por_segundo"] < base[nombre]["por_segundo"] * (1 - tolerancia):
+            regresiones.append(nombre)
+    return regresiones
+
+
+def _imprimir(
+    resultados: dict[str, object],
+    linea_base: dict[str, object] | None,
+    regresiones: list[str],
+) -> None:
+    """
+    Imprime una tabla con los resultados y su variación respecto a la base.
+
+    Args:
+        resultados: Los resultados de ejecutar().
+        linea_base: La línea base, o None si no hay.
+        regresiones: Los casos marcados como regresión.
+    """
+    base = linea_base["casos"] if linea_base else {}
+    print(f"{'Caso':<22}{'Operaciones/s':>16}{'Base':>16}{'Cambio':>10}  Unidad")
+    for nombre, medicion in resultados["casos"].items():
+        actual = medicion["por_segundo"]
+        if nombre in base:
+            anterior = base[nombre]["por_segundo"]
+            columnas = f"{anterior:>16,.0f}{(actual / anterior - 1) * 100:>+9.1f}%"
+        else:
+            columnas = f"{'-':>16}{'-':>10}"
+        if nombre not in regresiones:
+            marca = ""
+        elif nombre in base:
+            marca = "  REGRESIÓN"
+        else:
+            marca = "  SIN LÍNEA BASE"
+        print(f"{nombre:<22}{actual:>16,.0f}{columnas}  {medicion['unidad']}{marca}")
+
+
+def main(argumentos: list[str] | None = None) -> int:
+    """
+    Ejecuta las mediciones desde la línea de comandos.
+
+    Args:
+        argumentos: Argumentos de la línea de comandos, por defecto sys.argv.
+
+    Returns:
+        0 si no hubo regresiones, 1 si alguna medición cayó bajo la tolerancia
+        o no tiene línea base.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--salida", type=Path, help="archivo JSON de resultados")
+    parser.add_argument(
+        "--linea-base",
+        type=Path,
+        default=LINEA_BASE,
+        help=f"archivo JSON con la línea base (por defecto {LINEA_BASE.name})",
+    )
+    parser.add_argument(
+        "--guardar-linea-base",
+        action="store_true",
+        help=(
+            "guarda los resultados de esta corrida en la línea base; con --casos"
+            " solo reemplaza esos casos"
+        ),
+    )
+    parser.add_argument(
+        "--tolerancia",
+        type=float,
+        default=0.25,
+        help="caída aceptada respecto a la línea base (por defecto 0.25)",
+    )
+    parser.add_argument("--repeticiones", type=int, default=5)
+    parser.add_argument(
+        "--casos", nargs="+", choices=[caso.nombre for caso in CASOS], metavar="CASO"
+    )
+    opciones = parser.parse_args(argumentos)
+
+    casos = tuple(c for c in CASOS if not opciones.casos or c.nombre in opciones.casos)
+    resultados = ejecutar(casos, opciones.repeticiones)
+    texto = json.dumps(resultados, indent=2, ensure_ascii=False) + "\n"
+    if opciones.salida:
+        opciones.salida.write_text(texto, encoding="utf-8")
+
+    if opciones.guardar_linea_base:
+        if opciones.casos and opciones.linea_base.exists():
+            anterior = json.loads(opciones.linea_base.read_text(encoding="utf-8"))
+            casos_guardados = {**anterior["casos"], **resultados["casos"]}
+            texto = json.dumps(
+                {**resultados, "casos": casos_guardados}, indent=2, ensure_ascii=False
+            )
+            texto += "\n"
+        opciones.linea_base.write_text(texto, encoding="utf-8")
+        _imprimir(resultados, None, [])
+        print(f"\nLínea base guardada en {opciones.linea_base}")
+        return 0
+
+    linea_base = None
+    if opciones.linea_base.exists():
+        linea_base = json.loads(opciones.linea_base.read_text(encoding="utf-8"))
+    regresiones = (
+        comparar(resultados, linea_base, opciones.tolerancia) if linea_base else []
+    )
+    _imprimir(resultados, linea_base, regresiones)
+
+    if regresiones:
+        print(
+            f"\n{len(regresiones)} caso(s) sin línea base o más lentos que ella "
+            f"por más de {opciones.tolerancia:.0%}: {', '.join(regresiones)}",
+            file=sys.stderr,
+        )
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
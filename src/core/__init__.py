@@ -1,6 +1,10 @@
 """Paquete con la lógica principal del juego."""
 
 from .base_gato import BaseGato, Tablero, Turno
+from .estado_hyper_cat import CUALQUIERA, EstadoHyperCat
 from .exceptions_custom import *
 from .gato import Gato
+from .gato_bitboard import GatoBitboard
+from .gato_nxn import GatoNxN
 from .hyper_cat import HyperCat
+from .hyper_cat_recursivo import HyperCatRecursivo
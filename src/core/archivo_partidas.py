@@ -0,0 +1,289 @@
+"""Módulo con el formato binario de archivos de partidas de HyperCat.
+
+Un archivo de partidas es de solo anexado: una cabecera de 8 bytes
+(``b"HCGR"``, versión uint16 y 2 bytes reservados) seguida de un registro por
+partida:
+
+* 1 byte 0xFF que marca el inicio del registro.
+* 1 byte con el resultado: 0 en curso, 1 victoria de X, 2 victoria de O,
+  3 empate.
+* 2 bytes con la cantidad de jugadas, 7 bits en cada uno (máximo 16383).
+* 1 byte por jugada con la casilla global ``fila * 9 + columna`` [0-80].
+
+Ningún byte de un registro salvo el marcador vale 0xFF, así que un lector puede
+empezar en cualquier posición del archivo y sincronizarse con el siguiente
+marcador. Esto permite repartir un archivo grande en rangos de bytes entre
+varios procesos, cada uno leyendo solo los registros que empiezan en su rango.
+"""
+
+import mmap
+import struct
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+from typing import BinaryIO, NamedTuple
+
+from src.core.hyper_cat import HyperCat
+from src.enums import EstadoCasilla, Resultado
+
+_MAGIA: bytes = b"HCGR"
+_VERSION: int = 1
+_CABECERA: bytes = struct.pack("<4sHH", _MAGIA, _VERSION, 0)
+_MARCADOR: int = 0xFF
+_MAXIMO_JUGADAS: int = (1 << 14) - 1
+
+_RESULTADOS: tuple[Resultado, ...] = (
+    Resultado.EN_CURSO,
+    Resultado.VICTORIA_X,
+    Resultado.VICTORIA_O,
+    Resultado.EMPATE,
+)
+_CODIGOS_RESULTADO: dict[Resultado, int] = {r: i for i, r in enumerate(_RESULTADOS)}
+
+
+class RegistroPartida(NamedTuple):
+    """
+    Partida leída de un archivo de partidas.
+
+    Attributes:
+        resultado: El resultado guardado de la partida.
+        movimientos: Una casilla global ``fila * 9 + columna`` por jugada.
+    """
+
+    resultado: Resultado
+    movimientos: bytes
+
+    def coordenadas(self) -> list[tuple[int, int]]:
+        """
+        Convierte las jugadas en coordenadas globales.
+
+        Returns:
+            Lista de (fila, columna) [0-8], en orden.
+        """
+        return [divmod(casilla, 9) for casilla in self.movimientos]
+
+    def reproducir(self, clase: type[HyperCat] = HyperCat) -> HyperCat:
+        """
+        Reconstruye la partida jugando sus movimientos desde el inicio.
+
+        Args:
+            clase: La clase de HyperCat a instanciar, por defecto HyperCat.
+
+        Returns:
+            La partida tras la última jugada.
+
+        Raises:
+            ReproduccionError: Si algún movimiento guardado es ilegal.
+        """
+        return clase.desde_movimientos(self.coordenadas())
+
+
+class EscritorPartidas:
+    """
+    Escritor que anexa partidas al final de un archivo de partidas.
+
+    Si el archivo no existe o está vacío escribe la cabecera. Puede usarse como
+    context manager para cerrar el archivo al terminar.
+
+    Attributes:
+        ruta: La ruta del archivo.
+        escritas: Partidas anexadas por este escritor.
+    """
+
+    ruta: Path
+    escritas: int
+    _archivo: BinaryIO
+
+    def __init__(self, ruta: str | Path) -> None:
+        """
+        Abre el archivo para anexar partidas.
+
+        Args:
+            ruta: La ruta del archivo de partidas.
+
+        Raises:
+            ValueError: Si el archivo existe pero no es un archivo de partidas.
+        """
+        self.ruta = Path(ruta)
+        self.escritas = 0
+        self._archivo = open(self.ruta, "ab")
+        if self._archivo.tell() == 0:
+            self._archivo.write(_CABECERA)
+        else:
+            with open(self.ruta, "rb") as archivo:
+                if archivo.read(len(_CABECERA)) != _CABECERA:
+                    self._archivo.close()
+                    raise ValueError(f"{self.ruta} no es un archivo de partidas.")
+
+    def escribir(
+        self, movimientos: Iterable[tuple[int, int]], resultado: Resultado
+    ) -> None:
+        """
+        Anexa una partida dada por sus jugadas en coordenadas globales.
+
+        Args:
+            movimientos: Las jugadas (fila, columna) [0-8], en orden.
+            resultado: El resultado de la partida.
+
+        Raises:
+            ValueError: Si alguna jugada está fuera del tablero o hay demasiadas.
+        """
+        casillas = bytearray()
+        for fila, columna in movimientos:
+            if not (0 <= fila < 9 and 0 <= columna < 9):
+                raise ValueError("Las jugadas deben estar en el tablero de 9x9.")
+            casillas.append(fila * 9 + columna)
+        if len(casillas) > _MAXIMO_JUGADAS:
+            raise ValueError(f"Una partida admite hasta {_MAXIMO_JUGADAS} jugadas.")
+
+        n = len(casillas)
+        self._archivo.write(
+            bytes((_MARCADOR, _CODIGOS_RESULTADO[resultado], n >> 7, n & 0x7F))
+            + casillas
+        )
+        self.escritas += 1
+
+    def escribir_partida(self, juego: HyperCat) -> None:
+        """
+        Anexa una partida a partir de su historial de jugadas.
+
+        El formato guarda casillas de un tablero de 9x9 y se reproduce desde la
+        posición inicial con turno de X, así que solo admite esas partidas. El
+        historial se reproduce antes de escribirlo para comprobar que lleva a la
+        posición actual de la partida.
+
+        Args:
+            juego: La partida, jugada desde la posición inicial.
+
+        Raises:
+            ValueError: Si la partida no es de sub-tableros de 3x3 con tres en
+                línea, su historial no reproduce su posición o no empezó con
+                turno de X.
+        """
+        if juego.tamano != 3 or juego.en_linea != 3:
+            raise ValueError("Solo se admiten partidas de HyperCat de 3x3.")
+        movimientos = [
+            (r.fila * 3 + r.subfila, r.columna * 3 + r.subcolumna)
+            for r in juego.historial
+        ]
+        # El turno alterna en cada jugada, incluso en la última
+        turno_inicial = juego.turno
+        if len(movimientos) % 2:
+            turno_inicial = (
+                EstadoCasilla.O if turno_inicial is EstadoCasilla.X else EstadoCasilla.X
+            )
+        reproduccion = HyperCat(turno_inicial)
+        if (
+            reproduccion.aplicar_movimientos(movimientos).aplicadas != len(movimientos)
+            or reproduccion.hash_zobrist != juego.hash_zobrist
+            or reproduccion.resultado is not juego.resultado
+        ):
+            raise ValueError(
+                "El historial de la partida no reproduce su posición; "
+                "¿se descartó el historial?"
+            )
+        if turno_inicial is not EstadoCasilla.X:
+            raise ValueError("Solo se admiten partidas que empiezan con X.")
+        self.escribir(movimientos, juego.resultado)
+
+    def cerrar(self) -> None:
+        """Vuelca los datos pendientes y cierra el archivo."""
+        self._archivo.close()
+
+    def __enter__(self):
+        """
+        Método de entrada para usar EscritorPartidas como context manager.
+
+        Returns:
+            La instancia del escritor.
+        """
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """
+        Método de salida para usar EscritorPartidas como context manager.
+
+        Cierra el archivo al salir del contexto.
+
+        Args:
+            exc_type: Tipo de excepción si ocurrió una.
+            exc_value: Valor de la excepción si ocurrió una.
+            traceback: Traceback de la excepción si ocurrió una.
+        """
+        self.cerrar()
+
+
+def leer_partidas(
+    ruta: str | Path, inicio: int = 0, fin: int | None = None
+) -> Iterator[RegistroPartida]:
+    """
+    Recorre las partidas de un archivo sin cargarlo en memoria.
+
+    El archivo se mapea con mmap y las partidas se generan de a una. Si se
+    indica un rango, solo se generan los registros cuyo marcador está en
+    ``[inicio, fin)``; rangos contiguos producen cada partida exactamente una vez.
+
+    Args:
+        ruta: La ruta del archivo de partidas.
+        inicio: Byte desde el que buscar el primer registro.
+        fin: Byte hasta el que pueden empezar los registros, por defecto el final.
+
+    Yields:
+        Cada partida del rango, en orden.
+
+    Raises:
+        ValueError: Si el archivo no es un archivo de partidas o tiene un
+            registro corrupto.
+    """
+    with open(ruta, "rb") as archivo:
+        if archivo.read(len(_CABECERA)) != _CABECERA:
+            raise ValueError(f"{ruta} no es un archivo de partidas.")
+        tamano = archivo.seek(0, 2)
+        if tamano == len(_CABECERA):
+            return
+        datos = mmap.mmap(archivo.fileno(), 0, access=mmap.ACCESS_READ)
+
+    with datos:
+        fin = tamano if fin is None else min(fin, tamano)
+        posicion = datos.find(bytes((_MARCADOR,)), max(inicio, len(_CABECERA)))
+        while 0 <= posicion < fin:
+            if posicion + 4 > tamano:
+                raise ValueError(f"Registro incompleto en el byte {posicion}.")
+            codigo, alto, bajo = datos[posicion + 1 : posicion + 4]
+            n = alto << 7 | bajo
+            siguiente = posicion + 4 + n
+            if codigo > 3 or alto > 0x7F or bajo > 0x7F or siguiente > tamano:
+                raise ValueError(f"Registro corrupto en el byte {posicion}.")
+
+            yield RegistroPartida(_RESULTADOS[codigo], datos[posicion + 4 : siguiente])
+
+            if siguiente < tamano and datos[siguiente] != _MARCADOR:
+                raise ValueError(f"Registro corrupto en el byte {siguiente}.")
+            posicion = siguiente if siguiente < tamano else -1
+
+
+def dividir(ruta: str | Path, partes: int) -> list[tuple[int, int]]:
+    """
+    Reparte un archivo de partidas en rangos de bytes de tamaño similar.
+
+    Cada rango se pasa a leer_partidas() en un proceso distinto; juntos
+    recorren todas las partidas del archivo una sola vez.
+
+    Args:
+        ruta: La ruta del archivo de partidas.
+        partes: Cantidad de rangos.
+
+    Returns:
+        Lista de (inicio, fin) contiguos que cubren el archivo.
+
+    Raises:
+        ValueError: Si la cantidad de partes no es positiva.
+    """
+    if partes <= 0:
+        raise ValueError("La cantidad de partes debe ser positiva.")
+
+    tamano = Path(ruta).stat().st_size
+    limites = [
+        len(_CABECERA) + (tamano - len(_CABECERA)) * i // partes
+        for i in range(partes + 1)
+    ]
+    return list(zip(limites, limites[1:]))
@@ -1,14 +1,46 @@
 """Módulo que contiene la clase base abstracta para el juego de Gato."""
 
 from abc import ABC, abstractmethod
-from typing import Generic, Literal, TypeAlias, TypeVar
+from functools import cache
+from types import MemberDescriptorType
+from typing import Generic, Literal, Self, TypeAlias, TypeVar
 
-from src.enums import EstadoCasilla, Resultado
+from src.core.exceptions_custom import *
+from src.core.lineas import indice_lineas
+from src.enums import EstadoCasilla, EstadoJugada, Resultado
 
 ContenidoCasilla = TypeVar("ContenidoCasilla")
 Tablero: TypeAlias = list[list[ContenidoCasilla]]
 Turno: TypeAlias = Literal[EstadoCasilla.X, EstadoCasilla.O]
 
+_EXCEPCIONES: dict[EstadoJugada, type[GatoError]] = {
+    EstadoJugada.OCUPADA: CasillaOcupadaError,
+    EstadoJugada.FUERA_DE_RANGO: FueraDeRangoError,
+    EstadoJugada.SUBGATO_TERMINADO: SubGatoTerminadoError,
+    EstadoJugada.SUBGATO_NO_ESPECIFICADO: GatoNoEspecificadoError,
+    EstadoJugada.SUBGATO_NO_PERMITIDO: SubGatoNoPermitidoError,
+    EstadoJugada.JUEGO_TERMINADO: JuegoTerminadoError,
+}
+
+
+@cache
+def _campos(clase: type) -> tuple[str, ...]:
+    """
+    Obtiene los nombres de los slots de instancia de una clase y sus bases.
+
+    Args:
+        clase: La clase a inspeccionar.
+
+    Returns:
+        Los nombres de los slots, sin los reemplazados por propiedades.
+    """
+    return tuple(
+        nombre
+        for base in clase.__mro__
+        for nombre in base.__dict__.get("__slots__", ())
+        if isinstance(getattr(clase, nombre, None), MemberDescriptorType)
+    )
+
 
 class BaseGato(ABC, Generic[ContenidoCasilla]):
     """
@@ -17,17 +49,27 @@ class BaseGato(ABC, Generic[ContenidoCasilla]):
     Esta clase define la interfaz común y las propiedades para los juegos de Gato.
     Implementa la lógica base del juego que puede ser extendida por clases derivadas.
 
+    Las clases del juego usan ``__slots__`` para que cada partida ocupe poca
+    memoria; clone() copia una partida sin recorrer su tablero.
+
     Attributes:
         turno: El turno actual del juego (X u O).
         tablero: El tablero de juego representado como una matriz.
-        resultado: El resultado actual del juego.
+        resultado: El resultado actual del juego, actualizado en cada jugada.
         reiniciado: Indica si el juego ha sido reiniciado.
+        tamano: Casillas por lado del tablero, 3 salvo que la clase lo cambie.
+        en_linea: Marcas seguidas necesarias para ganar, 3 salvo que la clase lo
+            cambie.
     """
 
+    __slots__ = ("turno", "resultado", "reiniciado")
+
     turno: Turno
     tablero: Tablero[ContenidoCasilla]
     resultado: Resultado
     reiniciado: bool
+    tamano: int = 3
+    en_linea: int = 3
 
     def __init__(self, turno_inicial: Turno = EstadoCasilla.X) -> None:
         """
@@ -53,6 +95,45 @@ class BaseGato(ABC, Generic[ContenidoCasilla]):
         self.resultado = Resultado.EN_CURSO
         self.reiniciado = True
 
+    def clone(self) -> Self:
+        """
+        Crea una copia independiente del juego copiando sus atributos.
+
+        Las clases cuyo estado incluye objetos mutables deben sobrescribirlo
+        para copiarlos también.
+
+        Returns:
+            Una nueva instancia en la misma posición.
+        """
+        copia = object.__new__(type(self))
+        for campo in _campos(type(self)):
+            setattr(copia, campo, getattr(self, campo))
+        if hasattr(self, "__dict__"):
+            copia.__dict__.update(self.__dict__)
+        return copia
+
+    def __getstate__(self) -> dict[str, object]:
+        """
+        Obtiene el estado del juego para copy y pickle.
+
+        Returns:
+            Diccionario con el valor de cada slot y del __dict__, si existe.
+        """
+        estado = {campo: getattr(self, campo) for campo in _campos(type(self))}
+        if hasattr(self, "__dict__"):
+            estado.update(self.__dict__)
+        return estado
+
+    def __setstate__(self, estado: dict[str, object]) -> None:
+        """
+        Restaura el estado obtenido con __getstate__.
+
+        Args:
+            estado: Diccionario con el valor de cada atributo.
+        """
+        for campo, valor in estado.items():
+            setattr(self, campo, valor)
+
     @abstractmethod
     def _generar_tablero(self) -> None:
         """
@@ -62,18 +143,20 @@ class BaseGato(ABC, Generic[ContenidoCasilla]):
         """
         pass
 
-    def _fuera_de_rango(self, fila: int, columna: int, size: int = 3) -> bool:
+    def _fuera_de_rango(self, fila: int, columna: int, size: int | None = None) -> bool:
         """
         Verifica si una posición está fuera del rango del tablero.
 
         Args:
             fila: El índice de la fila a verificar.
             columna: El índice de la columna a verificar.
-            size: El tamaño del tablero, por defecto es 3.
+            size: El tamaño del tablero, por defecto es tamano.
 
         Returns:
             True si la posición está fuera de rango, False en caso contrario.
         """
+        if size is None:
+            size = self.tamano
         return not (0 <= fila < size and 0 <= columna < size)
 
     def _cambiar_turno(self) -> None:
@@ -103,34 +186,50 @@ class BaseGato(ABC, Generic[ContenidoCasilla]):
 
     def validar_victoria(self) -> Resultado:
         """
-        Valida si hay un ganador o empate en el juego.
+        Obtiene el resultado del juego en O(1).
+
+        El resultado se actualiza de forma incremental en cada jugada (ver
+        _actualizar_resultado), por lo que aquí solo se consulta.
 
         Returns:
             El resultado actual del juego (victoria, empate o en curso).
         """
-        if self.resultado is not Resultado.EN_CURSO:
-            return self.resultado
-
-        lineas = (
-            [
-                # Filas
-                [(i, 0), (i, 1), (i, 2)]
-                for i in range(3)
-            ]
-            + [
-                # Columnas
-                [(0, i), (1, i), (2, i)]
-                for i in range(3)
-            ]
-            + [
-                # Diagonales
-                [(0, 0), (1, 1), (2, 2)],
-                [(0, 2), (1, 1), (2, 0)],
-            ]
-        )
+        return self.resultado
+
+    def _actualizar_resultado(self, fila: int, columna: int) -> None:
+        """
+        Actualiza el resultado tras una jugada en la casilla indicada.
+
+        Solo una línea que pase por la última jugada puede haberse completado,
+        así que basta con revisar esas líneas y, si ninguna gana, el empate.
+
+        Args:
+            fila: El índice de la fila de la última jugada.
+            columna: El índice de la columna de la última jugada.
+        """
+        lineas = indice_lineas(self.tamano, self.en_linea)
+        for linea in lineas.coordenadas_por_casilla[(fila, columna)]:
+            if r := self._linea_ganadora(linea):
+                self.resultado = r
+                return
+
+        if self._validar_empate():
+            self.resultado = Resultado.EMPATE
+
+    def _recalcular_resultado(self) -> Resultado:
+        """
+        Calcula el resultado revisando todas las líneas del tablero.
+
+        Se usa cuando el tablero se modificó sin pasar por jugar(), por ejemplo
+        al reconstruirlo desde otra representación.
+
+        Returns:
+            El resultado actual del juego (victoria, empate o en curso).
+        """
+        self.resultado = Resultado.EN_CURSO
 
         # Validar victoria
-        for linea in lineas:
+        for linea in indice_lineas(self.tamano, self.en_linea).coordenadas:
             if r := self._linea_ganadora(linea):
                 self.resultado = r
                 return r
@@ -138,8 +237,6 @@ class BaseGato(ABC, Generic[ContenidoCasilla]):
         # Validar empate
         if self._validar_empate():
             self.resultado = Resultado.EMPATE
-        else:
-            self.resultado = Resultado.EN_CURSO
 
         return self.resultado
 
@@ -154,6 +251,67 @@ class BaseGato(ABC, Generic[ContenidoCasilla]):
         """
         pass
 
+    @abstractmethod
+    def intentar_jugar(self, fila: int, columna: int) -> EstadoJugada:
+        """
+        Intenta realizar un movimiento sin lanzar excepciones.
+
+        Es la versión de jugar() para bucles intensivos: un movimiento inválido
+        no crea excepciones ni mensajes y deja el juego sin cambios.
+
+        Args:
+            fila: El índice de la fila donde se quiere jugar.
+            columna: El índice de la columna donde se quiere jugar.
+
+        Returns:
+            EstadoJugada.OK si se jugó, o el motivo por el que se rechazó.
+        """
+        pass
+
+    def _excepcion(self, estado: EstadoJugada) -> GatoError:
+        """
+        Crea la excepción que jugar() lanza para un intento rechazado.
+
+        Args:
+            estado: El estado devuelto por intentar_jugar().
+
+        Returns:
+            La excepción correspondiente al estado.
+        """
+        if estado is EstadoJugada.INCONSISTENTE:
+            return EstadoInconsistenteError("No hay un sub-tablero obligatorio.")
+        return _EXCEPCIONES[estado]()
+
+    @abstractmethod
+    def movimientos_legales(self) -> list[tuple[int, int]]:
+        """
+        Obtiene todas las casillas donde el jugador actual puede jugar.
+
+        Las coordenadas son globales: en un tablero compuesto se expresan sobre
+        el tablero completo y no dentro de cada sub-tablero. Nunca lanza excepciones.
+
+        Returns:
+            Lista de tuplas (fila, columna) con los movimientos legales, vacía si
+            el juego terminó.
+        """
+        pass
+
+    @abstractmethod
+    def es_legal(self, fila: int, columna: int) -> bool:
+        """
+        Verifica si el jugador actual puede jugar en una casilla.
+
+        Nunca lanza excepciones, incluso si la posición está fuera del tablero.
+
+        Args:
+            fila: El índice global de la fila.
+            columna: El índice global de la columna.
+
+        Returns:
+            True si el movimiento es legal, False en caso contrario.
+        """
+        pass
+
     @abstractmethod
     def _linea_ganadora(self, coords: list[tuple[int, int]]) -> Resultado | None:
         """Comprueba si una línea específica es ganadora."""
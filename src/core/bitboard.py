@@ -0,0 +1,73 @@
+"""Módulo con las constantes para representar un tablero de Gato como bitboard.
+
+Cada casilla (fila, columna) de un tablero de 3x3 se asocia al bit
+``fila * 3 + columna``, de modo que las casillas de un jugador caben
+en un entero de 9 bits.
+"""
+
+TABLERO_LLENO: int = 0b111_111_111
+"""Máscara con las 9 casillas del tablero ocupadas."""
+
+LINEAS: tuple[int, ...] = (
+    # Filas
+    0b000_000_111,
+    0b000_111_000,
+    0b111_000_000,
+    # Columnas
+    0b001_001_001,
+    0b010_010_010,
+    0b100_100_100,
+    # Diagonales
+    0b100_010_001,
+    0b001_010_100,
+)
+"""Máscaras de las 8 líneas ganadoras del tablero."""
+
+GANADORA: tuple[bool, ...] = tuple(
+    any(mascara & linea == linea for linea in LINEAS)
+    for mascara in range(TABLERO_LLENO + 1)
+)
+"""Tabla indexada por la máscara de un jugador que indica si contiene una línea."""
+
+
+def bit(fila: int, columna: int) -> int:
+    """
+    Obtiene el bit asociado a una casilla del tablero.
+
+    Args:
+        fila: El índice de la fila [0-2].
+        columna: El índice de la columna [0-2].
+
+    Returns:
+        El entero con únicamente el bit de la casilla encendido.
+    """
+    return 1 << (fila * 3 + columna)
+
+
+def mascara_de(coords: list[tuple[int, int]]) -> int:
+    """
+    Convierte una lista de coordenadas en su máscara de bits.
+
+    Args:
+        coords: Lista de tuplas (fila, columna).
+
+    Returns:
+        La máscara con los bits de todas las coordenadas encendidos.
+    """
+    mascara = 0
+    for fila, columna in coords:
+        mascara |= bit(fila, columna)
+    return mascara
+
+
+def lleno(ocupadas: int) -> bool:
+    """
+    Verifica si una máscara de casillas ocupadas cubre todo el tablero.
+
+    Args:
+        ocupadas: La unión de las máscaras de ambos jugadores.
+
+    Returns:
+        True si las 9 casillas están ocupadas, False en caso contrario.
+    """
+    return ocupadas.bit_count() == 9
@@ -0,0 +1,254 @@
+"""Módulo con el formato binario compacto y la notación de texto de HyperCat.
+
+Formato binario (TAMANO_POSICION = 24 bytes, little-endian):
+
+* 9 x uint16: código en base 3 de cada sub-tablero (ver tablas_gato).
+* uint32: resultado de cada sub-tablero en 2 bits (sub-tablero ``s`` en los
+  bits ``2s`` y ``2s + 1``) y el resultado de la partida en los bits 18-19.
+* uint8: bit 0 con el turno (0 para X, 1 para O) y bit 1 con elegir_cualquiera.
+* uint8: sub-tablero [0-8] de gato_a_jugar_despues, o 255 si es None.
+
+Notación de texto, al estilo FEN: los 9 sub-tableros separados por ``/``
+(fila por fila), cada uno con sus casillas fila por fila como ``x``, ``o`` o
+un dígito con la cantidad de casillas vacías seguidas; luego el turno (``x`` u
+``o``) y el sub-tablero obligatorio [0-8] o ``-`` si se puede elegir cualquiera.
+La posición inicial es ``9/9/9/9/9/9/9/9/9 x -``.
+"""
+
+import struct
+
+from src.core.base_gato import Turno
+from src.core.gato import Gato
+from src.core.hyper_cat import HyperCat
+from src.core.tablas_gato import CANTIDAD_TABLEROS, POTENCIAS
+from src.enums import EstadoCasilla, Resultado
+
+TAMANO_POSICION: int = 24
+"""Bytes que ocupa una posición codificada con a_bytes()."""
+
+_FORMATO: struct.Struct = struct.Struct("<9HIBB")
+_SIN_SUB_TABLERO: int = 255
+
+_RESULTADOS: tuple[Resultado, ...] = (
+    Resultado.EN_CURSO,
+    Resultado.VICTORIA_X,
+    Resultado.VICTORIA_O,
+    Resultado.EMPATE,
+)
+_CODIGOS_RESULTADO: dict[Resultado, int] = {r: i for i, r in enumerate(_RESULTADOS)}
+_CASILLAS: tuple[EstadoCasilla, ...] = (
+    EstadoCasilla.VACIA,
+    EstadoCasilla.X,
+    EstadoCasilla.O,
+)
+_TURNOS: tuple[EstadoCasilla, EstadoCasilla] = (EstadoCasilla.X, EstadoCasilla.O)
+_SIMBOLOS: dict[int, str] = {1: "x", 2: "o"}
+
+
+def a_bytes(juego: HyperCat) -> bytes:
+    """
+    Codifica una partida en el formato binario de 24 bytes.
+
+    Args:
+        juego: La partida a codificar.
+
+    Returns:
+        Los bytes de la posición.
+
+    Raises:
+        ValueError: Si la partida no es la variante clásica de 3 x 3.
+    """
+    resultados = _CODIGOS_RESULTADO[juego.resultado] << 18
+    codigos = []
+    for s, gato in enumerate(_sub_tableros(juego)):
+        codigos.append(gato.codigo)
+        resultados |= _CODIGOS_RESULTADO[gato.resultado] << (2 * s)
+
+    banderas = _TURNOS.index(juego.turno) | juego.elegir_cualquiera << 1
+    if juego.gato_a_jugar_despues is None:
+        destino = _SIN_SUB_TABLERO
+    else:
+        fila, columna = juego.gato_a_jugar_despues
+        destino = fila * 3 + columna
+
+    return _FORMATO.pack(*codigos, resultados, banderas, destino)
+
+
+def desde_bytes(datos: bytes, clase: type[HyperCat] = HyperCat) -> HyperCat:
+    """
+    Reconstruye una partida a partir de su formato binario.
+
+    Los resultados guardados se comparan con los calculados a partir de las
+    casillas, de modo que datos corruptos no producen una partida inconsistente.
+
+    Args:
+        datos: Los 24 bytes de la posición.
+        clase: La clase de HyperCat a instanciar, por defecto HyperCat.
+
+    Returns:
+        Una nueva partida, sin historial, en la posición codificada.
+
+    Raises:
+        ValueError: Si los datos no tienen el tamaño correcto o no describen una
+            posición válida.
+    """
+    if len(datos) != TAMANO_POSICION:
+        raise ValueError(
+            f"Una posición ocupa {TAMANO_POSICION} bytes, se recibieron {len(datos)}."
+        )
+
+    *codigos, resultados, banderas, destino = _FORMATO.unpack(datos)
+    if banderas > 0b11 or (destino > 8 and destino != _SIN_SUB_TABLERO):
+        raise ValueError("Turno o sub-tablero obligatorio inválidos.")
+
+    juego = _construir(clase, codigos, _TURNOS[banderas & 1])
+    juego.elegir_cualquiera = bool(banderas & 0b10)
+    juego.gato_a_jugar_despues = (
+        None if destino == _SIN_SUB_TABLERO else divmod(destino, 3)
+    )
+
+    esperados = [_RESULTADOS[resultados >> (2 * s) & 0b11] for s in range(10)]
+    obtenidos = [gato.resultado for gato in _sub_tableros(juego)] + [juego.resultado]
+    if esperados != obtenidos:
+        raise ValueError("Los resultados no coinciden con las casillas.")
+
+    juego.hash_zobrist = juego.calcular_hash_zobrist()
+    return juego
+
+
+def a_notacion(juego: HyperCat) -> str:
+    """
+    Escribe una partida en la notación de texto.
+
+    Args:
+        juego: La partida a escribir.
+
+    Returns:
+        La notación de la posición, por ejemplo ``9/9/9/9/4x4/9/9/9/9 o 4``.
+
+    Raises:
+        ValueError: Si la partida no es la variante clásica de 3 x 3.
+    """
+    sub_tableros = []
+    for gato in _sub_tableros(juego):
+        texto = ""
+        vacias = 0
+        codigo = gato.codigo
+        for _ in range(9):
+            codigo, valor = divmod(codigo, 3)
+            if valor:
+                texto += (str(vacias) if vacias else "") + _SIMBOLOS[valor]
+                vacias = 0
+            else:
+                vacias += 1
+        sub_tableros.append(texto + (str(vacias) if vacias else ""))
+
+    forzado = juego._sub_tablero_forzado()
+    return " ".join(
+        (
+            "/".join(sub_tableros),
+            "x" if juego.turno is EstadoCasilla.X else "o",
+            "-" if forzado == -1 else str(forzado),
+        )
+    )
+
+
+def desde_notacion(texto: str, clase: type[HyperCat] = HyperCat) -> HyperCat:
+    """
+    Reconstruye una partida a partir de su notación de texto.
+
+    Args:
+        texto: La notación de la posición.
+        clase: La clase de HyperCat a instanciar, por defecto HyperCat.
+
+    Returns:
+        Una nueva partida, sin historial, en la posición descrita.
+
+    Raises:
+        ValueError: Si el texto no es una notación válida.
+    """
+    try:
+        casillas, turno, forzado = texto.split()
+    except ValueError:
+        raise ValueError(
+            "La notación debe tener casillas, turno y sub-tablero."
+        ) from None
+
+    sub_tableros = casillas.split("/")
+    if len(sub_tableros) != 9 or turno not in ("x", "o"):
+        raise ValueError("La notación debe tener 9 sub-tableros y turno x u o.")
+    if forzado != "-" and not (len(forzado) == 1 and "0" <= forzado <= "8"):
+        raise ValueError("El sub-tablero obligatorio debe ser 0-8 o '-'.")
+
+    codigos = []
+    for sub_tablero in sub_tableros:
+        codigo = 0
+        i = 0
+        for caracter in sub_tablero:
+            if caracter in "123456789":
+                i += int(caracter)
+            elif caracter in ("x", "o"):
+                if i < 9:
+                    codigo += (1 if caracter == "x" else 2) * POTENCIAS[i]
+                i += 1
+            else:
+                raise ValueError(f"Carácter inválido en la notación: {caracter!r}.")
+        if i != 9:
+            raise ValueError(f"El sub-tablero {sub_tablero!r} no tiene 9 casillas.")
+        codigos.append(codigo)
+
+    juego = _construir(clase, codigos, _TURNOS[turno == "o"])
+    if forzado != "-":
+        juego.elegir_cualquiera = False
+        juego.gato_a_jugar_despues = divmod(int(forzado), 3)
+        if _sub_tableros(juego)[int(forzado)].terminado():
+            raise ValueError("El sub-tablero obligatorio ya terminó.")
+
+    juego.hash_zobrist = juego.calcular_hash_zobrist()
+    return juego
+
+
+def _sub_tableros(juego: HyperCat) -> list[Gato]:
+    """
+    Obtiene los sub-tableros de una partida en orden fila por fila.
+
+    Args:
+        juego: La partida.
+
+    Returns:
+        Lista con los 9 sub-tableros.
+
+    Raises:
+        ValueError: Si la partida no es la variante clásica de 3 x 3.
+    """
+    if juego.tamano != 3 or juego.en_linea != 3:
+        raise ValueError("Solo se codifican partidas con sub-tableros de 3 x 3.")
+    return [gato for fila in juego.tablero for gato in fila]
+
+
+def _construir(clase: type[HyperCat], codigos: list[int], turno: Turno) -> HyperCat:
+    """
+    Crea una partida con las casillas dadas por los códigos de sus sub-tableros.
+
+    Args:
+        clase: La clase de HyperCat a instanciar.
+        codigos: El código en base 3 de cada sub-tablero.
+        turno: El jugador al que le toca mover.
+
+    Returns:
+        La partida, con los resultados recalculados a partir de las casillas.
+
+    Raises:
+        ValueError: Si algún código está fuera de rango.
+    """
+    juego = clase(turno)
+    for gato, codigo in zip(_sub_tableros(juego), codigos):
+        if not 0 <= codigo < CANTIDAD_TABLEROS:
+            raise ValueError(f"Código de sub-tablero fuera de rango: {codigo}.")
+        for i in range(9):
+            codigo, valor = divmod(codigo, 3)
+            if valor:
+                gato._colocar(i // 3, i % 3, _CASILLAS[valor])
+        gato._recalcular_resultado()
+    juego._recalcular_resultado()
+    return juego
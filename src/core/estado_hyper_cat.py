@@ -0,0 +1,311 @@
+"""Módulo con la representación compacta del estado de una partida de HyperCat."""
+
+from src.core import zobrist
+from src.core.bitboard import GANADORA, TABLERO_LLENO
+from src.core.hyper_cat import HyperCat
+from src.enums import EstadoCasilla, Resultado
+
+CUALQUIERA: int = -1
+"""Valor de ``forzado`` cuando el jugador puede elegir cualquier sub-tablero."""
+
+EXPANDIR: tuple[int, ...] = tuple(
+    sum(TABLERO_LLENO << (9 * s) for s in range(9) if macro >> s & 1)
+    for macro in range(TABLERO_LLENO + 1)
+)
+"""Tabla que convierte una máscara de 9 sub-tableros en la máscara de sus 81 casillas."""
+
+_JUGADORES: tuple[EstadoCasilla, EstadoCasilla] = (EstadoCasilla.X, EstadoCasilla.O)
+_VICTORIAS: tuple[Resultado, Resultado] = (Resultado.VICTORIA_X, Resultado.VICTORIA_O)
+
+
+def indice(fila: int, columna: int, subfila: int, subcolumna: int) -> int:
+    """
+    Calcula el índice [0-80] de una casilla dentro del estado compacto.
+
+    Los 9 bits de cada sub-tablero son contiguos: el índice es
+    ``sub_tablero * 9 + casilla``, ambos en orden fila por fila.
+
+    Args:
+        fila: El índice de la fila del sub-tablero en el tablero principal [0-2].
+        columna: El índice de la columna del sub-tablero en el tablero principal [0-2].
+        subfila: El índice de la fila dentro del sub-tablero [0-2].
+        subcolumna: El índice de la columna dentro del sub-tablero [0-2].
+
+    Returns:
+        El índice de la casilla.
+    """
+    return (fila * 3 + columna) * 9 + subfila * 3 + subcolumna
+
+
+def coordenadas(indice: int) -> tuple[int, int]:
+    """
+    Convierte un índice del estado compacto en coordenadas globales del tablero 9x9.
+
+    Args:
+        indice: El índice de la casilla [0-80].
+
+    Returns:
+        Una tupla (fila, columna) en el rango [0-8].
+    """
+    sub, casilla = divmod(indice, 9)
+    return (sub // 3) * 3 + casilla // 3, (sub % 3) * 3 + casilla % 3
+
+
+def indices_de(mascara: int) -> list[int]:
+    """
+    Obtiene los índices de los bits encendidos de una máscara de movimientos.
+
+    Args:
+        mascara: Una máscara de 81 bits, como la de movimientos_legales().
+
+    Returns:
+        Los índices [0-80] encendidos, en orden creciente.
+    """
+    indices = []
+    while mascara:
+        bit = mascara & -mascara
+        indices.append(bit.bit_length() - 1)
+        mascara ^= bit
+    return indices
+
+
+class EstadoHyperCat:
+    """
+    Representación compacta de una partida de HyperCat.
+
+    Guarda cada sub-tablero como dos máscaras de 9 bits y el tablero principal
+    como máscaras de sub-tableros ganados, de modo que generar los movimientos
+    legales y jugar no requieren recorrer casillas. Como los sub-tableros
+    empatados se reinician al instante, ningún sub-tablero queda empatado y
+    basta con las máscaras de ganados para saber cuáles están cerrados.
+
+    Attributes:
+        tableros: 18 máscaras; las casillas de X en el sub-tablero ``s`` están en
+            ``tableros[s]`` y las de O en ``tableros[9 + s]``.
+        ganados_x: Máscara de los sub-tableros ganados por X.
+        ganados_o: Máscara de los sub-tableros ganados por O.
+        vacias: Máscara de 81 bits con las casillas vacías.
+        forzado: Sub-tablero [0-8] donde se debe jugar, o CUALQUIERA.
+        turno: Jugador al que le toca mover (0 para X, 1 para O).
+        resultado: El resultado actual de la partida.
+        hash_zobrist: Hash Zobrist de 64 bits de la posición; coincide con el de
+            la partida de HyperCat equivalente.
+    """
+
+    __slots__ = (
+        "tableros",
+        "ganados_x",
+        "ganados_o",
+        "vacias",
+        "forzado",
+        "turno",
+        "resultado",
+        "hash_zobrist",
+    )
+
+    tableros: list[int]
+    ganados_x: int
+    ganados_o: int
+    vacias: int
+    forzado: int
+    turno: int
+    resultado: Resultado
+    hash_zobrist: int
+
+    def __init__(self) -> None:
+        """Inicializa el estado de una partida nueva, con turno de X."""
+        self.tableros = [0] * 18
+        self.ganados_x = 0
+        self.ganados_o = 0
+        self.vacias = EXPANDIR[TABLERO_LLENO]
+        self.forzado = CUALQUIERA
+        self.turno = 0
+        self.resultado = Resultado.EN_CURSO
+        self.hash_zobrist = zobrist.FORZADO[CUALQUIERA]
+
+    @classmethod
+    def desde_hyper_cat(cls, juego: HyperCat) -> "EstadoHyperCat":
+        """
+        Construye el estado compacto equivalente a una partida de HyperCat.
+
+        Args:
+            juego: La partida a convertir.
+
+        Returns:
+            Un nuevo EstadoHyperCat con la misma posición.
+
+        Raises:
+            ValueError: Si la partida no es la variante clásica de 3 x 3.
+        """
+        if juego.tamano != 3 or juego.en_linea != 3:
+            raise ValueError("Solo se representan partidas con sub-tableros de 3 x 3.")
+        estado = cls()
+        tablero = juego.tablero
+        for s in range(9):
+            gato = tablero[s // 3][s % 3]
+            casillas = gato.tablero
+            for f in range(3):
+                for c in range(3):
+                    casilla = casillas[f][c]
+                    if casilla is EstadoCasilla.X:
+                        estado.tableros[s] |= 1 << (f * 3 + c)
+                    elif casilla is EstadoCasilla.O:
+                        estado.tableros[9 + s] |= 1 << (f * 3 + c)
+            estado.vacias &= ~((estado.tableros[s] | estado.tableros[9 + s]) << (9 * s))
+
+            match gato.validar_victoria():
+                case Resultado.VICTORIA_X:
+                    estado.ganados_x |= 1 << s
+                case Resultado.VICTORIA_O:
+                    estado.ganados_o |= 1 << s
+
+        if not juego.elegir_cualquiera and juego.gato_a_jugar_despues is not None:
+            fila, columna = juego.gato_a_jugar_despues
+            estado.forzado = fila * 3 + columna
+        estado.turno = _JUGADORES.index(juego.turno)
+        estado.resultado = juego.validar_victoria()
+        estado.hash_zobrist = estado.calcular_hash_zobrist()
+        return estado
+
+    def a_hyper_cat(self, clase: type[HyperCat] = HyperCat) -> HyperCat:
+        """
+        Construye una partida de HyperCat equivalente a este estado.
+
+        Args:
+            clase: La clase de HyperCat a instanciar, por defecto HyperCat.
+
+        Returns:
+            Una nueva partida con la misma posición.
+        """
+        juego = clase(_JUGADORES[self.turno])
+        tablero = juego.tablero
+        for s in range(9):
+            gato = tablero[s // 3][s % 3]
+            x, o = self.tableros[s], self.tableros[9 + s]
+            for f in range(3):
+                for c in range(3):
+                    b = 1 << (f * 3 + c)
+                    if x & b:
+                        gato._colocar(f, c, EstadoCasilla.X)
+                    elif o & b:
+                        gato._colocar(f, c, EstadoCasilla.O)
+            gato._recalcular_resultado()
+
+        if self.forzado != CUALQUIERA:
+            juego.elegir_cualquiera = False
+            juego.gato_a_jugar_despues = divmod(self.forzado, 3)
+        juego._recalcular_resultado()
+        juego.hash_zobrist = juego.calcular_hash_zobrist()
+        return juego
+
+    def copiar(self) -> "EstadoHyperCat":
+        """
+        Crea una copia independiente del estado.
+
+        Returns:
+            Un nuevo EstadoHyperCat con la misma posición.
+        """
+        copia = EstadoHyperCat.__new__(EstadoHyperCat)
+        copia.tableros = self.tableros[:]
+        copia.ganados_x = self.ganados_x
+        copia.ganados_o = self.ganados_o
+        copia.vacias = self.vacias
+        copia.forzado = self.forzado
+        copia.turno = self.turno
+        copia.resultado = self.resultado
+        copia.hash_zobrist = self.hash_zobrist
+        return copia
+
+    def calcular_hash_zobrist(self) -> int:
+        """
+        Calcula desde cero el hash Zobrist del estado.
+
+        Returns:
+            El hash de 64 bits de la posición.
+        """
+        hash_zobrist = zobrist.FORZADO[self.forzado]
+        if self.turno == 1:
+            hash_zobrist ^= zobrist.TURNO_O
+        for s in range(9):
+            hash_zobrist ^= zobrist.SUB_TABLEROS[0][s][self.tableros[s]]
+            hash_zobrist ^= zobrist.SUB_TABLEROS[1][s][self.tableros[9 + s]]
+            if self.ganados_x >> s & 1:
+                hash_zobrist ^= zobrist.GANADOS[0][s]
+            elif self.ganados_o >> s & 1:
+                hash_zobrist ^= zobrist.GANADOS[1][s]
+        return hash_zobrist
+
+    def movimientos_legales(self) -> int:
+        """
+        Calcula los movimientos legales de la posición.
+
+        Returns:
+            Una máscara de 81 bits con un bit encendido por cada casilla donde se
+            puede jugar (ver ``indice``), o 0 si la partida terminó.
+        """
+        if self.resultado is not Resultado.EN_CURSO:
+            return 0
+        if self.forzado != CUALQUIERA:
+            return self.vacias & (TABLERO_LLENO << (9 * self.forzado))
+        abiertos = TABLERO_LLENO & ~(self.ganados_x | self.ganados_o)
+        return self.vacias & EXPANDIR[abiertos]
+
+    def jugar(self, indice: int) -> None:
+        """
+        Realiza un movimiento sin validarlo.
+
+        El movimiento debe pertenecer a ``movimientos_legales()``; no se lanzan
+        excepciones, por lo que es el camino rápido para búsquedas y simulaciones.
+        Aplica las mismas reglas que HyperCat.jugar, incluido el reinicio de los
+        sub-tableros que terminan en empate.
+
+        Args:
+            indice: El índice de la casilla [0-80] donde se juega.
+        """
+        s, casilla = divmod(indice, 9)
+        propio = s + 9 * self.turno
+        mascara = self.tableros[propio] | (1 << casilla)
+        self.tableros[propio] = mascara
+        self.vacias &= ~(1 << indice)
+        hash_zobrist = (
+            self.hash_zobrist
+            ^ zobrist.CASILLAS[self.turno][indice]
+            ^ zobrist.FORZADO[self.forzado]
+            ^ zobrist.TURNO_O
+        )
+
+        if GANADORA[mascara]:
+            if self.turno == 0:
+                self.ganados_x |= 1 << s
+                ganados = self.ganados_x
+            else:
+                self.ganados_o |= 1 << s
+                ganados = self.ganados_o
+            hash_zobrist ^= zobrist.GANADOS[self.turno][s]
+            if GANADORA[ganados]:
+                self.resultado = _VICTORIAS[self.turno]
+            elif self.ganados_x | self.ganados_o == TABLERO_LLENO:
+                self.resultado = Resultado.EMPATE
+        elif mascara | self.tableros[s + 9 * (1 - self.turno)] == TABLERO_LLENO:
+            # Si el sub-tablero termina en empate, se reinicia
+            hash_zobrist ^= zobrist.SUB_TABLEROS[0][s][self.tableros[s]]
+            hash_zobrist ^= zobrist.SUB_TABLEROS[1][s][self.tableros[9 + s]]
+            self.tableros[s] = 0
+            self.tableros[9 + s] = 0
+            self.vacias |= TABLERO_LLENO << (9 * s)
+
+        if (self.ganados_x | self.ganados_o) >> casilla & 1:
+            self.forzado = CUALQUIERA
+        else:
+            self.forzado = casilla
+        self.turno ^= 1
+        self.hash_zobrist = hash_zobrist ^ zobrist.FORZADO[self.forzado]
+
+    def terminado(self) -> bool:
+        """
+        Verifica si la partida ha terminado.
+
+        Returns:
+            True si la partida ha terminado, False en caso contrario.
+        """
+        return self.resultado is not Resultado.EN_CURSO
@@ -1,5 +1,7 @@
 """Módulo con las excepciones personalizadas del juego."""
 
+from src.enums import EstadoJugada
+
 
 class GatoError(Exception):
     """
@@ -78,6 +80,14 @@ class CasillaOcupadaError(MovimientoInvalidoError):
         super().__init__("La casilla especificada ya está ocupada por otro jugador.")
 
 
+class SubGatoNoPermitidoError(MovimientoInvalidoError):
+    """Se intenta jugar fuera del sub-tablero obligatorio."""
+
+    def __init__(self):
+        """Inicializa la excepción SubGatoNoPermitidoError."""
+        super().__init__("La casilla no pertenece al sub-tablero donde se debe jugar.")
+
+
 class GatoNoEspecificadoError(GatoError):
     """No se especificó el sub-gato cuando era obligatorio hacerlo."""
 
@@ -86,6 +96,14 @@ class GatoNoEspecificadoError(GatoError):
         super().__init__("No se especificó el sub-gato cuando era obligatorio hacerlo.")
 
 
+class SinJugadasError(GatoError):
+    """Se intenta deshacer una jugada cuando no hay ninguna registrada."""
+
+    def __init__(self):
+        """Inicializa la excepción SinJugadasError."""
+        super().__init__("No hay jugadas para deshacer.")
+
+
 class EstadoInconsistenteError(GatoError):
     """El juego entró en un estado inválido (error interno)."""
 
@@ -96,3 +114,23 @@ class EstadoInconsistenteError(GatoError):
             message: El mensaje de error.
         """
         super().__init__("El juego ha entrado en un estado inconsistente.\n" + message)
+
+
+class ReproduccionError(GatoError):
+    """Una secuencia de jugadas contiene un movimiento ilegal."""
+
+    indice: int
+    estado: EstadoJugada
+
+    def __init__(self, indice: int, estado: EstadoJugada):
+        """Inicializa la excepción ReproduccionError.
+
+        Args:
+            indice: Posición en la secuencia del primer movimiento ilegal.
+            estado: Motivo por el que se rechazó el movimiento.
+        """
+        super().__init__(
+            f"El movimiento {indice} de la secuencia es ilegal ({estado.name})."
+        )
+        self.indice = indice
+        self.estado = estado
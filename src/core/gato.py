@@ -4,7 +4,26 @@ from typing import override
 
 from src.core.base_gato import BaseGato, Tablero
 from src.core.exceptions_custom import *
-from src.enums import EstadoCasilla, Resultado
+from src.core.tablas_gato import POTENCIAS, cargar_tablas
+from src.enums import EstadoCasilla, EstadoJugada, Resultado
+
+_TABLAS = cargar_tablas()
+_RESULTADOS: tuple[Resultado, ...] = (
+    Resultado.EN_CURSO,
+    Resultado.VICTORIA_X,
+    Resultado.VICTORIA_O,
+    Resultado.EMPATE,
+)
+_VALOR_CASILLA: dict[EstadoCasilla, int] = {
+    EstadoCasilla.VACIA: 0,
+    EstadoCasilla.X: 1,
+    EstadoCasilla.O: 2,
+}
+_CASILLAS: tuple[EstadoCasilla, ...] = (
+    EstadoCasilla.VACIA,
+    EstadoCasilla.X,
+    EstadoCasilla.O,
+)
 
 
 class Gato(BaseGato[EstadoCasilla]):
@@ -13,15 +32,49 @@ class Gato(BaseGato[EstadoCasilla]):
 
     Esta clase implementa la lógica del juego de Gato tradicional de 3x3.
     Hereda de BaseGato y especifica EstadoCasilla como tipo de contenido.
+
+    El tablero completo se guarda en un único entero, su código en base 3,
+    que además indexa las tablas precalculadas de tablas_gato. La matriz de
+    EstadoCasilla se reconstruye a pedido en la propiedad tablero.
+
+    Attributes:
+        codigo: Código en base 3 del tablero, índice de las tablas de tablas_gato.
     """
 
+    __slots__ = ("codigo",)
+
+    codigo: int
+
     @override
     def _generar_tablero(self) -> None:
         """Genera un tablero de 3x3 con todas las casillas vacías."""
-        self.tablero: Tablero[EstadoCasilla] = [
-            [EstadoCasilla.VACIA for _ in range(3)] for _ in range(3)
+        self.codigo = 0
+
+    @property
+    def tablero(self) -> Tablero[EstadoCasilla]:
+        """
+        Construye la matriz de 3x3 equivalente al código del tablero.
+
+        Returns:
+            Una nueva matriz con el EstadoCasilla de cada posición.
+        """
+        return [
+            [self._casilla(fila, columna) for columna in range(3)] for fila in range(3)
         ]
 
+    def _casilla(self, fila: int, columna: int) -> EstadoCasilla:
+        """
+        Obtiene el estado de una casilla a partir del código del tablero.
+
+        Args:
+            fila: El índice de la fila [0-2].
+            columna: El índice de la columna [0-2].
+
+        Returns:
+            El EstadoCasilla de la posición.
+        """
+        return _CASILLAS[self.codigo // POTENCIAS[fila * 3 + columna] % 3]
+
     @override
     def jugar(self, fila: int, columna: int):
         """
@@ -36,19 +89,112 @@ class Gato(BaseGato[EstadoCasilla]):
             FueraDeRangoError: Si la posición está fuera del tablero.
             CasillaOcupadaError: Si la casilla ya está ocupada.
         """
+        if (estado := self.intentar_jugar(fila, columna)) is not EstadoJugada.OK:
+            raise self._excepcion(estado)
+
+    @override
+    def intentar_jugar(self, fila: int, columna: int) -> EstadoJugada:
+        """
+        Intenta realizar un movimiento sin lanzar excepciones.
+
+        Args:
+            fila: El índice de la fila donde se quiere jugar [0-2].
+            columna: El índice de la columna donde se quiere jugar [0-2].
+
+        Returns:
+            OK, JUEGO_TERMINADO, FUERA_DE_RANGO u OCUPADA.
+        """
         self.reiniciado = False
 
+        if self.resultado is not Resultado.EN_CURSO:
+            return EstadoJugada.JUEGO_TERMINADO
+
+        if not (0 <= fila < 3 and 0 <= columna < 3):
+            return EstadoJugada.FUERA_DE_RANGO
+
+        casilla = fila * 3 + columna
+        if not _TABLAS.vacias[self.codigo] >> casilla & 1:
+            return EstadoJugada.OCUPADA
+
+        if self.turno is EstadoCasilla.X:
+            self.codigo += POTENCIAS[casilla]
+            self._actualizar_resultado(fila, columna)
+            self.turno = EstadoCasilla.O
+        else:
+            self.codigo += 2 * POTENCIAS[casilla]
+            self._actualizar_resultado(fila, columna)
+            self.turno = EstadoCasilla.X
+        return EstadoJugada.OK
+
+    @override
+    def _actualizar_resultado(self, fila: int, columna: int) -> None:
+        """
+        Actualiza el resultado consultando las tablas precalculadas.
+
+        Args:
+            fila: El índice de la fila de la última jugada [0-2].
+            columna: El índice de la columna de la última jugada [0-2].
+        """
+        self.resultado = _RESULTADOS[_TABLAS.resultado[self.codigo]]
+
+    @override
+    def _recalcular_resultado(self) -> Resultado:
+        """
+        Calcula el resultado del tablero actual consultando las tablas precalculadas.
+
+        Returns:
+            El resultado actual del juego (victoria, empate o en curso).
+        """
+        self.resultado = _RESULTADOS[_TABLAS.resultado[self.codigo]]
+        return self.resultado
+
+    @override
+    def movimientos_legales(self) -> list[tuple[int, int]]:
+        """
+        Obtiene todas las casillas vacías mientras el juego siga en curso.
+
+        Returns:
+            Lista de tuplas (fila, columna) con los movimientos legales.
+        """
         if self.validar_victoria().terminado():
-            raise JuegoTerminadoError()
+            return []
+        vacias = _TABLAS.vacias[self.codigo]
+        return [divmod(i, 3) for i in range(9) if vacias >> i & 1]
 
-        if self._fuera_de_rango(fila, columna):
-            raise FueraDeRangoError()
+    @override
+    def es_legal(self, fila: int, columna: int) -> bool:
+        """
+        Verifica si se puede jugar en una casilla.
 
-        if self.tablero[fila][columna] != EstadoCasilla.VACIA:
-            raise CasillaOcupadaError()
+        Args:
+            fila: El índice de la fila [0-2].
+            columna: El índice de la columna [0-2].
 
-        self.tablero[fila][columna] = self.turno
-        self._cambiar_turno()
+        Returns:
+            True si la casilla está dentro del tablero, vacía y el juego sigue en
+            curso, False en caso contrario.
+        """
+        return (
+            not self._fuera_de_rango(fila, columna)
+            and bool(_TABLAS.vacias[self.codigo] >> (fila * 3 + columna) & 1)
+            and not self.validar_victoria().terminado()
+        )
+
+    def _colocar(self, fila: int, columna: int, estado: EstadoCasilla) -> None:
+        """
+        Escribe directamente el estado de una casilla, sin validar reglas ni turnos.
+
+        Se usa para reconstruir un tablero a partir de otra representación.
+
+        Args:
+            fila: El índice de la fila [0-2].
+            columna: El índice de la columna [0-2].
+            estado: El nuevo estado de la casilla.
+        """
+        potencia = POTENCIAS[fila * 3 + columna]
+        self.codigo += (
+            _VALOR_CASILLA[estado] - _VALOR_CASILLA[self._casilla(fila, columna)]
+        ) * potencia
 
     @override
     def _linea_ganadora(self, coords: list[tuple[int, int]]) -> Resultado | None:
@@ -61,8 +207,10 @@ class Gato(BaseGato[EstadoCasilla]):
         Returns:
             El resultado de victoria si hay una línea ganadora, None en caso contrario.
         """
-        e = self.tablero[coords[0][0]][coords[0][1]]
-        if e != EstadoCasilla.VACIA and all(self.tablero[f][c] == e for f, c in coords):
+        e = self._casilla(*coords[0])
+        if e != EstadoCasilla.VACIA and all(
+            self._casilla(f, c) == e for f, c in coords
+        ):
             return self._vincular_jugador_tipo_resultado(e)
         return None
 
@@ -74,8 +222,4 @@ class Gato(BaseGato[EstadoCasilla]):
         Returns:
             True si todas las casillas están ocupadas, False en caso contrario.
         """
-        return all(
-            self.tablero[fila][columna] != EstadoCasilla.VACIA
-            for fila in range(3)
-            for columna in range(3)
-        )
+        return _TABLAS.vacias[self.codigo] == 0
@@ -0,0 +1,218 @@
+"""Módulo que implementa el juego de Gato clásico sobre bitboards."""
+
+from typing import override
+
+from src.core.base_gato import Tablero
+from src.core.bitboard import GANADORA, bit, lleno, mascara_de
+from src.core.exceptions_custom import *
+from src.core.gato import Gato
+from src.core.tablas_gato import codificar
+from src.enums import EstadoCasilla, EstadoJugada, Resultado
+
+
+class GatoBitboard(Gato):
+    """
+    Clase que representa el juego de Gato clásico almacenado en bitboards.
+
+    En lugar de una matriz de EstadoCasilla guarda un entero de 9 bits por
+    jugador, y valida la victoria contra una tabla precalculada a partir de
+    las 8 líneas del tablero. Mantiene la misma interfaz pública que Gato,
+    por lo que puede usarse como sub-tablero de HyperCat o desde la interfaz.
+
+    Attributes:
+        bits_x: Máscara con las casillas ocupadas por X.
+        bits_o: Máscara con las casillas ocupadas por O.
+    """
+
+    __slots__ = ("bits_x", "bits_o")
+
+    bits_x: int
+    bits_o: int
+
+    @override
+    def _generar_tablero(self) -> None:
+        """Genera un tablero vacío, sin bits encendidos para ningún jugador."""
+        self.bits_x = 0
+        self.bits_o = 0
+
+    @property
+    def codigo(self) -> int:
+        """
+        Calcula el código en base 3 del tablero a partir de los bitboards.
+
+        Returns:
+            El índice del tablero en las tablas de tablas_gato.
+        """
+        return codificar(self.bits_x, self.bits_o)
+
+    @property
+    def tablero(self) -> Tablero[EstadoCasilla]:
+        """
+        Construye la matriz de 3x3 equivalente al estado de los bitboards.
+
+        Returns:
+            Una nueva matriz con el EstadoCasilla de cada posición.
+        """
+        return [
+            [
+                (
+                    EstadoCasilla.X
+                    if self.bits_x & bit(fila, columna)
+                    else (
+                        EstadoCasilla.O
+                        if self.bits_o & bit(fila, columna)
+                        else EstadoCasilla.VACIA
+                    )
+                )
+                for columna in range(3)
+            ]
+            for fila in range(3)
+        ]
+
+    @override
+    def intentar_jugar(self, fila: int, columna: int) -> EstadoJugada:
+        """
+        Intenta realizar un movimiento sin lanzar excepciones.
+
+        Args:
+            fila: El índice de la fila donde se quiere jugar [0-2].
+            columna: El índice de la columna donde se quiere jugar [0-2].
+
+        Returns:
+            OK, JUEGO_TERMINADO, FUERA_DE_RANGO u OCUPADA.
+        """
+        self.reiniciado = False
+
+        if self.resultado is not Resultado.EN_CURSO:
+            return EstadoJugada.JUEGO_TERMINADO
+
+        if not (0 <= fila < 3 and 0 <= columna < 3):
+            return EstadoJugada.FUERA_DE_RANGO
+
+        casilla = bit(fila, columna)
+        if (self.bits_x | self.bits_o) & casilla:
+            return EstadoJugada.OCUPADA
+
+        if self.turno is EstadoCasilla.X:
+            self.bits_x |= casilla
+        else:
+            self.bits_o |= casilla
+        self._actualizar_resultado(fila, columna)
+        self._cambiar_turno()
+        return EstadoJugada.OK
+
+    @override
+    def movimientos_legales(self) -> list[tuple[int, int]]:
+        """
+        Obtiene todas las casillas vacías mientras el juego siga en curso.
+
+        Returns:
+            Lista de tuplas (fila, columna) con los movimientos legales.
+        """
+        if self.validar_victoria().terminado():
+            return []
+        ocupadas = self.bits_x | self.bits_o
+        return [divmod(i, 3) for i in range(9) if not ocupadas >> i & 1]
+
+    @override
+    def es_legal(self, fila: int, columna: int) -> bool:
+        """
+        Verifica si se puede jugar en una casilla.
+
+        Args:
+            fila: El índice de la fila [0-2].
+            columna: El índice de la columna [0-2].
+
+        Returns:
+            True si la casilla está dentro del tablero, vacía y el juego sigue en
+            curso, False en caso contrario.
+        """
+        return (
+            not self._fuera_de_rango(fila, columna)
+            and not (self.bits_x | self.bits_o) & bit(fila, columna)
+            and not self.validar_victoria().terminado()
+        )
+
+    @override
+    def _colocar(self, fila: int, columna: int, estado: EstadoCasilla) -> None:
+        """
+        Escribe directamente el estado de una casilla, sin validar reglas ni turnos.
+
+        Args:
+            fila: El índice de la fila [0-2].
+            columna: El índice de la columna [0-2].
+            estado: El nuevo estado de la casilla.
+        """
+        casilla = bit(fila, columna)
+        self.bits_x &= ~casilla
+        self.bits_o &= ~casilla
+        if estado is EstadoCasilla.X:
+            self.bits_x |= casilla
+        elif estado is EstadoCasilla.O:
+            self.bits_o |= casilla
+
+    @override
+    def _actualizar_resultado(self, fila: int, columna: int) -> None:
+        """
+        Actualiza el resultado revisando solo el bitboard del jugador que movió.
+
+        Args:
+            fila: El índice de la fila de la última jugada [0-2].
+            columna: El índice de la columna de la última jugada [0-2].
+        """
+        if self.turno is EstadoCasilla.X:
+            if GANADORA[self.bits_x]:
+                self.resultado = Resultado.VICTORIA_X
+                return
+        elif GANADORA[self.bits_o]:
+            self.resultado = Resultado.VICTORIA_O
+            return
+
+        if self._validar_empate():
+            self.resultado = Resultado.EMPATE
+
+    @override
+    def _recalcular_resultado(self) -> Resultado:
+        """
+        Calcula el resultado del tablero actual consultando la tabla de líneas.
+
+        Returns:
+            El resultado actual del juego (victoria, empate o en curso).
+        """
+        if GANADORA[self.bits_x]:
+            self.resultado = Resultado.VICTORIA_X
+        elif GANADORA[self.bits_o]:
+            self.resultado = Resultado.VICTORIA_O
+        elif self._validar_empate():
+            self.resultado = Resultado.EMPATE
+        else:
+            self.resultado = Resultado.EN_CURSO
+        return self.resultado
+
+    @override
+    def _linea_ganadora(self, coords: list[tuple[int, int]]) -> Resultado | None:
+        """
+        Verifica si hay una línea ganadora en las coordenadas dadas.
+
+        Args:
+            coords: Lista de tuplas con las coordenadas (fila, columna) a verificar.
+
+        Returns:
+            El resultado de victoria si hay una línea ganadora, None en caso contrario.
+        """
+        linea = mascara_de(coords)
+        if self.bits_x & linea == linea:
+            return Resultado.VICTORIA_X
+        if self.bits_o & linea == linea:
+            return Resultado.VICTORIA_O
+        return None
+
+    @override
+    def _validar_empate(self) -> bool:
+        """
+        Verifica si el juego ha terminado en empate.
+
+        Returns:
+            True si todas las casillas están ocupadas, False en caso contrario.
+        """
+        return lleno(self.bits_x | self.bits_o)
@@ -0,0 +1,252 @@
+"""Módulo que implementa el juego de Gato sobre tableros de N x N."""
+
+from typing import override
+
+from src.core.base_gato import Tablero, Turno
+from src.core.exceptions_custom import *
+from src.core.gato import Gato
+from src.core.lineas import IndiceLineas, indice_lineas
+from src.enums import EstadoCasilla, EstadoJugada, Resultado
+
+
+class GatoNxN(Gato):
+    """
+    Clase que representa un Gato de N x N donde se gana con k marcas en línea.
+
+    Guarda un bitboard de N² bits por jugador y valida cada jugada contra el
+    índice de lineas.py, construido una sola vez por combinación (N, k): solo
+    revisa las líneas que pasan por la casilla jugada, a lo sumo 4k, en vez de
+    todo el tablero. Mantiene la interfaz pública de Gato, por lo que puede
+    usarse como sub-tablero de HyperCat.
+
+    Attributes:
+        tamano: Casillas por lado.
+        en_linea: Marcas seguidas necesarias para ganar.
+        bits_x: Máscara con las casillas ocupadas por X.
+        bits_o: Máscara con las casillas ocupadas por O.
+    """
+
+    __slots__ = ("tamano", "en_linea", "bits_x", "bits_o", "_lineas")
+
+    tamano: int
+    en_linea: int
+    bits_x: int
+    bits_o: int
+    _lineas: IndiceLineas
+
+    def __init__(
+        self,
+        turno_inicial: Turno = EstadoCasilla.X,
+        tamano: int = 3,
+        en_linea: int | None = None,
+    ) -> None:
+        """
+        Inicializa un tablero vacío de N x N.
+
+        Args:
+            turno_inicial: El turno inicial del juego, por defecto es X.
+            tamano: Casillas por lado, por defecto 3.
+            en_linea: Marcas seguidas para ganar; por defecto igual a tamano.
+
+        Raises:
+            ValueError: Si en_linea no está entre 1 y tamano.
+        """
+        self._lineas = indice_lineas(tamano, en_linea)
+        self.tamano = tamano
+        self.en_linea = self._lineas.en_linea
+        super().__init__(turno_inicial)
+
+    @override
+    def _generar_tablero(self) -> None:
+        """Genera un tablero vacío, sin bits encendidos para ningún jugador."""
+        self.bits_x = 0
+        self.bits_o = 0
+
+    @property
+    def codigo(self) -> int:
+        """
+        Calcula el código en base 3 del tablero, con la misma convención que Gato.
+
+        Returns:
+            La suma de 3^casilla por cada X y 2 * 3^casilla por cada O.
+        """
+        return sum(
+            (1 if self.bits_x >> i & 1 else 2) * 3**i
+            for i in range(self.tamano * self.tamano)
+            if (self.bits_x | self.bits_o) >> i & 1
+        )
+
+    @property
+    def tablero(self) -> Tablero[EstadoCasilla]:
+        """
+        Construye la matriz de N x N equivalente al estado de los bitboards.
+
+        Returns:
+            Una nueva matriz con el EstadoCasilla de cada posición.
+        """
+        n = self.tamano
+        return [
+            [self._casilla(fila, columna) for columna in range(n)] for fila in range(n)
+        ]
+
+    @override
+    def _casilla(self, fila: int, columna: int) -> EstadoCasilla:
+        """
+        Obtiene el estado de una casilla a partir de los bitboards.
+
+        Args:
+            fila: El índice de la fila.
+            columna: El índice de la columna.
+
+        Returns:
+            El EstadoCasilla de la posición.
+        """
+        casilla = fila * self.tamano + columna
+        if self.bits_x >> casilla & 1:
+            return EstadoCasilla.X
+        if self.bits_o >> casilla & 1:
+            return EstadoCasilla.O
+        return EstadoCasilla.VACIA
+
+    @override
+    def intentar_jugar(self, fila: int, columna: int) -> EstadoJugada:
+        """
+        Intenta realizar un movimiento sin lanzar excepciones.
+
+        Args:
+            fila: El índice de la fila donde se quiere jugar [0, tamano).
+            columna: El índice de la columna donde se quiere jugar [0, tamano).
+
+        Returns:
+            OK, JUEGO_TERMINADO, FUERA_DE_RANGO u OCUPADA.
+        """
+        self.reiniciado = False
+
+        if self.resultado is not Resultado.EN_CURSO:
+            return EstadoJugada.JUEGO_TERMINADO
+
+        n = self.tamano
+        if not (0 <= fila < n and 0 <= columna < n):
+            return EstadoJugada.FUERA_DE_RANGO
+
+        bit = 1 << (fila * n + columna)
+        if (self.bits_x | self.bits_o) & bit:
+            return EstadoJugada.OCUPADA
+
+        if self.turno is EstadoCasilla.X:
+            self.bits_x |= bit
+            self._actualizar_resultado(fila, columna)
+            self.turno = EstadoCasilla.O
+        else:
+            self.bits_o |= bit
+            self._actualizar_resultado(fila, columna)
+            self.turno = EstadoCasilla.X
+        return EstadoJugada.OK
+
+    @override
+    def _actualizar_resultado(self, fila: int, columna: int) -> None:
+        """
+        Actualiza el resultado revisando solo las líneas de la casilla jugada.
+
+        Args:
+            fila: El índice de la fila de la última jugada.
+            columna: El índice de la columna de la última jugada.
+        """
+        lineas = self._lineas
+        if self.turno is EstadoCasilla.X:
+            propias, resultado = self.bits_x, Resultado.VICTORIA_X
+        else:
+            propias, resultado = self.bits_o, Resultado.VICTORIA_O
+
+        for linea in lineas.por_casilla[fila * self.tamano + columna]:
+            if propias & linea == linea:
+                self.resultado = resultado
+                return
+
+        if self.bits_x | self.bits_o == lineas.lleno:
+            self.resultado = Resultado.EMPATE
+
+    @override
+    def _recalcular_resultado(self) -> Resultado:
+        """
+        Calcula el resultado revisando todas las líneas del tablero.
+
+        Returns:
+            El resultado actual del juego (victoria, empate o en curso).
+        """
+        self.resultado = Resultado.EN_CURSO
+        for linea in self._lineas.lineas:
+            if self.bits_x & linea == linea:
+                self.resultado = Resultado.VICTORIA_X
+                return self.resultado
+            if self.bits_o & linea == linea:
+                self.resultado = Resultado.VICTORIA_O
+                return self.resultado
+
+        if self._validar_empate():
+            self.resultado = Resultado.EMPATE
+        return self.resultado
+
+    @override
+    def movimientos_legales(self) -> list[tuple[int, int]]:
+        """
+        Obtiene todas las casillas vacías mientras el juego siga en curso.
+
+        Returns:
+            Lista de tuplas (fila, columna) con los movimientos legales.
+        """
+        if self.validar_victoria().terminado():
+            return []
+        ocupadas = self.bits_x | self.bits_o
+        return [
+            divmod(i, self.tamano)
+            for i in range(self.tamano * self.tamano)
+            if not ocupadas >> i & 1
+        ]
+
+    @override
+    def es_legal(self, fila: int, columna: int) -> bool:
+        """
+        Verifica si se puede jugar en una casilla.
+
+        Args:
+            fila: El índice de la fila.
+            columna: El índice de la columna.
+
+        Returns:
+            True si la casilla está dentro del tablero, vacía y el juego sigue en
+            curso, False en caso contrario.
+        """
+        return (
+            not self._fuera_de_rango(fila, columna)
+            and not (self.bits_x | self.bits_o) >> (fila * self.tamano + columna) & 1
+            and not self.validar_victoria().terminado()
+        )
+
+    @override
+    def _colocar(self, fila: int, columna: int, estado: EstadoCasilla) -> None:
+        """
+        Escribe directamente el estado de una casilla, sin validar reglas ni turnos.
+
+        Args:
+            fila: El índice de la fila.
+            columna: El índice de la columna.
+            estado: El nuevo estado de la casilla.
+        """
+        bit = 1 << (fila * self.tamano + columna)
+        self.bits_x &= ~bit
+        self.bits_o &= ~bit
+        if estado is EstadoCasilla.X:
+            self.bits_x |= bit
+        elif estado is EstadoCasilla.O:
+            self.bits_o |= bit
+
+    @override
+    def _validar_empate(self) -> bool:
+        """
+        Verifica si el juego ha terminado en empate.
+
+        Returns:
+            True si todas las casillas están ocupadas, False en caso contrario.
+        """
+        return self.bits_x | self.bits_o == self._lineas.lleno
@@ -1,11 +1,99 @@
 """Módulo que implementa el juego HyperCat."""
 
-from typing import Optional, override
+from collections.abc import Iterable
+from functools import cache
+from typing import NamedTuple, Optional, Self, override
 
+from src.core import zobrist
 from src.core.base_gato import BaseGato, Tablero, Turno
 from src.core.exceptions_custom import *
 from src.core.gato import Gato
-from src.enums import EstadoCasilla, Resultado
+from src.core.gato_nxn import GatoNxN
+from src.core.lineas import indice_lineas
+from src.enums import EstadoCasilla, EstadoJugada, Resultado
+
+
+class RegistroJugada(NamedTuple):
+    """
+    Información necesaria para deshacer una jugada de HyperCat.
+
+    Attributes:
+        fila: Fila del sub-tablero donde se jugó.
+        columna: Columna del sub-tablero donde se jugó.
+        subfila: Fila de la casilla dentro del sub-tablero.
+        subcolumna: Columna de la casilla dentro del sub-tablero.
+        turno: Turno de HyperCat antes de la jugada.
+        elegir_cualquiera: Valor de elegir_cualquiera antes de la jugada.
+        gato_a_jugar_despues: Sub-tablero obligatorio antes de la jugada.
+        resultado: Resultado de HyperCat antes de la jugada.
+        reiniciado: Valor de reiniciado de HyperCat antes de la jugada.
+        sub_turno: Turno del sub-tablero antes de la jugada.
+        sub_resultado: Resultado del sub-tablero antes de la jugada.
+        sub_reiniciado: Valor de reiniciado del sub-tablero antes de la jugada.
+        casillas_reiniciadas: Casillas del sub-tablero justo antes de reiniciarlo
+            por empate, o None si la jugada no provocó un reinicio.
+        hash_zobrist: Hash Zobrist de la posición antes de la jugada.
+    """
+
+    fila: int
+    columna: int
+    subfila: int
+    subcolumna: int
+    turno: Turno
+    elegir_cualquiera: bool
+    gato_a_jugar_despues: tuple[int, int] | None
+    resultado: Resultado
+    reiniciado: bool
+    sub_turno: Turno
+    sub_resultado: Resultado
+    sub_reiniciado: bool
+    casillas_reiniciadas: Tablero[EstadoCasilla] | None
+    hash_zobrist: int
+
+
+class ResultadoReproduccion(NamedTuple):
+    """
+    Resultado de aplicar una secuencia de jugadas.
+
+    Attributes:
+        aplicadas: Cantidad de jugadas realizadas; si hubo un movimiento ilegal,
+            es también su índice en la secuencia.
+        estado: OK si se aplicó toda la secuencia, o el motivo por el que se
+            rechazó el movimiento ilegal.
+    """
+
+    aplicadas: int
+    estado: EstadoJugada
+
+    @property
+    def indice_ilegal(self) -> int | None:
+        """
+        Obtiene la posición del movimiento que detuvo la reproducción.
+
+        Returns:
+            El índice del movimiento ilegal, o None si todos fueron legales.
+        """
+        return None if self.estado is EstadoJugada.OK else self.aplicadas
+
+
+@cache
+def _division(tamano: int) -> tuple[tuple[int, int, int, int], ...]:
+    """
+    Precalcula cómo se reparte cada casilla global entre sub-tablero y casilla.
+
+    Args:
+        tamano: Casillas por lado de cada sub-tablero.
+
+    Returns:
+        (subfila, subcolumna, fila, columna) de cada casilla global
+        ``fila * tamano² + columna``.
+    """
+    lado = tamano * tamano
+    return tuple(
+        (fila % tamano, columna % tamano, fila // tamano, columna // tamano)
+        for fila in range(lado)
+        for columna in range(lado)
+    )
 
 
 class HyperCat(BaseGato[Gato]):
@@ -15,24 +103,71 @@ class HyperCat(BaseGato[Gato]):
     Esta clase implementa la variante avanzada del juego de Gato donde
     el tablero está compuesto por 9 tableros de Gato más pequeños.
 
+    También admite sub-tableros de N x N en los que se gana con k en línea
+    (ver GatoNxN): el tablero principal es entonces de N x N sub-tableros y
+    usa la misma regla de k en línea. EstadoHyperCat, codec_posicion y los
+    motores solo manejan la variante clásica de 3 x 3.
+
     Attributes:
+        tamano: Casillas por lado de cada sub-tablero y del tablero principal.
+        en_linea: Marcas seguidas necesarias para ganar.
         elegir_cualquiera: Indica si el jugador puede elegir cualquier sub-tablero.
         gato_a_jugar_despues: Coordenadas del próximo sub-tablero donde se debe jugar.
+        clase_gato: Implementación de Gato usada para los sub-tableros.
+        historial: Pila con las jugadas realizadas, usada por deshacer().
+        hash_zobrist: Hash Zobrist de 64 bits de la posición, actualizado en cada
+            jugada.
+
+    Los sub-tableros se guardan en una lista plana de N² elementos. clone()
+    copia solo esa lista y los comparte con la copia; cada partida duplica un
+    sub-tablero compartido recién cuando va a modificarlo (copy-on-write).
     """
 
+    __slots__ = (
+        "elegir_cualquiera",
+        "gato_a_jugar_despues",
+        "historial",
+        "hash_zobrist",
+        "tamano",
+        "en_linea",
+        "_gatos",
+        "_propios",
+        "_claves",
+    )
+
     elegir_cualquiera: bool
     gato_a_jugar_despues: tuple[int, int] | None
+    clase_gato: type[Gato] = Gato
+    historial: list[RegistroJugada]
+    hash_zobrist: int
+    tamano: int
+    en_linea: int
 
-    def __init__(self, turno_inicial: Turno = EstadoCasilla.X) -> None:
+    def __init__(
+        self,
+        turno_inicial: Turno = EstadoCasilla.X,
+        tamano: int = 3,
+        en_linea: int | None = None,
+    ) -> None:
         """
         Inicializa el juego HyperCat.
 
         Args:
             turno_inicial: El turno inicial del juego, por defecto es X.
+            tamano: Casillas por lado de cada sub-tablero, por defecto 3.
+            en_linea: Marcas seguidas para ganar; por defecto igual a tamano.
+
+        Raises:
+            ValueError: Si en_linea no está entre 1 y tamano.
         """
+        self.tamano = tamano
+        self.en_linea = indice_lineas(tamano, en_linea).en_linea
+        self._claves = zobrist.claves(tamano)
         super().__init__(turno_inicial)
         self.elegir_cualquiera = True
         self.gato_a_jugar_despues = None
+        self.historial = []
+        self.hash_zobrist = self.calcular_hash_zobrist()
 
     def reiniciar(self, turno_inicial: Turno = EstadoCasilla.X) -> None:
         """
@@ -44,13 +179,71 @@ class HyperCat(BaseGato[Gato]):
         super().reiniciar(turno_inicial)
         self.elegir_cualquiera = True
         self.gato_a_jugar_despues = None
+        self.historial = []
+        self.hash_zobrist = self.calcular_hash_zobrist()
 
     @override
     def _generar_tablero(self) -> None:
-        """Genera un tablero de 3x3 donde cada casilla es un juego de Gato."""
-        self.tablero: Tablero[Gato] = [
-            [Gato() for _ in range(3)] for _ in range(3)
-        ]
+        """Genera un tablero de N x N donde cada casilla es un juego de Gato."""
+        sub_tableros = self.tamano * self.tamano
+        if self.tamano == self.en_linea == 3:
+            self._gatos: list[Gato] = [self.clase_gato() for _ in range(9)]
+        else:
+            self._gatos = [
+                GatoNxN(EstadoCasilla.X, self.tamano, self.en_linea)
+                for _ in range(sub_tableros)
+            ]
+        self._propios = (1 << sub_tableros) - 1
+
+    @property
+    def tablero(self) -> Tablero[Gato]:
+        """
+        Construye la matriz de N x N con los sub-tableros de la partida.
+
+        Como quien la recibe puede modificar los sub-tableros, primero deja de
+        compartirlos con los clones.
+
+        Returns:
+            Una nueva matriz con los Gato de cada posición.
+        """
+        n = self.tamano
+        for sub_tablero in range(n * n):
+            self._gato_propio(sub_tablero)
+        return [self._gatos[fila * n : fila * n + n] for fila in range(n)]
+
+    def _gato_propio(self, sub_tablero: int) -> Gato:
+        """
+        Obtiene un sub-tablero para modificarlo, copiándolo si está compartido.
+
+        Args:
+            sub_tablero: El índice [0, N²) del sub-tablero.
+
+        Returns:
+            El Gato del sub-tablero, que ya no se comparte con ningún clon.
+        """
+        gato = self._gatos[sub_tablero]
+        if not self._propios >> sub_tablero & 1:
+            gato = self._gatos[sub_tablero] = gato.clone()
+            self._propios |= 1 << sub_tablero
+        return gato
+
+    @override
+    def clone(self) -> Self:
+        """
+        Crea una copia independiente de la partida con una sola copia de lista.
+
+        Los sub-tableros quedan compartidos entre ambas partidas hasta que una
+        de ellas los modifique; el historial se copia para que la copia también
+        pueda deshacer las jugadas anteriores.
+
+        Returns:
+            Una nueva partida en la misma posición.
+        """
+        copia = super().clone()
+        copia._gatos = self._gatos[:]
+        copia.historial = self.historial[:]
+        copia._propios = self._propios = 0
+        return copia
 
     @override
     def jugar(
@@ -73,63 +266,377 @@ class HyperCat(BaseGato[Gato]):
 
         Raises:
             JuegoTerminadoError: Si el juego principal ya ha terminado.
-            EstadoInconsistenteError: Si los parámetros no coinciden con el estado del juego.
+            GatoNoEspecificadoError: Si se puede elegir cualquier sub-tablero y no
+                se indicó cuál.
+            EstadoInconsistenteError: Si no se puede elegir y no hay un
+                sub-tablero obligatorio.
             FueraDeRangoError: Si las coordenadas están fuera del rango válido.
             SubGatoTerminadoError: Si se intenta jugar en un sub-tablero terminado.
+            GatoError: Si la casilla del sub-tablero está ocupada o fuera de rango.
+        """
+        estado = self.intentar_jugar(subfila, subcolumna, fila, columna)
+        if estado is EstadoJugada.OK:
+            return
+
+        sub_tablero_rechazado = estado is EstadoJugada.OCUPADA or (
+            estado is EstadoJugada.FUERA_DE_RANGO
+            and not (self.elegir_cualquiera and self._fuera_de_rango(fila, columna))
+        )
+        if sub_tablero_rechazado:
+            if not self.elegir_cualquiera:
+                fila, columna = self.gato_a_jugar_despues
+            raise GatoError(
+                f"No se pudo jugar en el gato seleccionado\nSub Gato ({fila}, {columna}): {str(self._excepcion(estado))}"
+            )
+        raise self._excepcion(estado)
+
+    @override
+    def intentar_jugar(
+        self,
+        subfila: int,
+        subcolumna: int,
+        fila: Optional[int] = None,
+        columna: Optional[int] = None,
+    ) -> EstadoJugada:
+        """
+        Intenta realizar un movimiento sin lanzar excepciones.
+
+        Recibe los mismos argumentos que jugar(). Si el movimiento se rechaza no
+        cambia ninguna casilla ni el turno; al elegir un sub-tablero terminado,
+        igual que jugar(), habilita elegir cualquier sub-tablero.
+
+        Args:
+            subfila: El índice de la fila dentro del sub-tablero [0-2].
+            subcolumna: El índice de la columna dentro del sub-tablero [0-2].
+            fila: El índice de la fila del sub-tablero en el tablero principal [0-2].
+            columna: El índice de la columna del sub-tablero en el tablero principal [0-2].
+
+        Returns:
+            OK si se jugó; JUEGO_TERMINADO, SUBGATO_NO_ESPECIFICADO, INCONSISTENTE,
+            FUERA_DE_RANGO, SUBGATO_TERMINADO u OCUPADA si se rechazó.
         """
+        reiniciado = self.reiniciado
         self.reiniciado = False
 
-        if self.validar_victoria().terminado():
-            raise JuegoTerminadoError()
+        if self.resultado is not Resultado.EN_CURSO:
+            return EstadoJugada.JUEGO_TERMINADO
 
+        n = self.tamano
         if self.elegir_cualquiera:
             if fila is None or columna is None:
-                raise EstadoInconsistenteError()
-            if self._fuera_de_rango(fila, columna):
-                raise FueraDeRangoError()
+                return EstadoJugada.SUBGATO_NO_ESPECIFICADO
+            if not (0 <= fila < n and 0 <= columna < n):
+                return EstadoJugada.FUERA_DE_RANGO
         else:
             if self.gato_a_jugar_despues is None:
-                raise EstadoInconsistenteError()
+                return EstadoJugada.INCONSISTENTE
             fila, columna = self.gato_a_jugar_despues
 
-        gato_seleccionado = self.tablero[fila][columna]
-        if gato_seleccionado.terminado():
+        sub_tablero = fila * n + columna
+        gato_seleccionado = self._gatos[sub_tablero]
+        if gato_seleccionado.resultado is not Resultado.EN_CURSO:
             self.elegir_cualquiera = True
-            raise SubGatoTerminadoError()
+            return EstadoJugada.SUBGATO_TERMINADO
 
+        sub_turno = gato_seleccionado.turno
+        sub_resultado = gato_seleccionado.resultado
+        sub_reiniciado = gato_seleccionado.reiniciado
+
+        gato_seleccionado = self._gato_propio(sub_tablero)
         gato_seleccionado.turno = self.turno
+        estado = gato_seleccionado.intentar_jugar(subfila, subcolumna)
+        if estado is not EstadoJugada.OK:
+            return estado
 
-        try:
-            gato_seleccionado.jugar(subfila, subcolumna)
-        except GatoError as e:
-            raise GatoError(
-                f"No se pudo jugar en el gato seleccionado\nSub Gato ({fila}, {columna}): {str(e)}"
-            )
+        turno = self.turno
+        registro = RegistroJugada(
+            fila,
+            columna,
+            subfila,
+            subcolumna,
+            turno,
+            self.elegir_cualquiera,
+            self.gato_a_jugar_despues,
+            self.resultado,
+            reiniciado,
+            sub_turno,
+            sub_resultado,
+            sub_reiniciado,
+            None,
+            self.hash_zobrist,
+        )
+
+        claves = self._claves
+        casillas_sub = n * n
+        jugador = 0 if turno is EstadoCasilla.X else 1
+        hash_zobrist = (
+            self.hash_zobrist
+            ^ claves.casillas[jugador][
+                sub_tablero * casillas_sub + subfila * n + subcolumna
+            ]
+            ^ claves.forzado[-1 if self.elegir_cualquiera else sub_tablero]
+            ^ claves.turno_o
+        )
 
+        resultado_sub = gato_seleccionado.resultado
         # Si el sub-gato termina en empate, lo reinicio
-        if gato_seleccionado.validar_victoria() == Resultado.EMPATE:
+        if resultado_sub is Resultado.EMPATE:
+            casillas = [list(f) for f in gato_seleccionado.tablero]
+            registro = registro._replace(casillas_reiniciadas=casillas)
             gato_seleccionado.reiniciar()
+            for i in range(casillas_sub):
+                casilla = casillas[i // n][i % n]
+                if casilla is not EstadoCasilla.VACIA:
+                    hash_zobrist ^= claves.casillas[
+                        0 if casilla is EstadoCasilla.X else 1
+                    ][sub_tablero * casillas_sub + i]
+        elif resultado_sub is not Resultado.EN_CURSO:
+            hash_zobrist ^= claves.ganados[jugador][sub_tablero]
+            # Solo al ganar un sub-tablero puede cambiar el resultado principal
+            self._actualizar_resultado(fila, columna)
 
-        gato_destino = self.tablero[subfila][subcolumna]
+        destino = subfila * n + subcolumna
         # Validar si el gato a jugar despues ha terminado, en cuyo caso permito elegir cualquiera
-        if gato_destino.terminado():
+        if self._gatos[destino].resultado is not Resultado.EN_CURSO:
             self.elegir_cualquiera = True
             self.gato_a_jugar_despues = None
+            destino = -1
         else:
             self.elegir_cualquiera = False
             self.gato_a_jugar_despues = (subfila, subcolumna)
 
-        self._cambiar_turno()
+        self.turno = EstadoCasilla.O if turno is EstadoCasilla.X else EstadoCasilla.X
+        self.hash_zobrist = hash_zobrist ^ claves.forzado[destino]
+        self.historial.append(registro)
+        return EstadoJugada.OK
+
+    def aplicar_movimientos(
+        self, movimientos: Iterable[tuple[int, int]]
+    ) -> ResultadoReproduccion:
+        """
+        Aplica una secuencia de jugadas en coordenadas globales, validando cada una.
+
+        Se detiene en el primer movimiento ilegal, sin lanzar excepciones, y deja
+        la partida como quedó tras la última jugada legal. A diferencia de
+        jugar(), un movimiento fuera del sub-tablero obligatorio se rechaza.
+
+        Args:
+            movimientos: Iterable de (fila, columna) globales [0-8] (o [0, N²)),
+                por ejemplo una lista de tuplas o un arreglo de forma (n, 2).
+
+        Returns:
+            La cantidad de jugadas aplicadas y el estado del último intento.
+        """
+        intentar_jugar = self.intentar_jugar
+        division = _division(self.tamano)
+        lado = self.tamano * self.tamano
+        aplicadas = 0
+        for fila, columna in movimientos:
+            if not (0 <= fila < lado and 0 <= columna < lado):
+                return ResultadoReproduccion(aplicadas, EstadoJugada.FUERA_DE_RANGO)
+
+            subfila, subcolumna, fila, columna = division[fila * lado + columna]
+            if not self.elegir_cualquiera and self.gato_a_jugar_despues != (
+                fila,
+                columna,
+            ):
+                estado = (
+                    EstadoJugada.JUEGO_TERMINADO
+                    if self.resultado is not Resultado.EN_CURSO
+                    else EstadoJugada.SUBGATO_NO_PERMITIDO
+                )
+                return ResultadoReproduccion(aplicadas, estado)
+
+            estado = intentar_jugar(subfila, subcolumna, fila, columna)
+            if estado is not EstadoJugada.OK:
+                return ResultadoReproduccion(aplicadas, estado)
+            aplicadas += 1
+
+        return ResultadoReproduccion(aplicadas, EstadoJugada.OK)
+
+    @classmethod
+    def desde_movimientos(
+        cls,
+        movimientos: Iterable[tuple[int, int]],
+        turno_inicial: Turno = EstadoCasilla.X,
+        tamano: int = 3,
+        en_linea: int | None = None,
+    ) -> Self:
+        """
+        Crea una partida reproduciendo una secuencia de jugadas desde el inicio.
+
+        Args:
+            movimientos: Iterable de (fila, columna) globales [0-8] (o [0, N²)).
+            turno_inicial: El turno inicial del juego, por defecto es X.
+            tamano: Casillas por lado de cada sub-tablero, por defecto 3.
+            en_linea: Marcas seguidas para ganar; por defecto igual a tamano.
+
+        Returns:
+            La partida tras aplicar todas las jugadas.
+
+        Raises:
+            ReproduccionError: Si algún movimiento es ilegal; indica su índice.
+        """
+        juego = cls(turno_inicial, tamano, en_linea)
+        resultado = juego.aplicar_movimientos(movimientos)
+        if resultado.estado is not EstadoJugada.OK:
+            raise ReproduccionError(resultado.aplicadas, resultado.estado)
+        return juego
+
+    def deshacer(self) -> tuple[int, int]:
+        """
+        Deshace la última jugada realizada con jugar().
+
+        Restaura exactamente el estado previo: turno, sub-tablero obligatorio,
+        resultados en caché y, si la jugada provocó el reinicio de un sub-tablero
+        por empate, sus casillas.
+
+        Returns:
+            Las coordenadas globales (fila, columna) [0-8] de la jugada deshecha.
+
+        Raises:
+            SinJugadasError: Si no hay jugadas que deshacer.
+        """
+        if not self.historial:
+            raise SinJugadasError()
+
+        n = self.tamano
+        registro = self.historial.pop()
+        gato = self._gato_propio(registro.fila * n + registro.columna)
+
+        if registro.casillas_reiniciadas is not None:
+            for f, fila in enumerate(registro.casillas_reiniciadas):
+                for c, casilla in enumerate(fila):
+                    gato._colocar(f, c, casilla)
+        gato._colocar(registro.subfila, registro.subcolumna, EstadoCasilla.VACIA)
+        gato.turno = registro.sub_turno
+        gato.resultado = registro.sub_resultado
+        gato.reiniciado = registro.sub_reiniciado
+
+        self.turno = registro.turno
+        self.elegir_cualquiera = registro.elegir_cualquiera
+        self.gato_a_jugar_despues = registro.gato_a_jugar_despues
+        self.resultado = registro.resultado
+        self.reiniciado = registro.reiniciado
+        self.hash_zobrist = registro.hash_zobrist
+
+        return (
+            registro.fila * n + registro.subfila,
+            registro.columna * n + registro.subcolumna,
+        )
+
+    def calcular_hash_zobrist(self) -> int:
+        """
+        Calcula desde cero el hash Zobrist de la posición actual.
+
+        jugar() y deshacer() mantienen hash_zobrist de forma incremental; este
+        método sirve para inicializarlo o verificarlo.
+
+        Returns:
+            El hash de 64 bits de la posición.
+        """
+        claves = self._claves
+        n = self.tamano
+        hash_zobrist = claves.forzado[self._sub_tablero_forzado()]
+        if self.turno is EstadoCasilla.O:
+            hash_zobrist ^= claves.turno_o
+
+        for sub_tablero in range(n * n):
+            gato = self._gatos[sub_tablero]
+            casillas = gato.tablero
+            for i in range(n * n):
+                casilla = casillas[i // n][i % n]
+                if casilla is not EstadoCasilla.VACIA:
+                    hash_zobrist ^= claves.casillas[
+                        0 if casilla is EstadoCasilla.X else 1
+                    ][sub_tablero * n * n + i]
+            match gato.validar_victoria():
+                case Resultado.VICTORIA_X:
+                    hash_zobrist ^= claves.ganados[0][sub_tablero]
+                case Resultado.VICTORIA_O:
+                    hash_zobrist ^= claves.ganados[1][sub_tablero]
+
+        return hash_zobrist
+
+    def _sub_tablero_forzado(self) -> int:
+        """
+        Obtiene el índice del sub-tablero obligatorio.
+
+        Returns:
+            El índice [0, N²) del sub-tablero donde se debe jugar, o -1 si se
+            puede elegir cualquiera.
+        """
+        if self.elegir_cualquiera or self.gato_a_jugar_despues is None:
+            return -1
+        fila, columna = self.gato_a_jugar_despues
+        return fila * self.tamano + columna
+
+    @override
+    def movimientos_legales(self) -> list[tuple[int, int]]:
+        """
+        Obtiene todas las casillas del tablero 9x9 donde se puede jugar.
+
+        Si hay un sub-tablero obligatorio solo se consideran sus casillas; si no,
+        las de todos los sub-tableros que no han terminado.
+
+        Returns:
+            Lista de tuplas (fila, columna) globales [0-8] con los movimientos
+            legales, vacía si el juego terminó.
+        """
+        if self.validar_victoria().terminado():
+            return []
+
+        n = self.tamano
+        if self.elegir_cualquiera or self.gato_a_jugar_despues is None:
+            sub_tableros = [(f, c) for f in range(n) for c in range(n)]
+        else:
+            sub_tableros = [self.gato_a_jugar_despues]
+
+        return [
+            (fila * n + subfila, columna * n + subcolumna)
+            for fila, columna in sub_tableros
+            for subfila, subcolumna in self._gatos[
+                fila * n + columna
+            ].movimientos_legales()
+        ]
+
+    @override
+    def es_legal(self, fila: int, columna: int) -> bool:
+        """
+        Verifica si se puede jugar en una casilla del tablero 9x9.
+
+        Args:
+            fila: El índice global de la fila [0-8].
+            columna: El índice global de la columna [0-8].
+
+        Returns:
+            True si la casilla pertenece a un sub-tablero permitido, está vacía y
+            el juego sigue en curso, False en caso contrario.
+        """
+        n = self.tamano
+        if self._fuera_de_rango(fila, columna, size=n * n):
+            return False
+        if self.validar_victoria().terminado():
+            return False
+
+        sub_tablero = (fila // n, columna // n)
+        if not self.elegir_cualquiera and sub_tablero != self.gato_a_jugar_despues:
+            return False
+
+        return self._gatos[sub_tablero[0] * n + sub_tablero[1]].es_legal(
+            fila % n, columna % n
+        )
 
     @override
     def _linea_ganadora(self, coords: list[tuple[int, int]]) -> Resultado | None:
-        r = self.tablero[coords[0][0]][coords[0][1]].resultado
+        n = self.tamano
+        r = self._gatos[coords[0][0] * n + coords[0][1]].resultado
         if r != Resultado.EN_CURSO and all(
-            self.tablero[f][c].resultado == r for f, c in coords
+            self._gatos[f * n + c].resultado == r for f, c in coords
         ):
             return r
         return None
 
     @override
     def _validar_empate(self) -> bool:
-        return all(self.tablero[f][c].terminado() for f in range(3) for c in range(3))
+        return all(gato.terminado() for gato in self._gatos)
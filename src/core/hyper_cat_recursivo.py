@@ -0,0 +1,475 @@
+"""Módulo con HyperCat recursivo de profundidad arbitraria.
+
+Un tablero de profundidad ``d`` es un tablero de 3x3 cuyas casillas son
+tableros de profundidad ``d - 1``; los de profundidad 1 son Gatos comunes. La
+profundidad 1 es el Gato clásico, la 2 es HyperCat y la 3 tiene 729 casillas.
+
+En lugar de anidar objetos, todos los tableros (excepto las casillas) se
+numeran como un árbol 9-ario en un arreglo plano: la raíz es el nodo 0 y los
+hijos del nodo ``n`` son ``9n + 1`` a ``9n + 9``. Cada nodo guarda una máscara de
+9 bits con los hijos ganados por X, otra con los ganados por O y otra con los
+empatados; en las hojas (los tableros de 3x3 de casillas) las máscaras son las
+casillas de cada jugador. Las rutas de cada casilla (su hoja, el tablero al
+que envía al rival, sus coordenadas) se precalculan una vez por profundidad,
+de modo que una jugada solo cuesta más cuando cierra tableros.
+
+Reglas, que con profundidad 2 coinciden con las de HyperCat:
+
+* Una casilla en la posición ``p`` de su hoja envía al rival a la hoja con el
+  mismo camino que la jugada sin su primer paso: la casilla con índice ``i``
+  envía a la hoja ``i mod 9^(d-1)``. Si esa hoja, o alguno de sus ancestros,
+  está cerrado, el rival juega en cualquier lugar del ancestro abierto más
+  profundo.
+* Un tablero se gana con tres hijos ganados en línea. Una hoja llena sin
+  ganador se reinicia; un tablero intermedio con todos sus hijos cerrados y
+  sin línea queda empatado (cerrado y sin dueño), y si es la raíz la partida
+  termina en empate.
+"""
+
+from functools import cache
+from typing import NamedTuple, Self, override
+
+from src.core.base_gato import BaseGato, Tablero, Turno
+from src.core.bitboard import GANADORA, TABLERO_LLENO, mascara_de
+from src.enums import EstadoCasilla, EstadoJugada, Resultado
+
+_VICTORIAS: tuple[Resultado, Resultado] = (Resultado.VICTORIA_X, Resultado.VICTORIA_O)
+_CASILLAS: tuple[EstadoCasilla, EstadoCasilla] = (EstadoCasilla.X, EstadoCasilla.O)
+
+
+class Rutas(NamedTuple):
+    """
+    Tablas precalculadas de un tablero recursivo de una profundidad dada.
+
+    Las casillas se indexan por su camino desde la raíz en base 9 (primero el
+    paso de la raíz): la casilla ``i`` está en la posición ``i % 9`` de la hoja
+    ``i // 9``, contando las hojas de izquierda a derecha.
+
+    Attributes:
+        profundidad: Niveles de tableros.
+        lado: Casillas por lado del tablero completo (3^profundidad).
+        nodos: Cantidad de tableros, incluida la raíz y las hojas.
+        indice: Índice de casilla de cada ``fila * lado + columna``.
+        coordenadas: Coordenadas (fila, columna) de cada índice de casilla.
+        hoja: Nodo de la hoja de cada casilla.
+        destino: Nodo de la hoja a la que envía cada casilla.
+        padre: Padre de cada nodo (-1 para la raíz).
+        bit: Bit de cada nodo en las máscaras de su padre (0 para la raíz).
+        hojas: Rango [inicio, fin) de los nodos hoja debajo de cada nodo.
+        subarbol: Rangos [inicio, fin) de los nodos debajo de cada nodo, uno por
+            nivel, incluido el del propio nodo.
+    """
+
+    profundidad: int
+    lado: int
+    nodos: int
+    indice: tuple[int, ...]
+    coordenadas: tuple[tuple[int, int], ...]
+    hoja: tuple[int, ...]
+    destino: tuple[int, ...]
+    padre: tuple[int, ...]
+    bit: tuple[int, ...]
+    hojas: tuple[tuple[int, int], ...]
+    subarbol: tuple[tuple[tuple[int, int], ...], ...]
+
+
+@cache
+def rutas(profundidad: int) -> Rutas:
+    """
+    Construye las tablas de un tablero recursivo, una vez por profundidad.
+
+    Args:
+        profundidad: Niveles de tableros, al menos 1.
+
+    Returns:
+        Las tablas de esa profundidad.
+
+    Raises:
+        ValueError: Si la profundidad no es positiva.
+    """
+    if profundidad < 1:
+        raise ValueError("La profundidad debe ser al menos 1.")
+
+    lado = 3**profundidad
+    # Primer nodo de cada nivel: (9^nivel - 1) / 8
+    primero = [(9**nivel - 1) // 8 for nivel in range(profundidad + 1)]
+    nodos = primero[profundidad]
+    ultimo_nivel = profundidad - 1
+
+    coordenadas = []
+    for i in range(9**profundidad):
+        fila = columna = 0
+        for paso in range(profundidad):
+            digito = i // 9 ** (profundidad - 1 - paso) % 9
+            fila = fila * 3 + digito // 3
+            columna = columna * 3 + digito % 3
+        coordenadas.append((fila, columna))
+
+    indice = [0] * (lado * lado)
+    for i, (fila, columna) in enumerate(coordenadas):
+        indice[fila * lado + columna] = i
+
+    hojas_por_nivel = 9**ultimo_nivel
+    niveles = [nivel for nivel in range(profundidad) for _ in range(9**nivel)]
+    hojas = []
+    subarbol = []
+    for nodo in range(nodos):
+        nivel = niveles[nodo]
+        direccion = nodo - primero[nivel]
+        rangos = tuple(
+            (
+                primero[abajo] + direccion * 9 ** (abajo - nivel),
+                primero[abajo] + (direccion + 1) * 9 ** (abajo - nivel),
+            )
+            for abajo in range(nivel, profundidad)
+        )
+        subarbol.append(rangos)
+        hojas.append(rangos[-1])
+
+    return Rutas(
+        profundidad=profundidad,
+        lado=lado,
+        nodos=nodos,
+        indice=tuple(indice),
+        coordenadas=tuple(coordenadas),
+        hoja=tuple(primero[ultimo_nivel] + i // 9 for i in range(9**profundidad)),
+        destino=tuple(
+            primero[ultimo_nivel] + i % hojas_por_nivel for i in range(9**profundidad)
+        ),
+        padre=tuple((nodo - 1) // 9 for nodo in range(nodos)),
+        bit=(0, *(1 << (nodo - 1) % 9 for nodo in range(1, nodos))),
+        hojas=tuple(hojas),
+        subarbol=tuple(subarbol),
+    )
+
+
+class HyperCatRecursivo(BaseGato[EstadoCasilla]):
+    """
+    HyperCat generalizado a cualquier profundidad sobre un arreglo plano.
+
+    Las jugadas se indican con coordenadas globales (fila, columna) del
+    tablero completo de ``lado`` x ``lado`` casillas, o con el índice de casilla
+    de Rutas mediante intentar_jugar_indice().
+
+    Attributes:
+        profundidad: Niveles de tableros (1 es Gato, 2 es HyperCat).
+        x: Por nodo, la máscara de hijos (o casillas, en las hojas) de X.
+        o: Por nodo, la máscara de hijos (o casillas, en las hojas) de O.
+        empatados: Por nodo, la máscara de hijos empatados.
+        cerrados: Por nodo, 1 si el tablero o alguno de sus ancestros terminó.
+        forzado: Nodo donde debe jugar el jugador actual (0 si es libre).
+    """
+
+    __slots__ = ("profundidad", "x", "o", "empatados", "cerrados", "forzado", "_rutas")
+
+    profundidad: int
+    x: list[int]
+    o: list[int]
+    empatados: list[int]
+    cerrados: bytearray
+    forzado: int
+
+    def __init__(
+        self, profundidad: int = 2, turno_inicial: Turno = EstadoCasilla.X
+    ) -> None:
+        """
+        Inicializa una partida.
+
+        Args:
+            profundidad: Niveles de tableros, por defecto 2 (HyperCat).
+            turno_inicial: El turno inicial del juego, por defecto es X.
+
+        Raises:
+            ValueError: Si la profundidad no es positiva.
+        """
+        self.profundidad = profundidad
+        self._rutas = rutas(profundidad)
+        super().__init__(turno_inicial)
+
+    @override
+    def _generar_tablero(self) -> None:
+        """Vacía todos los tableros."""
+        nodos = self._rutas.nodos
+        self.x = [0] * nodos
+        self.o = [0] * nodos
+        self.empatados = [0] * nodos
+        self.cerrados = bytearray(nodos)
+        self.forzado = 0
+
+    @property
+    def lado(self) -> int:
+        """
+        Obtiene el tamaño del tablero completo.
+
+        Returns:
+            Casillas por lado (3^profundidad).
+        """
+        return self._rutas.lado
+
+    @property
+    def tablero(self) -> Tablero[EstadoCasilla]:
+        """
+        Construye la matriz con el estado de todas las casillas.
+
+        Returns:
+            Una nueva matriz de ``lado`` x ``lado`` con VACIA, X u O.
+        """
+        r = self._rutas
+        return [
+            [
+                self._casilla(r.indice[fila * r.lado + columna])
+                for columna in range(r.lado)
+            ]
+            for fila in range(r.lado)
+        ]
+
+    def _casilla(self, indice: int) -> EstadoCasilla:
+        """
+        Obtiene el estado de una casilla.
+
+        Args:
+            indice: El índice de la casilla.
+
+        Returns:
+            VACIA, X u O.
+        """
+        hoja = self._rutas.hoja[indice]
+        if self.x[hoja] >> indice % 9 & 1:
+            return EstadoCasilla.X
+        if self.o[hoja] >> indice % 9 & 1:
+            return EstadoCasilla.O
+        return EstadoCasilla.VACIA
+
+    @override
+    def clone(self) -> Self:
+        """
+        Crea una copia independiente de la partida.
+
+        Returns:
+            Una nueva partida en la misma posición.
+        """
+        copia = super().clone()
+        copia.x = self.x[:]
+        copia.o = self.o[:]
+        copia.empatados = self.empatados[:]
+        copia.cerrados = self.cerrados[:]
+        return copia
+
+    @override
+    def jugar(self, fila: int, columna: int):
+        """
+        Realiza un movimiento en el tablero completo.
+
+        Args:
+            fila: El índice global de la fila [0, lado).
+            columna: El índice global de la columna [0, lado).
+
+        Raises:
+            JuegoTerminadoError: Si la partida ya terminó.
+            FueraDeRangoError: Si la posición está fuera del tablero.
+            SubGatoTerminadoError: Si la casilla está en un tablero cerrado.
+            SubGatoNoPermitidoError: Si la casilla está fuera del tablero obligatorio.
+            CasillaOcupadaError: Si la casilla ya está ocupada.
+        """
+        if (estado := self.intentar_jugar(fila, columna)) is not EstadoJugada.OK:
+            raise self._excepcion(estado)
+
+    @override
+    def intentar_jugar(self, fila: int, columna: int) -> EstadoJugada:
+        """
+        Intenta realizar un movimiento sin lanzar excepciones.
+
+        Args:
+            fila: El índice global de la fila [0, lado).
+            columna: El índice global de la columna [0, lado).
+
+        Returns:
+            OK si se jugó; JUEGO_TERMINADO, FUERA_DE_RANGO, SUBGATO_TERMINADO,
+            SUBGATO_NO_PERMITIDO u OCUPADA si se rechazó.
+        """
+        if self.resultado is not Resultado.EN_CURSO:
+            return EstadoJugada.JUEGO_TERMINADO
+        lado = self._rutas.lado
+        if not (0 <= fila < lado and 0 <= columna < lado):
+            return EstadoJugada.FUERA_DE_RANGO
+        return self.intentar_jugar_indice(self._rutas.indice[fila * lado + columna])
+
+    def intentar_jugar_indice(self, indice: int) -> EstadoJugada:
+        """
+        Intenta jugar en una casilla dada por su índice (ver Rutas).
+
+        Args:
+            indice: El índice de la casilla [0, lado^2).
+
+        Returns:
+            OK si se jugó, o el motivo por el que se rechazó.
+        """
+        if self.resultado is not Resultado.EN_CURSO:
+            return EstadoJugada.JUEGO_TERMINADO
+        r = self._rutas
+        if not 0 <= indice < len(r.hoja):
+            return EstadoJugada.FUERA_DE_RANGO
+
+        hoja = r.hoja[indice]
+        if self.cerrados[hoja]:
+            return EstadoJugada.SUBGATO_TERMINADO
+        inicio, fin = r.hojas[self.forzado]
+        if not inicio <= hoja < fin:
+            return EstadoJugada.SUBGATO_NO_PERMITIDO
+        bit = 1 << indice % 9
+        if (self.x[hoja] | self.o[hoja]) & bit:
+            return EstadoJugada.OCUPADA
+
+        self._jugar_indice(indice, hoja, bit)
+        return EstadoJugada.OK
+
+    def _jugar_indice(self, indice: int, hoja: int, bit: int) -> None:
+        """
+        Realiza un movimiento ya validado y actualiza resultados y destino.
+
+        Args:
+            indice: El índice de la casilla.
+            hoja: El nodo de la hoja de la casilla.
+            bit: El bit de la casilla dentro de su hoja.
+        """
+        jugador = 0 if self.turno is EstadoCasilla.X else 1
+        propias = self.o if jugador else self.x
+        marcas = propias[hoja] | bit
+        propias[hoja] = marcas
+
+        if GANADORA[marcas]:
+            self._cerrar(hoja, jugador)
+        elif marcas | (self.x if jugador else self.o)[hoja] == TABLERO_LLENO:
+            if hoja == 0:
+                self._cerrar(0, None)
+            else:
+                # Si la hoja termina en empate, se reinicia
+                self.x[hoja] = self.o[hoja] = 0
+
+        r = self._rutas
+        destino = r.destino[indice]
+        while self.cerrados[destino] and destino:
+            destino = r.padre[destino]
+        self.forzado = destino
+        self.turno = _CASILLAS[1 - jugador]
+
+    def _cerrar(self, nodo: int, jugador: int | None) -> None:
+        """
+        Cierra un tablero y propaga el resultado hacia sus ancestros.
+
+        Args:
+            nodo: El nodo que terminó.
+            jugador: 0 o 1 si lo ganó X u O, None si quedó empatado.
+        """
+        r = self._rutas
+        while True:
+            for inicio, fin in r.subarbol[nodo]:
+                self.cerrados[inicio:fin] = b"\x01" * (fin - inicio)
+            if nodo == 0:
+                self.resultado = (
+                    Resultado.EMPATE if jugador is None else _VICTORIAS[jugador]
+                )
+                return
+
+            padre = r.padre[nodo]
+            if jugador is None:
+                self.empatados[padre] |= r.bit[nodo]
+            else:
+                propias = self.o if jugador else self.x
+                propias[padre] |= r.bit[nodo]
+                if GANADORA[propias[padre]]:
+                    nodo = padre
+                    continue
+
+            if self.x[padre] | self.o[padre] | self.empatados[padre] != TABLERO_LLENO:
+                return
+            nodo, jugador = padre, None
+
+    def indices_legales(self) -> list[int]:
+        """
+        Obtiene los índices de casilla donde puede jugar el jugador actual.
+
+        Returns:
+            Los índices en orden creciente, o una lista vacía si la partida terminó.
+        """
+        if self.resultado is not Resultado.EN_CURSO:
+            return []
+        inicio, fin = self._rutas.hojas[self.forzado]
+        primera = self._rutas.hoja[0]
+        legales = []
+        for hoja in range(inicio, fin):
+            if self.cerrados[hoja]:
+                continue
+            libres = TABLERO_LLENO & ~(self.x[hoja] | self.o[hoja])
+            base = (hoja - primera) * 9
+            while libres:
+                menor = libres & -libres
+                legales.append(base + menor.bit_length() - 1)
+                libres ^= menor
+        return legales
+
+    @override
+    def movimientos_legales(self) -> list[tuple[int, int]]:
+        """
+        Obtiene todas las casillas donde puede jugar el jugador actual.
+
+        Returns:
+            Lista de coordenadas globales (fila, columna), vacía si el juego
+            terminó.
+        """
+        coordenadas = self._rutas.coordenadas
+        return [coordenadas[i] for i in self.indices_legales()]
+
+    @override
+    def es_legal(self, fila: int, columna: int) -> bool:
+        """
+        Verifica si el jugador actual puede jugar en una casilla.
+
+        Args:
+            fila: El índice global de la fila.
+            columna: El índice global de la columna.
+
+        Returns:
+            True si el movimiento es legal, False en caso contrario.
+        """
+        r = self._rutas
+        if self.resultado is not Resultado.EN_CURSO or self._fuera_de_rango(
+            fila, columna, size=r.lado
+        ):
+            return False
+        indice = r.indice[fila * r.lado + columna]
+        hoja = r.hoja[indice]
+        inicio, fin = r.hojas[self.forzado]
+        return (
+            not self.cerrados[hoja]
+            and inicio <= hoja < fin
+            and not (self.x[hoja] | self.o[hoja]) >> indice % 9 & 1
+        )
+
+    @override
+    def _linea_ganadora(self, coords: list[tuple[int, int]]) -> Resultado | None:
+        """
+        Verifica si un jugador ganó una línea de tableros de la raíz.
+
+        Args:
+            coords: Las coordenadas (fila, columna) [0-2] de la línea en la raíz.
+
+        Returns:
+            El resultado de victoria si hay una línea ganadora, None en caso contrario.
+        """
+        linea = mascara_de(coords)
+        if self.x[0] & linea == linea:
+            return Resultado.VICTORIA_X
+        if self.o[0] & linea == linea:
+            return Resultado.VICTORIA_O
+        return None
+
+    @override
+    def _validar_empate(self) -> bool:
+        """
+        Verifica si todos los hijos de la raíz están cerrados.
+
+        Returns:
+            True si la raíz no tiene hijos abiertos, False en caso contrario.
+        """
+        return self.x[0] | self.o[0] | self.empatados[0] == TABLERO_LLENO
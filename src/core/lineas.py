@@ -0,0 +1,94 @@
+"""Módulo con el índice de líneas ganadoras de tableros de N x N.
+
+Para un tablero de ``tamano`` x ``tamano`` donde se gana con ``en_linea`` marcas
+seguidas, construye una sola vez todas las líneas (horizontales, verticales y
+las dos diagonales) y, para cada casilla, las líneas que pasan por ella. Así,
+verificar una jugada cuesta lo mismo que revisar las líneas de esa casilla y no
+todo el tablero.
+
+Las casillas se numeran ``fila * tamano + columna``, y cada línea es también una
+máscara de bits con ese orden.
+"""
+
+from functools import cache
+from typing import NamedTuple
+
+_DIRECCIONES: tuple[tuple[int, int], ...] = ((0, 1), (1, 0), (1, 1), (1, -1))
+
+
+class IndiceLineas(NamedTuple):
+    """
+    Líneas ganadoras de un tablero, por casilla.
+
+    Attributes:
+        tamano: Casillas por lado.
+        en_linea: Marcas seguidas necesarias para ganar.
+        lleno: Máscara con todas las casillas.
+        lineas: Máscara de cada línea.
+        por_casilla: Máscaras de las líneas que pasan por cada casilla.
+        coordenadas: Coordenadas (fila, columna) de cada línea.
+        coordenadas_por_casilla: Coordenadas de las líneas que pasan por cada
+            casilla (fila, columna).
+    """
+
+    tamano: int
+    en_linea: int
+    lleno: int
+    lineas: tuple[int, ...]
+    por_casilla: tuple[tuple[int, ...], ...]
+    coordenadas: tuple[list[tuple[int, int]], ...]
+    coordenadas_por_casilla: dict[tuple[int, int], tuple[list[tuple[int, int]], ...]]
+
+
+@cache
+def indice_lineas(tamano: int = 3, en_linea: int | None = None) -> IndiceLineas:
+    """
+    Construye el índice de líneas de un tablero, una vez por combinación.
+
+    Args:
+        tamano: Casillas por lado, por defecto 3.
+        en_linea: Marcas seguidas para ganar; por defecto igual a tamano.
+
+    Returns:
+        El índice de líneas.
+
+    Raises:
+        ValueError: Si en_linea no está entre 1 y tamano.
+    """
+    if en_linea is None:
+        en_linea = tamano
+    if not 1 <= en_linea <= tamano:
+        raise ValueError("Las marcas en línea deben estar entre 1 y el tamaño.")
+
+    coordenadas = []
+    for fila in range(tamano):
+        for columna in range(tamano):
+            for df, dc in _DIRECCIONES:
+                ultima_fila = fila + df * (en_linea - 1)
+                ultima_columna = columna + dc * (en_linea - 1)
+                if 0 <= ultima_fila < tamano and 0 <= ultima_columna < tamano:
+                    coordenadas.append(
+                        [(fila + df * i, columna + dc * i) for i in range(en_linea)]
+                    )
+    # Con en_linea = 1 las cuatro direcciones dan la misma casilla
+    coordenadas = list({tuple(linea): linea for linea in coordenadas}.values())
+
+    lineas = tuple(
+        sum(1 << (f * tamano + c) for f, c in linea) for linea in coordenadas
+    )
+    casillas = [(f, c) for f in range(tamano) for c in range(tamano)]
+    return IndiceLineas(
+        tamano=tamano,
+        en_linea=en_linea,
+        lleno=(1 << tamano * tamano) - 1,
+        lineas=lineas,
+        por_casilla=tuple(
+            tuple(linea for linea in lineas if linea >> (f * tamano + c) & 1)
+            for f, c in casillas
+        ),
+        coordenadas=tuple(coordenadas),
+        coordenadas_por_casilla={
+            casilla: tuple(linea for linea in coordenadas if casilla in linea)
+            for casilla in casillas
+        },
+    )
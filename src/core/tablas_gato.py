@@ -0,0 +1,298 @@
+"""Módulo con las tablas precalculadas de los 3^9 tableros de Gato posibles.
+
+Cada tablero de 3x3 se codifica en base 3 como ``sum(valor_i * 3**i)``, con
+valor 0 para una casilla vacía, 1 para X y 2 para O, y ``i = fila * 3 + columna``.
+Las tablas se construyen una sola vez, se guardan en disco y en los siguientes
+arranques se cargan con mmap en lugar de recalcularse. La cabecera del archivo
+guarda un CRC32 de los datos; si no coincide, las tablas se reconstruyen.
+
+La ubicación del archivo puede cambiarse con la variable de entorno
+``HYPERCAT_CACHE``; por defecto es ``$XDG_CACHE_HOME/hypercat`` o
+``~/.cache/hypercat``.
+"""
+
+import mmap
+import os
+import struct
+import sys
+import tempfile
+import zlib
+from array import array
+from functools import cache
+from pathlib import Path
+from typing import NamedTuple
+
+from src.core.bitboard import GANADORA, LINEAS
+
+CANTIDAD_TABLEROS: int = 3**9
+"""Número de tableros de 3x3 distintos (19683)."""
+
+EN_CURSO, VICTORIA_X, VICTORIA_O, EMPATE = 0, 1, 2, 3
+"""Códigos de la columna ``resultado``."""
+
+POTENCIAS: tuple[int, ...] = tuple(3**i for i in range(9))
+"""Valor posicional de cada casilla [0-8] en la codificación en base 3."""
+
+TERNARIO: tuple[int, ...] = tuple(
+    sum(POTENCIAS[i] for i in range(9) if mascara >> i & 1) for mascara in range(512)
+)
+"""Convierte una máscara de 9 bits en la suma de las potencias de sus bits.
+
+El código de un tablero es ``TERNARIO[bits_x] + 2 * TERNARIO[bits_o]``.
+"""
+
+# Subir la versión al cambiar cómo se construyen las columnas
+_VERSION: int = 2
+_FORMATO_CABECERA: str = "<4sHHII"
+_MAGIA: bytes = b"HCTB"
+_COLUMNAS: tuple[str, ...] = (
+    "resultado",
+    "vacias",
+    "ganadoras_x",
+    "ganadoras_o",
+    "abiertas_x",
+    "abiertas_o",
+    "amenazas_x",
+    "amenazas_o",
+)
+
+
+class TablasGato(NamedTuple):
+    """
+    Columnas de las tablas, indexadas por el código en base 3 del tablero.
+
+    Attributes:
+        resultado: EN_CURSO, VICTORIA_X, VICTORIA_O o EMPATE.
+        vacias: Máscara de 9 bits con las casillas vacías.
+        ganadoras_x: Máscara de las casillas vacías donde X gana al jugar.
+        ganadoras_o: Máscara de las casillas vacías donde O gana al jugar.
+        abiertas_x: Líneas con alguna X y ninguna O.
+        abiertas_o: Líneas con alguna O y ninguna X.
+        amenazas_x: Líneas con dos X y la tercera casilla vacía.
+        amenazas_o: Líneas con dos O y la tercera casilla vacía.
+    """
+
+    resultado: memoryview
+    vacias: memoryview
+    ganadoras_x: memoryview
+    ganadoras_o: memoryview
+    abiertas_x: memoryview
+    abiertas_o: memoryview
+    amenazas_x: memoryview
+    amenazas_o: memoryview
+
+
+def codificar(bits_x: int, bits_o: int) -> int:
+    """
+    Calcula el código en base 3 de un tablero a partir de sus bitboards.
+
+    Args:
+        bits_x: Máscara de las casillas de X.
+        bits_o: Máscara de las casillas de O.
+
+    Returns:
+        El código [0, 3^9) del tablero.
+    """
+    return TERNARIO[bits_x] + 2 * TERNARIO[bits_o]
+
+
+def _decodificar(codigo: int) -> tuple[int, int]:
+    """
+    Obtiene los bitboards de un tablero a partir de su código en base 3.
+
+    Args:
+        codigo: El código del tablero.
+
+    Returns:
+        Una tupla (bits_x, bits_o).
+    """
+    bits_x = bits_o = 0
+    for i in range(9):
+        codigo, valor = divmod(codigo, 3)
+        if valor == 1:
+            bits_x |= 1 << i
+        elif valor == 2:
+            bits_o |= 1 << i
+    return bits_x, bits_o
+
+
+def _ganadoras(propias: int, vacias: int) -> int:
+    """
+    Calcula las casillas vacías que completan una línea para un jugador.
+
+    Args:
+        propias: Máscara de las casillas del jugador.
+        vacias: Máscara de las casillas vacías.
+
+    Returns:
+        La máscara de las casillas ganadoras.
+    """
+    ganadoras = 0
+    for linea in LINEAS:
+        faltante = linea & ~propias
+        if faltante.bit_count() == 1 and faltante & vacias:
+            ganadoras |= faltante
+    return ganadoras
+
+
+def construir_columnas() -> list[array]:
+    """
+    Calcula todas las columnas de las tablas.
+
+    Returns:
+        Una lista con un array de enteros sin signo de 16 bits por columna,
+        en el orden de TablasGato.
+    """
+    columnas = [array("H", bytes(2 * CANTIDAD_TABLEROS)) for _ in _COLUMNAS]
+    (
+        resultado,
+        vacias,
+        ganadoras_x,
+        ganadoras_o,
+        abiertas_x,
+        abiertas_o,
+        amenazas_x,
+        amenazas_o,
+    ) = columnas
+
+    for codigo in range(CANTIDAD_TABLEROS):
+        x, o = _decodificar(codigo)
+        libres = 0b111_111_111 & ~(x | o)
+
+        if GANADORA[x]:
+            resultado[codigo] = VICTORIA_X
+        elif GANADORA[o]:
+            resultado[codigo] = VICTORIA_O
+        elif not libres:
+            resultado[codigo] = EMPATE
+
+        vacias[codigo] = libres
+        ganadoras_x[codigo] = _ganadoras(x, libres)
+        ganadoras_o[codigo] = _ganadoras(o, libres)
+        for linea in LINEAS:
+            if x & linea and not o & linea:
+                abiertas_x[codigo] += 1
+                amenazas_x[codigo] += (x & linea).bit_count() == 2
+            elif o & linea and not x & linea:
+                abiertas_o[codigo] += 1
+                amenazas_o[codigo] += (o & linea).bit_count() == 2
+
+    return columnas
+
+
+def ruta_cache() -> Path:
+    """
+    Obtiene la ruta del archivo donde se guardan las tablas.
+
+    Returns:
+        La ruta del archivo de caché.
+    """
+    if directorio := os.environ.get("HYPERCAT_CACHE"):
+        return Path(directorio) / "tablas_gato.bin"
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "hypercat" / "tablas_gato.bin"
+
+
+def _cabecera(crc: int) -> bytes:
+    """
+    Construye la cabecera que identifica un archivo de tablas válido.
+
+    Args:
+        crc: El CRC32 de los datos que siguen a la cabecera.
+
+    Returns:
+        Los bytes de la cabecera (incluye la versión, el orden de bytes y el
+        CRC32 de los datos).
+    """
+    orden = 0 if sys.byteorder == "little" else 1
+    return struct.pack(
+        _FORMATO_CABECERA, _MAGIA, _VERSION, orden, CANTIDAD_TABLEROS, crc
+    )
+
+
+def guardar(ruta: Path, columnas: list[array]) -> None:
+    """
+    Escribe las tablas en disco de forma atómica.
+
+    Args:
+        ruta: La ruta del archivo de destino.
+        columnas: Las columnas devueltas por construir_columnas().
+    """
+    ruta.parent.mkdir(parents=True, exist_ok=True)
+    descriptor, temporal = tempfile.mkstemp(dir=ruta.parent, suffix=".tmp")
+    try:
+        crc = 0
+        for columna in columnas:
+            crc = zlib.crc32(columna, crc)
+        with os.fdopen(descriptor, "wb") as archivo:
+            archivo.write(_cabecera(crc))
+            for columna in columnas:
+                columna.tofile(archivo)
+        os.replace(temporal, ruta)
+    except BaseException:
+        os.unlink(temporal)
+        raise
+
+
+def _mapear(ruta: Path) -> TablasGato | None:
+    """
+    Carga las tablas de un archivo mediante mmap, sin copiarlas a memoria.
+
+    Args:
+        ruta: La ruta del archivo de tablas.
+
+    Returns:
+        Las tablas, o None si el archivo no existe, no es de esta versión o
+        sus datos no coinciden con el CRC32 de la cabecera.
+    """
+    largo = struct.calcsize(_FORMATO_CABECERA)
+    tamano = largo + 2 * CANTIDAD_TABLEROS * len(_COLUMNAS)
+    try:
+        with open(ruta, "rb") as archivo:
+            mapa = mmap.mmap(archivo.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        return None
+
+    valido = len(mapa) == tamano
+    if valido:
+        with memoryview(mapa) as vista:
+            cabecera = _cabecera(zlib.crc32(vista[largo:]))
+        valido = mapa[:largo] == cabecera
+    if not valido:
+        mapa.close()
+        return None
+
+    datos = memoryview(mapa)[largo:].cast("H")
+    return TablasGato(
+        *(
+            datos[i * CANTIDAD_TABLEROS : (i + 1) * CANTIDAD_TABLEROS]
+            for i in range(len(_COLUMNAS))
+        )
+    )
+
+
+@cache
+def cargar_tablas() -> TablasGato:
+    """
+    Obtiene las tablas, cargándolas de la caché en disco o construyéndolas.
+
+    La primera llamada del proceso mapea el archivo de caché; si no existe o
+    está desactualizado, construye las tablas y lo escribe. Si no se puede
+    escribir en disco, las tablas quedan solo en memoria.
+
+    Returns:
+        Las tablas de los 3^9 tableros.
+    """
+    ruta = ruta_cache()
+    if (tablas := _mapear(ruta)) is not None:
+        return tablas
+
+    columnas = construir_columnas()
+    try:
+        guardar(ruta, columnas)
+    except OSError:
+        return TablasGato(*(memoryview(columna) for columna in columnas))
+
+    if (tablas := _mapear(ruta)) is not None:
+        return tablas
+    return TablasGato(*(memoryview(columna) for columna in columnas))
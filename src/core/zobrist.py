@@ -0,0 +1,124 @@
+"""Módulo con las claves aleatorias para el hashing Zobrist de HyperCat.
+
+El hash de una posición es el XOR de una clave por cada casilla ocupada, por
+cada sub-tablero ganado, por el sub-tablero obligatorio y por el turno de O.
+Como el XOR es su propia inversa, cada jugada actualiza el hash en O(1).
+
+Las casillas usan el mismo índice que EstadoHyperCat:
+``(fila * 3 + columna) * 9 + subfila * 3 + subcolumna``. Los tableros de N x N
+usan las claves de claves(), con el índice
+``(fila * N + columna) * N² + subfila * N + subcolumna``.
+"""
+
+import random
+from functools import cache
+from typing import NamedTuple
+
+
+def _xor_de_bits(mascara: int, claves: tuple[int, ...]) -> int:
+    """
+    Combina con XOR las claves de los bits encendidos de una máscara.
+
+    Args:
+        mascara: La máscara de bits.
+        claves: Las claves, una por bit a partir del bit 0.
+
+    Returns:
+        El XOR de las claves seleccionadas.
+    """
+    resultado = 0
+    for i, clave in enumerate(claves):
+        if mascara >> i & 1:
+            resultado ^= clave
+    return resultado
+
+
+SEMILLA: int = 0x4879_7065_7243_6174
+"""Semilla fija para que los hashes sean reproducibles entre ejecuciones."""
+
+_generador = random.Random(SEMILLA)
+
+CASILLAS: tuple[tuple[int, ...], tuple[int, ...]] = tuple(
+    tuple(_generador.getrandbits(64) for _ in range(81)) for _ in range(2)
+)
+"""Claves por jugador (0 para X, 1 para O) y por casilla [0-80]."""
+
+GANADOS: tuple[tuple[int, ...], tuple[int, ...]] = tuple(
+    tuple(_generador.getrandbits(64) for _ in range(9)) for _ in range(2)
+)
+"""Claves por jugador (0 para X, 1 para O) y por sub-tablero ganado [0-8]."""
+
+FORZADO: tuple[int, ...] = tuple(_generador.getrandbits(64) for _ in range(10))
+"""Claves por sub-tablero obligatorio [0-8]; el índice -1 representa elegir cualquiera."""
+
+TURNO_O: int = _generador.getrandbits(64)
+"""Clave que se incluye cuando le toca mover a O."""
+
+del _generador
+
+SUB_TABLEROS: tuple[tuple[tuple[int, ...], ...], ...] = tuple(
+    tuple(
+        tuple(
+            _xor_de_bits(
+                mascara, CASILLAS[jugador][9 * sub_tablero : 9 * sub_tablero + 9]
+            )
+            for mascara in range(512)
+        )
+        for sub_tablero in range(9)
+    )
+    for jugador in range(2)
+)
+"""Hash combinado de todas las casillas de una máscara de 9 bits, por jugador y
+sub-tablero, para quitar un sub-tablero completo del hash en O(1)."""
+
+
+class ClavesZobrist(NamedTuple):
+    """
+    Claves Zobrist de un HyperCat con sub-tableros de N x N.
+
+    Attributes:
+        casillas: Claves por jugador y por casilla [0, N⁴).
+        ganados: Claves por jugador y por sub-tablero ganado [0, N²).
+        forzado: Claves por sub-tablero obligatorio; el índice -1 representa
+            elegir cualquiera.
+        turno_o: Clave que se incluye cuando le toca mover a O.
+    """
+
+    casillas: tuple[tuple[int, ...], tuple[int, ...]]
+    ganados: tuple[tuple[int, ...], tuple[int, ...]]
+    forzado: tuple[int, ...]
+    turno_o: int
+
+
+@cache
+def claves(tamano: int = 3) -> ClavesZobrist:
+    """
+    Obtiene las claves Zobrist para sub-tableros de N x N.
+
+    Para 3 devuelve las constantes del módulo, de modo que los hashes coinciden
+    con los de EstadoHyperCat; para otros tamaños genera claves nuevas a partir
+    de SEMILLA.
+
+    Args:
+        tamano: Casillas por lado de cada sub-tablero, por defecto 3.
+
+    Returns:
+        Las claves del tamaño pedido.
+    """
+    if tamano == 3:
+        return ClavesZobrist(CASILLAS, GANADOS, FORZADO, TURNO_O)
+
+    generador = random.Random(SEMILLA + tamano)
+    sub_tableros = tamano * tamano
+    return ClavesZobrist(
+        casillas=tuple(
+            tuple(generador.getrandbits(64) for _ in range(sub_tableros**2))
+            for _ in range(2)
+        ),
+        ganados=tuple(
+            tuple(generador.getrandbits(64) for _ in range(sub_tableros))
+            for _ in range(2)
+        ),
+        forzado=tuple(generador.getrandbits(64) for _ in range(sub_tableros + 1)),
+        turno_o=generador.getrandbits(64),
+    )
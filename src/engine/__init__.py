@@ -0,0 +1,5 @@
+"""Paquete con los motores de búsqueda para jugar HyperCat automáticamente."""
+
+from .alfa_beta import MotorAlfaBeta, ResultadoBusqueda, evaluar
+from .mcts import MotorMCTS, ResultadoMCTS
+from .transposicion import EntradaTransposicion, TablaTransposicion
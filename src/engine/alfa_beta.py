@@ -0,0 +1,396 @@
+"""Módulo con el motor de búsqueda alfa-beta con profundización iterativa."""
+
+import time
+from typing import NamedTuple
+
+from src.core import EstadoHyperCat, HyperCat
+from src.core.bitboard import GANADORA
+from src.core.estado_hyper_cat import coordenadas
+from src.core.tablas_gato import CANTIDAD_TABLEROS, TERNARIO, cargar_tablas
+from src.enums import Resultado, TipoCota
+
+from .transposicion import TablaTransposicion
+
+GANAR: float = 1_000_000.0
+"""Valor de una victoria; las victorias más rápidas valen un poco más."""
+
+_UMBRAL_VICTORIA: float = GANAR - 1_000
+
+_PESO_LINEA: float = 1.0
+"""Valor de una línea de un sub-tablero con marcas propias y ninguna del rival."""
+
+_PESO_AMENAZA: float = 3.0
+"""Valor adicional de esa línea cuando ya tiene dos marcas propias."""
+
+_PESO_LINEA_MACRO: float = 30.0
+"""Valor de una línea del tablero principal con sub-tableros ganados propios."""
+
+_PESO_AMENAZA_MACRO: float = 90.0
+"""Valor adicional de esa línea cuando ya tiene dos sub-tableros ganados."""
+
+
+def _tabla_potencial(peso_linea: float, peso_amenaza: float) -> tuple[float, ...]:
+    """
+    Combina las columnas de tablas_gato en el potencial de cada tablero de 3x3.
+
+    Args:
+        peso_linea: Valor de cada línea abierta.
+        peso_amenaza: Valor adicional de cada línea abierta con dos marcas.
+
+    Returns:
+        El potencial de X menos el de O, indexado por el código del tablero.
+    """
+    tablas = cargar_tablas()
+    return tuple(
+        peso_linea * (tablas.abiertas_x[codigo] - tablas.abiertas_o[codigo])
+        + peso_amenaza * (tablas.amenazas_x[codigo] - tablas.amenazas_o[codigo])
+        for codigo in range(CANTIDAD_TABLEROS)
+    )
+
+
+_POTENCIAL: tuple[float, ...] = _tabla_potencial(_PESO_LINEA, _PESO_AMENAZA)
+_POTENCIAL_MACRO: tuple[float, ...] = _tabla_potencial(
+    _PESO_LINEA_MACRO, _PESO_AMENAZA_MACRO
+)
+
+_VALOR_SUB_TABLERO: float = 25.0
+_PESO_POSICION: tuple[float, ...] = (1.2, 1.0, 1.2, 1.0, 1.5, 1.0, 1.2, 1.0, 1.2)
+"""Importancia de cada sub-tablero (o casilla) según su posición."""
+
+
+class TiempoAgotadoError(Exception):
+    """Se agotó el tiempo de la búsqueda (uso interno del motor)."""
+
+
+class ResultadoBusqueda(NamedTuple):
+    """
+    Resultado de una búsqueda del motor.
+
+    Attributes:
+        movimiento: Mejor movimiento en coordenadas globales (fila, columna)
+            [0-8], o None si la partida ya terminó.
+        valor: Evaluación de la posición desde el punto de vista del jugador
+            al que le toca mover.
+        profundidad: Última profundidad completada.
+        nodos: Nodos visitados durante toda la búsqueda.
+        tiempo: Segundos empleados.
+        variante_principal: Secuencia de movimientos esperada, en coordenadas
+            globales, empezando por ``movimiento``.
+    """
+
+    movimiento: tuple[int, int] | None
+    valor: float
+    profundidad: int
+    nodos: int
+    tiempo: float
+    variante_principal: list[tuple[int, int]]
+
+    @property
+    def nodos_por_segundo(self) -> float:
+        """
+        Calcula la velocidad de la búsqueda.
+
+        Returns:
+            Nodos visitados por segundo.
+        """
+        return self.nodos / self.tiempo if self.tiempo > 0 else 0.0
+
+
+def evaluar(estado: EstadoHyperCat) -> float:
+    """
+    Evalúa heurísticamente una posición no terminada.
+
+    Combina las líneas abiertas del tablero principal, los sub-tableros
+    ganados y las líneas abiertas dentro de cada sub-tablero en juego; las
+    líneas de cada tablero de 3x3 se obtienen de las tablas de tablas_gato.
+
+    Args:
+        estado: La posición a evaluar.
+
+    Returns:
+        La evaluación desde el punto de vista del jugador al que le toca mover.
+    """
+    gx, go = estado.ganados_x, estado.ganados_o
+    valor = _POTENCIAL_MACRO[TERNARIO[gx] + 2 * TERNARIO[go]]
+
+    cerrados = gx | go
+    tableros = estado.tableros
+    for s in range(9):
+        if cerrados >> s & 1:
+            signo = 1.0 if gx >> s & 1 else -1.0
+            valor += signo * _VALOR_SUB_TABLERO * _PESO_POSICION[s]
+        else:
+            codigo = TERNARIO[tableros[s]] + 2 * TERNARIO[tableros[9 + s]]
+            if codigo:
+                valor += _POTENCIAL[codigo] * _PESO_POSICION[s]
+
+    return valor if estado.turno == 0 else -valor
+
+
+class MotorAlfaBeta:
+    """
+    Motor negamax con poda alfa-beta y profundización iterativa.
+
+    Busca sobre EstadoHyperCat, ordena los movimientos (primero el de la tabla
+    de transposición, luego los que ganan un sub-tablero y al final los que
+    dejan elegir cualquier sub-tablero al rival) y respeta un límite estricto
+    de tiempo por jugada: si se agota, devuelve lo hallado en la última
+    profundidad completada.
+
+    Attributes:
+        tiempo_limite: Segundos disponibles por jugada.
+        profundidad_maxima: Profundidad a la que se detiene la profundización.
+        tabla: Tabla de transposición compartida entre búsquedas.
+    """
+
+    tiempo_limite: float
+    profundidad_maxima: int
+    tabla: TablaTransposicion
+
+    def __init__(
+        self,
+        tiempo_limite: float = 0.1,
+        profundidad_maxima: int = 64,
+        tabla: TablaTransposicion | None = None,
+    ) -> None:
+        """
+        Inicializa el motor.
+
+        Args:
+            tiempo_limite: Segundos disponibles por jugada, por defecto 0.1.
+            profundidad_maxima: Profundidad máxima de búsqueda, por defecto 64.
+            tabla: Tabla de transposición a usar; si es None se crea una nueva.
+        """
+        self.tiempo_limite = tiempo_limite
+        self.profundidad_maxima = profundidad_maxima
+        self.tabla = tabla if tabla is not None else TablaTransposicion()
+        self._nodos = 0
+        self._limite = 0.0
+        self._vp: list[list[int]] = []
+
+    def buscar(self, juego: HyperCat | EstadoHyperCat) -> ResultadoBusqueda:
+        """
+        Busca el mejor movimiento para el jugador al que le toca mover.
+
+        Args:
+            juego: La posición a analizar; no se modifica.
+
+        Returns:
+            El ResultadoBusqueda de la última profundidad completada.
+        """
+        inicio = time.perf_counter()
+        self._limite = inicio + self.tiempo_limite
+        self._nodos = 0
+
+        if isinstance(juego, HyperCat):
+            raiz = EstadoHyperCat.desde_hyper_cat(juego)
+        else:
+            raiz = juego.copiar()
+
+        legales = raiz.movimientos_legales()
+        if not legales:
+            return ResultadoBusqueda(None, 0.0, 0, 0, 0.0, [])
+
+        self.tabla.nueva_busqueda()
+        mejor_vp = [(legales & -legales).bit_length() - 1]
+        mejor_valor = 0.0
+        profundidad_completada = 0
+
+        for profundidad in range(1, self.profundidad_maxima + 1):
+            self._vp = [[] for _ in range(profundidad + 1)]
+            try:
+                valor = self._negamax(raiz, profundidad, -GANAR - 1, GANAR + 1, 0)
+            except TiempoAgotadoError:
+                break
+            mejor_valor = valor
+            mejor_vp = self._vp[0]
+            profundidad_completada = profundidad
+            # Con la victoria o derrota asegurada no tiene sentido seguir
+            if abs(valor) >= _UMBRAL_VICTORIA:
+                break
+
+        return ResultadoBusqueda(
+            movimiento=coordenadas(mejor_vp[0]),
+            valor=mejor_valor,
+            profundidad=profundidad_completada,
+            nodos=self._nodos,
+            tiempo=time.perf_counter() - inicio,
+            variante_principal=[coordenadas(m) for m in mejor_vp],
+        )
+
+    def elegir_movimiento(self, juego: HyperCat | EstadoHyperCat) -> tuple[int, int]:
+        """
+        Obtiene solo el mejor movimiento de una búsqueda.
+
+        Args:
+            juego: La posición a analizar.
+
+        Returns:
+            El movimiento en coordenadas globales (fila, columna) [0-8].
+
+        Raises:
+            ValueError: Si la partida ya terminó.
+        """
+        movimiento = self.buscar(juego).movimiento
+        if movimiento is None:
+            raise ValueError("La partida ya terminó, no hay movimientos.")
+        return movimiento
+
+    def _negamax(
+        self,
+        estado: EstadoHyperCat,
+        profundidad: int,
+        alfa: float,
+        beta: float,
+        ply: int,
+    ) -> float:
+        """
+        Búsqueda negamax con poda alfa-beta.
+
+        Args:
+            estado: La posición actual.
+            profundidad: Profundidad restante.
+            alfa: Cota inferior de la ventana.
+            beta: Cota superior de la ventana.
+            ply: Distancia a la raíz.
+
+        Returns:
+            El valor de la posición para el jugador al que le toca mover.
+
+        Raises:
+            TiempoAgotadoError: Si se superó el tiempo límite.
+        """
+        self._nodos += 1
+        if self._nodos & 31 == 0 and time.perf_counter() >= self._limite:
+            raise TiempoAgotadoError()
+
+        self._vp[ply] = []
+
+        if estado.resultado is not Resultado.EN_CURSO:
+            # Quien acaba de mover ganó o la partida es un empate
+            if estado.resultado is Resultado.EMPATE:
+                return 0.0
+            return -(GANAR - ply)
+
+        if profundidad == 0:
+            return evaluar(estado)
+
+        alfa_original = alfa
+        movimiento_tabla = None
+        entrada = self.tabla.buscar(estado.hash_zobrist)
+        if entrada is not None:
+            movimiento_tabla = entrada.mejor_movimiento
+            if entrada.profundidad >= profundidad and ply > 0:
+                valor = _desde_tabla(entrada.valor, ply)
+                if entrada.cota is TipoCota.EXACTA:
+                    return valor
+                if entrada.cota is TipoCota.INFERIOR:
+                    alfa = max(alfa, valor)
+                else:
+                    beta = min(beta, valor)
+                if alfa >= beta:
+                    return valor
+
+        mejor_valor = -GANAR - 1
+        mejor_movimiento = None
+        for movimiento in self._ordenar(estado, movimiento_tabla):
+            hijo = estado.copiar()
+            hijo.jugar(movimiento)
+            valor = -self._negamax(hijo, profundidad - 1, -beta, -alfa, ply + 1)
+
+            if valor > mejor_valor:
+                mejor_valor = valor
+                mejor_movimiento = movimiento
+                if valor > alfa:
+                    alfa = valor
+                    self._vp[ply] = [movimiento] + self._vp[ply + 1]
+                    if alfa >= beta:
+                        break
+
+        if mejor_valor <= alfa_original:
+            cota = TipoCota.SUPERIOR
+        elif mejor_valor >= beta:
+            cota = TipoCota.INFERIOR
+        else:
+            cota = TipoCota.EXACTA
+        self.tabla.guardar(
+            estado.hash_zobrist,
+            profundidad,
+            _hacia_tabla(mejor_valor, ply),
+            cota,
+            mejor_movimiento,
+        )
+        return mejor_valor
+
+    def _ordenar(
+        self, estado: EstadoHyperCat, movimiento_tabla: int | None
+    ) -> list[int]:
+        """
+        Ordena los movimientos legales para maximizar las podas.
+
+        Args:
+            estado: La posición actual.
+            movimiento_tabla: Mejor movimiento según la tabla de transposición.
+
+        Returns:
+            Los índices de los movimientos legales, de más a menos prometedor.
+        """
+        legales = estado.movimientos_legales()
+        propios = estado.tableros[9 * estado.turno :]
+        cerrados = estado.ganados_x | estado.ganados_o
+        puntuados = []
+
+        while legales:
+            bit = legales & -legales
+            legales ^= bit
+            movimiento = bit.bit_length() - 1
+            s, casilla = divmod(movimiento, 9)
+
+            puntaje = _PESO_POSICION[casilla]
+            if movimiento == movimiento_tabla:
+                puntaje += 1_000.0
+            if GANADORA[propios[s] | (1 << casilla)]:
+                puntaje += 100.0
+            if cerrados >> casilla & 1 and casilla != s:
+                # El rival podrá elegir cualquier sub-tablero
+                puntaje -= 10.0
+            puntuados.append((puntaje, movimiento))
+
+        puntuados.sort(reverse=True)
+        return [movimiento for _, movimiento in puntuados]
+
+
+def _hacia_tabla(valor: float, ply: int) -> float:
+    """
+    Convierte un valor de victoria relativo a la raíz en relativo al nodo.
+
+    Args:
+        valor: El valor calculado en el nodo.
+        ply: Distancia del nodo a la raíz.
+
+    Returns:
+        El valor a guardar en la tabla de transposición.
+    """
+    if valor >= _UMBRAL_VICTORIA:
+        return valor + ply
+    if valor <= -_UMBRAL_VICTORIA:
+        return valor - ply
+    return valor
+
+
+def _desde_tabla(valor: float, ply: int) -> float:
+    """
+    Convierte un valor de victoria guardado en la tabla al ply del nodo actual.
+
+    Args:
+        valor: El valor guardado en la tabla de transposición.
+        ply: Distancia del nodo a la raíz.
+
+    Returns:
+        El valor relativo a la raíz.
+    """
+    if valor >= _UMBRAL_VICTORIA:
+        return valor - ply
+    if valor <= -_UMBRAL_VICTORIA:
+        return valor + ply
+    return valor
@@ -0,0 +1,373 @@
+"""Módulo con el motor de búsqueda Monte Carlo (UCT) con paralelismo en la raíz."""
+
+import math
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import NamedTuple
+
+from src.core import EstadoHyperCat, HyperCat
+from src.core.estado_hyper_cat import coordenadas, indices_de
+from src.enums import Resultado
+
+_VICTORIAS: tuple[Resultado, Resultado] = (Resultado.VICTORIA_X, Resultado.VICTORIA_O)
+
+
+class ResultadoMCTS(NamedTuple):
+    """
+    Resultado de una búsqueda Monte Carlo.
+
+    Attributes:
+        movimiento: Movimiento más visitado en coordenadas globales (fila,
+            columna) [0-8], o None si la partida ya terminó.
+        visitas: Visitas acumuladas de cada movimiento de la raíz, sumando los
+            árboles de todos los procesos.
+        simulaciones: Simulaciones realizadas en total.
+        tiempo: Segundos empleados.
+    """
+
+    movimiento: tuple[int, int] | None
+    visitas: dict[tuple[int, int], int]
+    simulaciones: int
+    tiempo: float
+
+    @property
+    def simulaciones_por_segundo(self) -> float:
+        """
+        Calcula la velocidad de la búsqueda.
+
+        Returns:
+            Simulaciones realizadas por segundo.
+        """
+        return self.simulaciones / self.tiempo if self.tiempo > 0 else 0.0
+
+
+class _Nodo:
+    """
+    Nodo del árbol de búsqueda.
+
+    Attributes:
+        padre: Nodo padre, None en la raíz.
+        movimiento: Movimiento que llevó a este nodo.
+        jugador: Jugador (0 para X, 1 para O) que hizo ese movimiento.
+        hijos: Nodos hijos ya expandidos.
+        sin_explorar: Movimientos legales aún no expandidos.
+        visitas: Simulaciones que pasaron por el nodo.
+        puntos: Puntos obtenidos por ``jugador`` en esas simulaciones.
+    """
+
+    __slots__ = (
+        "padre",
+        "movimiento",
+        "jugador",
+        "hijos",
+        "sin_explorar",
+        "visitas",
+        "puntos",
+    )
+
+    def __init__(
+        self,
+        padre: "_Nodo | None",
+        movimiento: int,
+        jugador: int,
+        estado: EstadoHyperCat,
+    ) -> None:
+        """
+        Inicializa un nodo sin visitas.
+
+        Args:
+            padre: Nodo padre, None en la raíz.
+            movimiento: Movimiento que llevó a este nodo.
+            jugador: Jugador que hizo ese movimiento.
+            estado: Posición del nodo, usada para obtener sus movimientos legales.
+        """
+        self.padre = padre
+        self.movimiento = movimiento
+        self.jugador = jugador
+        self.hijos: list[_Nodo] = []
+        self.sin_explorar = indices_de(estado.movimientos_legales())
+        self.visitas = 0
+        self.puntos = 0.0
+
+    def seleccionar(self, exploracion: float) -> "_Nodo":
+        """
+        Elige el hijo con mayor cota UCT.
+
+        Args:
+            exploracion: Constante de exploración de UCT.
+
+        Returns:
+            El hijo seleccionado.
+        """
+        log_visitas = math.log(self.visitas)
+        return max(
+            self.hijos,
+            key=lambda hijo: hijo.puntos / hijo.visitas
+            + exploracion * math.sqrt(log_visitas / hijo.visitas),
+        )
+
+
+def simular(estado: EstadoHyperCat, generador: random.Random) -> Resultado:
+    """
+    Juega movimientos aleatorios hasta terminar la partida.
+
+    Usa el camino rápido de EstadoHyperCat, sin excepciones.
+
+    Args:
+        estado: La posición inicial; se modifica.
+        generador: Generador de números aleatorios.
+
+    Returns:
+        El resultado final de la partida.
+    """
+    while estado.resultado is Resultado.EN_CURSO:
+        estado.jugar(generador.choice(indices_de(estado.movimientos_legales())))
+    return estado.resultado
+
+
+def buscar_arbol(
+    raiz: EstadoHyperCat,
+    simulaciones: int,
+    exploracion: float,
+    semilla: int | None,
+    tiempo_limite: float | None = None,
+) -> dict[int, int]:
+    """
+    Construye un árbol UCT independiente desde una posición.
+
+    Es la unidad de trabajo de cada proceso en la paralelización por raíz.
+
+    Args:
+        raiz: La posición a analizar.
+        simulaciones: Número máximo de simulaciones a realizar.
+        exploracion: Constante de exploración de UCT.
+        semilla: Semilla del generador aleatorio de este árbol.
+        tiempo_limite: Segundos tras los que se detiene aunque queden
+            simulaciones, o None para hacerlas todas. Siempre hace al menos una.
+
+    Returns:
+        Las visitas de cada movimiento de la raíz, por índice [0-80].
+    """
+    generador = random.Random(semilla)
+    arbol = _Nodo(None, -1, raiz.turno ^ 1, raiz)
+    limite = None if tiempo_limite is None else time.perf_counter() + tiempo_limite
+
+    for n in range(simulaciones):
+        # Consultar el reloj cada 16 simulaciones mantiene bajo su costo
+        if limite is not None and n & 15 == 0 and n and time.perf_counter() >= limite:
+            break
+        nodo = arbol
+        estado = raiz.copiar()
+
+        # Selección
+        while not nodo.sin_explorar and nodo.hijos:
+            nodo = nodo.seleccionar(exploracion)
+            estado.jugar(nodo.movimiento)
+
+        # Expansión
+        if nodo.sin_explorar:
+            i = generador.randrange(len(nodo.sin_explorar))
+            nodo.sin_explorar[i], nodo.sin_explorar[-1] = (
+                nodo.sin_explorar[-1],
+                nodo.sin_explorar[i],
+            )
+            movimiento = nodo.sin_explorar.pop()
+            jugador = estado.turno
+            estado.jugar(movimiento)
+            hijo = _Nodo(nodo, movimiento, jugador, estado)
+            nodo.hijos.append(hijo)
+            nodo = hijo
+
+        # Simulación
+        resultado = simular(estado, generador)
+
+        # Retropropagación
+        while nodo is not None:
+            nodo.visitas += 1
+            if resultado is _VICTORIAS[nodo.jugador]:
+                nodo.puntos += 1.0
+            elif resultado is Resultado.EMPATE:
+                nodo.puntos += 0.5
+            nodo = nodo.padre
+
+    return {hijo.movimiento: hijo.visitas for hijo in arbol.hijos}
+
+
+class MotorMCTS:
+    """
+    Motor Monte Carlo Tree Search (UCT) con paralelismo en la raíz.
+
+    Cada proceso construye un árbol independiente con su propia semilla y
+    parte del presupuesto de simulaciones; al final se suman las visitas de
+    los movimientos de la raíz y se elige el más visitado. Como los árboles no
+    comparten estado, el rendimiento escala casi linealmente con los núcleos.
+
+    Puede usarse como context manager para liberar el pool de procesos.
+
+    Attributes:
+        simulaciones: Presupuesto total de simulaciones por jugada.
+        procesos: Número de árboles independientes (y procesos) a usar.
+        exploracion: Constante de exploración de UCT.
+        semilla: Semilla base, o None para resultados no deterministas.
+        tiempo_limite: Segundos por jugada, o None para agotar el presupuesto de
+            simulaciones.
+    """
+
+    simulaciones: int
+    procesos: int
+    exploracion: float
+    semilla: int | None
+    tiempo_limite: float | None
+
+    def __init__(
+        self,
+        simulaciones: int = 10_000,
+        procesos: int = 1,
+        exploracion: float = math.sqrt(2),
+        semilla: int | None = None,
+        tiempo_limite: float | None = None,
+    ) -> None:
+        """
+        Inicializa el motor.
+
+        Args:
+            simulaciones: Presupuesto total de simulaciones, por defecto 10000.
+            procesos: Número de procesos; con 1 se busca en el proceso actual.
+            exploracion: Constante de exploración de UCT, por defecto raíz de 2.
+            semilla: Semilla base para reproducir las búsquedas.
+            tiempo_limite: Segundos por jugada; la búsqueda termina al agotarse
+                el tiempo o las simulaciones, lo que ocurra primero.
+
+        Raises:
+            ValueError: Si simulaciones o procesos no son positivos.
+        """
+        if simulaciones <= 0 or procesos <= 0:
+            raise ValueError("Las simulaciones y los procesos deben ser positivos.")
+
+        self.simulaciones = simulaciones
+        self.procesos = procesos
+        self.exploracion = exploracion
+        self.semilla = semilla
+        self.tiempo_limite = tiempo_limite
+        self._pool: ProcessPoolExecutor | None = None
+        self._busquedas = 0
+
+    def buscar(self, juego: HyperCat | EstadoHyperCat) -> ResultadoMCTS:
+        """
+        Busca el mejor movimiento para el jugador al que le toca mover.
+
+        Args:
+            juego: La posición a analizar; no se modifica.
+
+        Returns:
+            El ResultadoMCTS con las visitas combinadas de todos los árboles.
+        """
+        inicio = time.perf_counter()
+        if isinstance(juego, HyperCat):
+            raiz = EstadoHyperCat.desde_hyper_cat(juego)
+        else:
+            raiz = juego.copiar()
+
+        if not raiz.movimientos_legales():
+            return ResultadoMCTS(None, {}, 0, 0.0)
+
+        semillas = self._semillas()
+        cuotas = [
+            self.simulaciones // self.procesos + (i < self.simulaciones % self.procesos)
+            for i in range(self.procesos)
+        ]
+
+        if self.procesos == 1:
+            parciales = [
+                buscar_arbol(
+                    raiz, cuotas[0], self.exploracion, semillas[0], self.tiempo_limite
+                )
+            ]
+        else:
+            if self._pool is None:
+                self._pool = ProcessPoolExecutor(max_workers=self.procesos)
+            parciales = list(
+                self._pool.map(
+                    buscar_arbol,
+                    [raiz] * self.procesos,
+                    cuotas,
+                    [self.exploracion] * self.procesos,
+                    semillas,
+                    [self.tiempo_limite] * self.procesos,
+                )
+            )
+
+        visitas: dict[int, int] = {}
+        for parcial in parciales:
+            for movimiento, n in parcial.items():
+                visitas[movimiento] = visitas.get(movimiento, 0) + n
+
+        mejor = max(visitas, key=visitas.__getitem__)
+        return ResultadoMCTS(
+            movimiento=coordenadas(mejor),
+            visitas={coordenadas(m): n for m, n in visitas.items()},
+            simulaciones=sum(visitas.values()),
+            tiempo=time.perf_counter() - inicio,
+        )
+
+    def elegir_movimiento(self, juego: HyperCat | EstadoHyperCat) -> tuple[int, int]:
+        """
+        Obtiene solo el mejor movimiento de una búsqueda.
+
+        Args:
+            juego: La posición a analizar.
+
+        Returns:
+            El movimiento en coordenadas globales (fila, columna) [0-8].
+
+        Raises:
+            ValueError: Si la partida ya terminó.
+        """
+        movimiento = self.buscar(juego).movimiento
+        if movimiento is None:
+            raise ValueError("La partida ya terminó, no hay movimientos.")
+        return movimiento
+
+    def _semillas(self) -> list[int | None]:
+        """
+        Genera una semilla distinta para cada árbol de la búsqueda.
+
+        Returns:
+            Una semilla por proceso, o None en todos si el motor no tiene semilla.
+        """
+        self._busquedas += 1
+        if self.semilla is None:
+            return [None] * self.procesos
+        return [
+            hash((self.semilla, self._busquedas, i)) & 0xFFFF_FFFF
+            for i in range(self.procesos)
+        ]
+
+    def cerrar(self) -> None:
+        """Libera el pool de procesos, si se creó."""
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+    def __enter__(self):
+        """
+        Método de entrada para usar MotorMCTS como context manager.
+
+        Returns:
+            La instancia del motor.
+        """
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """
+        Método de salida para usar MotorMCTS como context manager.
+
+        Libera el pool de procesos al salir del contexto.
+
+        Args:
+            exc_type: Tipo de excepción si ocurrió una.
+            exc_value: Valor de la excepción si ocurrió una.
+            traceback: Traceback de la excepción si ocurrió una.
+        """
+        self.cerrar()
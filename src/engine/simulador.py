@@ -0,0 +1,263 @@
+"""Módulo con el simulador vectorizado de partidas aleatorias de HyperCat.
+
+Requiere NumPy (``pip install numpy`` o el grupo opcional ``simulacion``).
+"""
+
+import numpy as np
+
+from src.core import CUALQUIERA, EstadoHyperCat
+from src.core.bitboard import LINEAS
+from src.enums import Resultado
+
+VACIA, X, O, EMPATE = 0, 1, 2, 3
+"""Códigos usados en los arreglos: casillas, resultados de sub-tableros y partidas."""
+
+SUB_DE_CASILLA: np.ndarray = np.arange(81) // 9
+"""Sub-tablero [0-8] al que pertenece cada índice de casilla [0-80]."""
+
+_CASILLAS_SUB: np.ndarray = np.arange(9)
+_LINEAS: np.ndarray = np.array(
+    [[i for i in range(9) if linea >> i & 1] for linea in LINEAS], dtype=np.intp
+)
+"""Índices locales [0-8] de las 3 casillas de cada una de las 8 líneas."""
+
+_RESULTADOS: dict[int, Resultado] = {
+    VACIA: Resultado.EN_CURSO,
+    X: Resultado.VICTORIA_X,
+    O: Resultado.VICTORIA_O,
+    EMPATE: Resultado.EMPATE,
+}
+
+
+def _lineas_completas(tableros: np.ndarray, jugador: np.ndarray) -> np.ndarray:
+    """
+    Verifica, para cada fila del lote, si un jugador completó alguna línea.
+
+    Args:
+        tableros: Arreglo (k, 9) con tableros de 3x3 aplanados.
+        jugador: Arreglo (k,) con el código del jugador a verificar en cada fila.
+
+    Returns:
+        Arreglo booleano (k,) con True donde el jugador tiene 3 en línea.
+    """
+    lineas = tableros[:, _LINEAS]
+    return (lineas == jugador[:, None, None]).all(axis=2).any(axis=1)
+
+
+class SimuladorLotes:
+    """
+    Simulador de muchas partidas aleatorias de HyperCat a la vez con NumPy.
+
+    Guarda N partidas como arreglos y avanza todas una jugada por paso, con
+    máscaras de movimientos legales, elección aleatoria y detección de
+    victorias calculadas para el lote completo. Aplica las mismas reglas que
+    HyperCat, incluido el reinicio de los sub-tableros empatados.
+
+    Las casillas usan el índice de EstadoHyperCat: ``sub_tablero * 9 + casilla``.
+
+    Attributes:
+        partidas: Número de partidas del lote (N).
+        generador: Generador aleatorio de NumPy usado para elegir las jugadas.
+        casillas: Arreglo (N, 81) con VACIA, X u O.
+        sub_resultados: Arreglo (N, 9) con VACIA (en curso), X u O por sub-tablero.
+        forzado: Arreglo (N,) con el sub-tablero obligatorio o CUALQUIERA.
+        turno: Arreglo (N,) con el jugador que mueve (X u O).
+        resultados: Arreglo (N,) con VACIA (en curso), X, O o EMPATE.
+        jugadas: Arreglo (N,) con la cantidad de jugadas de cada partida.
+    """
+
+    partidas: int
+    generador: np.random.Generator
+    casillas: np.ndarray
+    sub_resultados: np.ndarray
+    forzado: np.ndarray
+    turno: np.ndarray
+    resultados: np.ndarray
+    jugadas: np.ndarray
+
+    def __init__(self, partidas: int, semilla: int | None = None) -> None:
+        """
+        Inicializa el lote con partidas nuevas.
+
+        Args:
+            partidas: Número de partidas simultáneas.
+            semilla: Semilla del generador aleatorio, para reproducir resultados.
+
+        Raises:
+            ValueError: Si el número de partidas no es positivo.
+        """
+        if partidas <= 0:
+            raise ValueError("El número de partidas debe ser positivo.")
+
+        self.partidas = partidas
+        self.generador = np.random.default_rng(semilla)
+        self.reiniciar()
+
+    def reiniciar(self) -> None:
+        """Reinicia todas las partidas a la posición inicial, con turno de X."""
+        n = self.partidas
+        self.casillas = np.zeros((n, 81), dtype=np.int8)
+        self.sub_resultados = np.zeros((n, 9), dtype=np.int8)
+        self.forzado = np.full(n, CUALQUIERA, dtype=np.int8)
+        self.turno = np.full(n, X, dtype=np.int8)
+        self.resultados = np.zeros(n, dtype=np.int8)
+        self.jugadas = np.zeros(n, dtype=np.int16)
+
+    @classmethod
+    def desde_estado(
+        cls, estado: EstadoHyperCat, partidas: int, semilla: int | None = None
+    ) -> "SimuladorLotes":
+        """
+        Crea un lote donde todas las partidas parten de la misma posición.
+
+        Útil para estimar el valor de una posición con muchas simulaciones.
+
+        Args:
+            estado: La posición inicial.
+            partidas: Número de partidas simultáneas.
+            semilla: Semilla del generador aleatorio.
+
+        Returns:
+            Un nuevo SimuladorLotes.
+        """
+        simulador = cls(partidas, semilla)
+        for s in range(9):
+            for casilla in range(9):
+                if estado.tableros[s] >> casilla & 1:
+                    simulador.casillas[:, s * 9 + casilla] = X
+                elif estado.tableros[9 + s] >> casilla & 1:
+                    simulador.casillas[:, s * 9 + casilla] = O
+            if estado.ganados_x >> s & 1:
+                simulador.sub_resultados[:, s] = X
+            elif estado.ganados_o >> s & 1:
+                simulador.sub_resultados[:, s] = O
+
+        simulador.forzado[:] = estado.forzado
+        simulador.turno[:] = X if estado.turno == 0 else O
+        simulador.resultados[:] = next(
+            codigo for codigo, r in _RESULTADOS.items() if r is estado.resultado
+        )
+        return simulador
+
+    def a_estado(self, partida: int) -> EstadoHyperCat:
+        """
+        Convierte una de las partidas del lote en un EstadoHyperCat.
+
+        Args:
+            partida: Índice de la partida [0, N).
+
+        Returns:
+            Un nuevo EstadoHyperCat con la misma posición.
+        """
+        estado = EstadoHyperCat()
+        casillas = self.casillas[partida]
+        for s in range(9):
+            for casilla in range(9):
+                if casillas[s * 9 + casilla] == X:
+                    estado.tableros[s] |= 1 << casilla
+                elif casillas[s * 9 + casilla] == O:
+                    estado.tableros[9 + s] |= 1 << casilla
+                else:
+                    continue
+                estado.vacias &= ~(1 << (s * 9 + casilla))
+            if self.sub_resultados[partida, s] == X:
+                estado.ganados_x |= 1 << s
+            elif self.sub_resultados[partida, s] == O:
+                estado.ganados_o |= 1 << s
+
+        estado.forzado = int(self.forzado[partida])
+        estado.turno = 0 if self.turno[partida] == X else 1
+        estado.resultado = _RESULTADOS[int(self.resultados[partida])]
+        estado.hash_zobrist = estado.calcular_hash_zobrist()
+        return estado
+
+    def movimientos_legales(self) -> np.ndarray:
+        """
+        Calcula los movimientos legales de todas las partidas.
+
+        Returns:
+            Arreglo booleano (N, 81); las filas de partidas terminadas son False.
+        """
+        en_curso = (self.resultados == VACIA)[:, None]
+        return self._legales(slice(None)) & en_curso
+
+    def _legales(self, filas: slice | np.ndarray) -> np.ndarray:
+        """
+        Calcula los movimientos legales de un subconjunto de partidas en curso.
+
+        Args:
+            filas: Índices (o slice) de las partidas a considerar.
+
+        Returns:
+            Arreglo booleano (k, 81) con los movimientos legales de esas partidas.
+        """
+        forzado = self.forzado[filas, None]
+        abiertas = (self.sub_resultados[filas] == VACIA)[:, SUB_DE_CASILLA]
+        permitidas = (forzado == CUALQUIERA) | (SUB_DE_CASILLA == forzado)
+        return (self.casillas[filas] == VACIA) & abiertas & permitidas
+
+    def paso(self) -> np.ndarray:
+        """
+        Avanza una jugada aleatoria en todas las partidas en curso.
+
+        Returns:
+            Arreglo (N,) con el índice [0-80] jugado en cada partida, o -1 en las
+            partidas que ya habían terminado.
+        """
+        activas = np.flatnonzero(self.resultados == VACIA)
+        movimientos = np.full(self.partidas, -1, dtype=np.intp)
+        if activas.size == 0:
+            return movimientos
+
+        # Elección uniforme entre los movimientos legales de cada partida
+        azar = self.generador.random((activas.size, 81), dtype=np.float32)
+        elegidos = np.where(self._legales(activas), azar, -1.0).argmax(axis=1)
+        movimientos[activas] = elegidos
+
+        jugador = self.turno[activas]
+        self.casillas[activas, elegidos] = jugador
+        self.jugadas[activas] += 1
+
+        sub_tablero, casilla = np.divmod(elegidos, 9)
+        posiciones = sub_tablero[:, None] * 9 + _CASILLAS_SUB
+        tableros = self.casillas[activas[:, None], posiciones]
+
+        gana = _lineas_completas(tableros, jugador)
+        # Si el sub-tablero termina en empate, se reinicia
+        empata = ~gana & (tableros != VACIA).all(axis=1)
+        self.casillas[activas[empata][:, None], posiciones[empata]] = VACIA
+
+        ganadoras = activas[gana]
+        self.sub_resultados[ganadoras, sub_tablero[gana]] = jugador[gana]
+        if ganadoras.size:
+            macro = self.sub_resultados[ganadoras]
+            gana_partida = _lineas_completas(macro, jugador[gana])
+            empata_partida = ~gana_partida & (macro != VACIA).all(axis=1)
+            self.resultados[ganadoras[gana_partida]] = jugador[gana][gana_partida]
+            self.resultados[ganadoras[empata_partida]] = EMPATE
+
+        destino_cerrado = self.sub_resultados[activas, casilla] != VACIA
+        self.forzado[activas] = np.where(destino_cerrado, CUALQUIERA, casilla)
+        self.turno[activas] = X + O - jugador
+        return movimientos
+
+    def simular(self) -> np.ndarray:
+        """
+        Avanza todas las partidas hasta que terminen.
+
+        Returns:
+            El arreglo de resultados (N,) con X, O o EMPATE.
+        """
+        while (self.resultados == VACIA).any():
+            self.paso()
+        return self.resultados
+
+    def contar_resultados(self) -> dict[Resultado, int]:
+        """
+        Cuenta cuántas partidas terminaron con cada resultado.
+
+        Returns:
+            Diccionario con la cantidad de partidas por Resultado.
+        """
+        conteo = np.bincount(self.resultados, minlength=4)
+        return {r: int(conteo[codigo]) for codigo, r in _RESULTADOS.items()}
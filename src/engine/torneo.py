@@ -0,0 +1,706 @@
+"""Módulo con el torneo de auto-juego entre jugadores automáticos de HyperCat.
+
+Enfrenta a todos los participantes entre sí (todos contra todos) en un pool de
+procesos y estima su Elo con intervalos de confianza. Cada par de partidas de
+un cruce empieza desde la misma apertura aleatoria, generada con la semilla
+del torneo, y con los colores invertidos, de modo que ninguno de los dos
+jugadores se beneficia de la apertura ni de mover primero.
+
+Se ejecuta con ``python -m src.engine.torneo``, por ejemplo::
+
+    python -m src.engine.torneo aleatorio codicioso alfa_beta --partidas 200
+
+Un jugador es cualquier objeto con ``elegir_movimiento(juego)`` que devuelva
+coordenadas globales (fila, columna) [0-8], como MotorAlfaBeta y MotorMCTS.
+Para agregar uno basta con registrar en JUGADORES una función a nivel de
+módulo (para que pueda enviarse a otros procesos) que lo cree a partir del
+tiempo por jugada y una semilla.
+"""
+
+import argparse
+import math
+import os
+import random
+import time
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+from itertools import combinations
+from typing import NamedTuple, Protocol
+
+from src.core import EstadoHyperCat, HyperCat
+from src.core.estado_hyper_cat import coordenadas, indice, indices_de
+from src.enums import Resultado
+
+from .alfa_beta import MotorAlfaBeta, evaluar
+from .mcts import MotorMCTS
+from .transposicion import TablaTransposicion
+
+JUGADAS_MAXIMAS: int = 500
+"""Jugadas tras las que una partida se da por empatada."""
+
+_Z_95: float = 1.959964
+_VICTORIAS: tuple[Resultado, Resultado] = (Resultado.VICTORIA_X, Resultado.VICTORIA_O)
+
+
+class Jugador(Protocol):
+    """Interfaz de los jugadores automáticos del torneo."""
+
+    def elegir_movimiento(self, juego: HyperCat | EstadoHyperCat) -> tuple[int, int]:
+        """
+        Elige un movimiento legal para el jugador al que le toca mover.
+
+        Args:
+            juego: La posición; no debe modificarse.
+
+        Returns:
+            El movimiento en coordenadas globales (fila, columna) [0-8].
+        """
+        ...
+
+
+FabricaJugador = Callable[[float, int], Jugador]
+"""Crea un jugador a partir del tiempo por jugada en segundos y una semilla."""
+
+
+class JugadorAleatorio:
+    """
+    Jugador que elige un movimiento legal al azar.
+
+    Attributes:
+        generador: Generador de números aleatorios.
+    """
+
+    generador: random.Random
+
+    def __init__(self, semilla: int | None = None) -> None:
+        """
+        Inicializa el jugador.
+
+        Args:
+            semilla: Semilla del generador aleatorio.
+        """
+        self.generador = random.Random(semilla)
+
+    def elegir_movimiento(self, juego: HyperCat | EstadoHyperCat) -> tuple[int, int]:
+        """
+        Elige un movimiento legal al azar.
+
+        Args:
+            juego: La posición.
+
+        Returns:
+            El movimiento en coordenadas globales (fila, columna) [0-8].
+        """
+        if isinstance(juego, HyperCat):
+            juego = EstadoHyperCat.desde_hyper_cat(juego)
+        return coordenadas(
+            self.generador.choice(indices_de(juego.movimientos_legales()))
+        )
+
+
+class JugadorCodicioso:
+    """
+    Jugador que mira una sola jugada hacia adelante.
+
+    Gana la partida si puede; si no, elige el movimiento con mejor evaluación
+    heurística (ver alfa_beta.evaluar) tras jugarlo, desempatando al azar.
+
+    Attributes:
+        generador: Generador de números aleatorios para los desempates.
+    """
+
+    generador: random.Random
+
+    def __init__(self, semilla: int | None = None) -> None:
+        """
+        Inicializa el jugador.
+
+        Args:
+            semilla: Semilla del generador de desempates.
+        """
+        self.generador = random.Random(semilla)
+
+    def elegir_movimiento(self, juego: HyperCat | EstadoHyperCat) -> tuple[int, int]:
+        """
+        Elige el movimiento con mejor evaluación inmediata.
+
+        Args:
+            juego: La posición.
+
+        Returns:
+            El movimiento en coordenadas globales (fila, columna) [0-8].
+        """
+        if isinstance(juego, HyperCat):
+            juego = EstadoHyperCat.desde_hyper_cat(juego)
+
+        mejores: list[int] = []
+        mejor_valor = -math.inf
+        for movimiento in indices_de(juego.movimientos_legales()):
+            hijo = juego.copiar()
+            hijo.jugar(movimiento)
+            if hijo.resultado is Resultado.EN_CURSO:
+                valor = -evaluar(hijo)
+            elif hijo.resultado is Resultado.EMPATE:
+                valor = 0.0
+            else:
+                return coordenadas(movimiento)
+
+            if valor > mejor_valor:
+                mejores, mejor_valor = [movimiento], valor
+            elif valor == mejor_valor:
+                mejores.append(movimiento)
+        return coordenadas(self.generador.choice(mejores))
+
+
+def crear_aleatorio(tiempo: float, semilla: int) -> Jugador:
+    """
+    Crea un JugadorAleatorio; no usa el tiempo.
+
+    Args:
+        tiempo: Segundos por jugada.
+        semilla: Semilla del jugador.
+
+    Returns:
+        El jugador.
+    """
+    return JugadorAleatorio(semilla)
+
+
+def crear_codicioso(tiempo: float, semilla: int) -> Jugador:
+    """
+    Crea un JugadorCodicioso; no usa el tiempo.
+
+    Args:
+        tiempo: Segundos por jugada.
+        semilla: Semilla de los desempates.
+
+    Returns:
+        El jugador.
+    """
+    return JugadorCodicioso(semilla)
+
+
+def crear_alfa_beta(tiempo: float, semilla: int) -> Jugador:
+    """
+    Crea un MotorAlfaBeta con el tiempo por jugada; es determinista.
+
+    Args:
+        tiempo: Segundos por jugada.
+        semilla: No se usa.
+
+    Returns:
+        El motor, con una tabla de transposición chica para crearlo rápido.
+    """
+    return MotorAlfaBeta(tiempo_limite=tiempo, tabla=TablaTransposicion(1 << 16))
+
+
+def crear_mcts(tiempo: float, semilla: int) -> Jugador:
+    """
+    Crea un MotorMCTS de un proceso limitado por el tiempo por jugada.
+
+    Args:
+        tiempo: Segundos por jugada.
+        semilla: Semilla de las simulaciones.
+
+    Returns:
+        El motor.
+    """
+    return MotorMCTS(simulaciones=1_000_000, semilla=semilla, tiempo_limite=tiempo)
+
+
+JUGADORES: dict[str, FabricaJugador] = {
+    "aleatorio": crear_aleatorio,
+    "codicioso": crear_codicioso,
+    "alfa_beta": crear_alfa_beta,
+    "mcts": crear_mcts,
+}
+"""Jugadores disponibles por nombre."""
+
+
+class Participante(NamedTuple):
+    """
+    Jugador inscrito en un torneo.
+
+    Attributes:
+        nombre: Nombre único en el torneo.
+        fabrica: Función a nivel de módulo que crea el jugador en cada partida.
+    """
+
+    nombre: str
+    fabrica: FabricaJugador
+
+
+class Partida(NamedTuple):
+    """
+    Partida a jugar, la unidad de trabajo que se envía a cada proceso.
+
+    Attributes:
+        numero: Número de la partida en el torneo.
+        x: Participante que juega con X.
+        o: Participante que juega con O.
+        apertura: Índices [0-80] de las jugadas iniciales, hechas al azar.
+        tiempo: Segundos por jugada.
+        semilla: Semilla de los jugadores.
+    """
+
+    numero: int
+    x: Participante
+    o: Participante
+    apertura: tuple[int, ...]
+    tiempo: float
+    semilla: int
+
+
+class ResultadoPartida(NamedTuple):
+    """
+    Resultado de una partida del torneo.
+
+    Attributes:
+        numero: Número de la partida en el torneo.
+        x: Nombre del participante con X.
+        o: Nombre del participante con O.
+        resultado: El resultado; las partidas que llegan a JUGADAS_MAXIMAS
+            cuentan como empate.
+        jugadas: Jugadas realizadas, incluidas las de la apertura.
+        tiempos: Segundos totales de reflexión de X y de O.
+        excesos: Jugadas de X y de O que superaron el tiempo por jugada en más
+            de un 50 % (y de 10 ms).
+    """
+
+    numero: int
+    x: str
+    o: str
+    resultado: Resultado
+    jugadas: int
+    tiempos: tuple[float, float]
+    excesos: tuple[int, int]
+
+
+class Clasificacion(NamedTuple):
+    """
+    Fila de la tabla de posiciones de un torneo.
+
+    Attributes:
+        nombre: Nombre del participante.
+        partidas: Partidas jugadas.
+        victorias: Partidas ganadas.
+        empates: Partidas empatadas.
+        derrotas: Partidas perdidas.
+        elo: Elo estimado; la media de los participantes es 0.
+        margen: Mitad del intervalo de confianza del 95 % del Elo.
+        excesos: Jugadas que superaron el tiempo por jugada.
+    """
+
+    nombre: str
+    partidas: int
+    victorias: int
+    empates: int
+    derrotas: int
+    elo: float
+    margen: float
+    excesos: int
+
+    @property
+    def puntos(self) -> float:
+        """
+        Calcula la fracción de puntos obtenidos.
+
+        Returns:
+            Victorias más medio punto por empate, dividido por las partidas.
+        """
+        if not self.partidas:
+            return 0.0
+        return (self.victorias + self.empates / 2) / self.partidas
+
+
+class ResultadoTorneo(NamedTuple):
+    """
+    Resultado de un torneo.
+
+    Attributes:
+        partidas: Los resultados de cada partida, en orden.
+        clasificacion: La tabla de posiciones ordenada por Elo.
+        tiempo: Segundos de reloj que duró el torneo.
+    """
+
+    partidas: list[ResultadoPartida]
+    clasificacion: list[Clasificacion]
+    tiempo: float
+
+    @property
+    def partidas_por_segundo(self) -> float:
+        """
+        Calcula el rendimiento del torneo.
+
+        Returns:
+            Partidas terminadas por segundo de reloj.
+        """
+        return len(self.partidas) / self.tiempo if self.tiempo > 0 else 0.0
+
+
+def generar_apertura(jugadas: int, semilla: int) -> tuple[int, ...]:
+    """
+    Genera una apertura aleatoria reproducible.
+
+    Args:
+        jugadas: Cantidad de jugadas de la apertura.
+        semilla: Semilla del generador.
+
+    Returns:
+        Los índices [0-80] de las jugadas; puede ser más corta si la partida
+        termina antes.
+    """
+    generador = random.Random(semilla)
+    estado = EstadoHyperCat()
+    apertura = []
+    for _ in range(jugadas):
+        if estado.terminado():
+            break
+        movimiento = generador.choice(indices_de(estado.movimientos_legales()))
+        estado.jugar(movimiento)
+        apertura.append(movimiento)
+    return tuple(apertura)
+
+
+def jugar_partida(partida: Partida) -> ResultadoPartida:
+    """
+    Juega una partida del torneo.
+
+    Los jugadores se crean al empezar, en el proceso que juega la partida.
+
+    Args:
+        partida: La partida a jugar.
+
+    Returns:
+        El resultado de la partida.
+
+    Raises:
+        ValueError: Si un jugador elige un movimiento ilegal.
+    """
+    jugadores = (
+        partida.x.fabrica(partida.tiempo, partida.semilla),
+        partida.o.fabrica(partida.tiempo, partida.semilla + 1),
+    )
+    tolerado = max(partida.tiempo * 1.5, partida.tiempo + 0.01)
+    tiempos = [0.0, 0.0]
+    excesos = [0, 0]
+
+    estado = EstadoHyperCat()
+    for movimiento in partida.apertura:
+        estado.jugar(movimiento)
+
+    jugadas = len(partida.apertura)
+    while not estado.terminado() and jugadas < JUGADAS_MAXIMAS:
+        turno = estado.turno
+        inicio = time.perf_counter()
+        fila, columna = jugadores[turno].elegir_movimiento(estado)
+        transcurrido = time.perf_counter() - inicio
+        tiempos[turno] += transcurrido
+        excesos[turno] += transcurrido > tolerado
+
+        movimiento = indice(fila // 3, columna // 3, fila % 3, columna % 3)
+        if not estado.movimientos_legales() >> movimiento & 1:
+            nombre = (partida.x, partida.o)[turno].nombre
+            raise ValueError(
+                f"{nombre} eligió un movimiento ilegal: {(fila, columna)}."
+            )
+        estado.jugar(movimiento)
+        jugadas += 1
+
+    resultado = estado.resultado
+    if resultado is Resultado.EN_CURSO:
+        resultado = Resultado.EMPATE
+
+    for jugador in jugadores:
+        if isinstance(jugador, MotorMCTS):
+            jugador.cerrar()
+
+    return ResultadoPartida(
+        numero=partida.numero,
+        x=partida.x.nombre,
+        o=partida.o.nombre,
+        resultado=resultado,
+        jugadas=jugadas,
+        tiempos=(tiempos[0], tiempos[1]),
+        excesos=(excesos[0], excesos[1]),
+    )
+
+
+def programar(
+    participantes: list[Participante],
+    partidas: int,
+    tiempo: float,
+    jugadas_apertura: int = 4,
+    semilla: int = 0,
+) -> list[Partida]:
+    """
+    Arma el calendario de un torneo todos contra todos.
+
+    Cada cruce se juega en pares de partidas con la misma apertura y los
+    colores invertidos.
+
+    Args:
+        participantes: Los participantes, con nombres distintos.
+        partidas: Partidas por cruce; si es impar se redondea al par siguiente.
+        tiempo: Segundos por jugada.
+        jugadas_apertura: Jugadas aleatorias con las que empieza cada par.
+        semilla: Semilla de las aperturas y de los jugadores.
+
+    Returns:
+        Las partidas del torneo, numeradas en orden.
+
+    Raises:
+        ValueError: Si hay menos de dos participantes, nombres repetidos o la
+            cantidad de partidas no es positiva.
+    """
+    nombres = [p.nombre for p in participantes]
+    if len(participantes) < 2 or len(set(nombres)) != len(nombres):
+        raise ValueError(
+            "Se necesitan al menos dos participantes con nombres distintos."
+        )
+    if partidas <= 0:
+        raise ValueError("La cantidad de partidas debe ser positiva.")
+
+    calendario = []
+    pares = (partidas + 1) // 2
+    for cruce, (a, b) in enumerate(combinations(participantes, 2)):
+        for par in range(pares):
+            semilla_par = hash((semilla, cruce, par)) & 0xFFFF_FFFF
+            apertura = generar_apertura(jugadas_apertura, semilla_par)
+            for x, o in ((a, b), (b, a)):
+                calendario.append(
+                    Partida(len(calendario), x, o, apertura, tiempo, semilla_par)
+                )
+    return calendario
+
+
+def calcular_elo(
+    nombres: list[str], resultados: list[ResultadoPartida]
+) -> dict[str, tuple[float, float]]:
+    """
+    Estima el Elo de cada participante a partir de los resultados.
+
+    Ajusta un modelo de Bradley-Terry por máxima verosimilitud (los empates
+    valen medio punto para cada uno) con un empate ficticio contra cada rival,
+    para que los puntajes perfectos den un Elo finito. El intervalo de
+    confianza del 95 % es aproximado: se obtiene del error estándar de los
+    puntos por partida de cada participante, contando los mismos empates
+    ficticios para que un puntaje perfecto no tenga un margen nulo, y se
+    traslada a la escala Elo.
+
+    Args:
+        nombres: Los participantes.
+        resultados: Los resultados de las partidas.
+
+    Returns:
+        Diccionario nombre -> (elo, margen), con media de Elo 0.
+    """
+    n = len(nombres)
+    posicion = {nombre: i for i, nombre in enumerate(nombres)}
+    enfrentamientos = [[1.0 if i != j else 0.0 for j in range(n)] for i in range(n)]
+    puntos = [0.5 * (n - 1)] * n
+    por_partida: list[list[float]] = [[] for _ in range(n)]
+
+    for r in resultados:
+        x, o = posicion[r.x], posicion[r.o]
+        if r.resultado is Resultado.VICTORIA_X:
+            px = 1.0
+        elif r.resultado is Resultado.VICTORIA_O:
+            px = 0.0
+        else:
+            px = 0.5
+        enfrentamientos[x][o] += 1
+        enfrentamientos[o][x] += 1
+        puntos[x] += px
+        puntos[o] += 1 - px
+        por_partida[x].append(px)
+        por_partida[o].append(1 - px)
+
+    # Algoritmo MM de Zermelo para Bradley-Terry
+    fuerza = [1.0] * n
+    for _ in range(1000):
+        nueva = [
+            puntos[i]
+            / sum(
+                enfrentamientos[i][j] / (fuerza[i] + fuerza[j])
+                for j in range(n)
+                if j != i
+            )
+            for i in range(n)
+        ]
+        media = math.exp(sum(map(math.log, nueva)) / n)
+        nueva = [f / media for f in nueva]
+        convergio = max(abs(a - b) for a, b in zip(nueva, fuerza)) < 1e-10
+        fuerza = nueva
+        if convergio:
+            break
+
+    def elo_de(puntaje: float) -> float:
+        puntaje = min(max(puntaje, 1e-3), 1 - 1e-3)
+        return -400 * math.log10(1 / puntaje - 1)
+
+    estimaciones = {}
+    for i, nombre in enumerate(nombres):
+        elo = 400 * math.log10(fuerza[i])
+        if len(por_partida[i]) < 2:
+            estimaciones[nombre] = (elo, math.inf)
+            continue
+        valores = por_partida[i] + [0.5] * (n - 1)
+        media = sum(valores) / len(valores)
+        error = math.sqrt(
+            sum((v - media) ** 2 for v in valores) / (len(valores) - 1) / len(valores)
+        )
+        alto = elo_de(media + _Z_95 * error) - elo_de(media)
+        bajo = elo_de(media) - elo_de(media - _Z_95 * error)
+        estimaciones[nombre] = (elo, (alto + bajo) / 2)
+    return estimaciones
+
+
+def clasificar(
+    nombres: list[str], resultados: list[ResultadoPartida]
+) -> list[Clasificacion]:
+    """
+    Arma la tabla de posiciones de un torneo.
+
+    Args:
+        nombres: Los participantes.
+        resultados: Los resultados de las partidas.
+
+    Returns:
+        Una Clasificacion por participante, ordenadas por Elo de mayor a menor.
+    """
+    conteo = {nombre: [0, 0, 0, 0] for nombre in nombres}
+    for r in resultados:
+        for lado, nombre in enumerate((r.x, r.o)):
+            if r.resultado is _VICTORIAS[lado]:
+                conteo[nombre][0] += 1
+            elif r.resultado is Resultado.EMPATE:
+                conteo[nombre][1] += 1
+            else:
+                conteo[nombre][2] += 1
+            conteo[nombre][3] += r.excesos[lado]
+
+    elo = calcular_elo(nombres, resultados)
+    tabla = [
+        Clasificacion(
+            nombre=nombre,
+            partidas=sum(conteo[nombre][:3]),
+            victorias=conteo[nombre][0],
+            empates=conteo[nombre][1],
+            derrotas=conteo[nombre][2],
+            elo=elo[nombre][0],
+            margen=elo[nombre][1],
+            excesos=conteo[nombre][3],
+        )
+        for nombre in nombres
+    ]
+    return sorted(tabla, key=lambda fila: -fila.elo)
+
+
+def jugar_torneo(
+    participantes: list[Participante],
+    partidas: int = 100,
+    tiempo: float = 0.01,
+    procesos: int | None = None,
+    jugadas_apertura: int = 4,
+    semilla: int = 0,
+) -> ResultadoTorneo:
+    """
+    Juega un torneo todos contra todos y calcula la clasificación.
+
+    Args:
+        participantes: Los participantes, con nombres distintos.
+        partidas: Partidas por cruce (se redondea a par).
+        tiempo: Segundos por jugada.
+        procesos: Procesos del pool; None usa todos los núcleos y 1 juega en el
+            proceso actual.
+        jugadas_apertura: Jugadas aleatorias con las que empieza cada par.
+        semilla: Semilla de las aperturas y de los jugadores.
+
+    Returns:
+        El ResultadoTorneo.
+    """
+    calendario = programar(participantes, partidas, tiempo, jugadas_apertura, semilla)
+    procesos = procesos or os.cpu_count() or 1
+
+    inicio = time.perf_counter()
+    if procesos == 1:
+        resultados = [jugar_partida(partida) for partida in calendario]
+    else:
+        with ProcessPoolExecutor(max_workers=procesos) as pool:
+            lote = max(1, len(calendario) // (procesos * 8))
+            resultados = list(pool.map(jugar_partida, calendario, chunksize=lote))
+    transcurrido = time.perf_counter() - inicio
+
+    nombres = [p.nombre for p in participantes]
+    return ResultadoTorneo(resultados, clasificar(nombres, resultados), transcurrido)
+
+
+def imprimir(torneo: ResultadoTorneo) -> None:
+    """
+    Imprime la tabla de posiciones y el rendimiento de un torneo.
+
+    Args:
+        torneo: El resultado del torneo.
+    """
+    print(
+        f"{'Jugador':<16}{'Elo':>8}{'± 95%':>8}{'Partidas':>10}"
+        f"{'G':>7}{'E':>7}{'P':>7}{'Puntos':>9}{'Excesos':>9}"
+    )
+    for fila in torneo.clasificacion:
+        print(
+            f"{fila.nombre:<16}{fila.elo:>8.0f}{fila.margen:>8.0f}{fila.partidas:>10}"
+            f"{fila.victorias:>7}{fila.empates:>7}{fila.derrotas:>7}"
+            f"{fila.puntos:>9.1%}{fila.excesos:>9}"
+        )
+    print(
+        f"\n{len(torneo.partidas)} partidas en {torneo.tiempo:.1f} s "
+        f"({torneo.partidas_por_segundo:.1f} partidas/s)"
+    )
+
+
+def main(argumentos: list[str] | None = None) -> None:
+    """
+    Ejecuta un torneo desde la línea de comandos.
+
+    Args:
+        argumentos: Argumentos de la línea de comandos, por defecto sys.argv.
+    """
+    parser = argparse.ArgumentParser(description="Torneo de auto-juego de HyperCat.")
+    parser.add_argument(
+        "jugadores",
+        nargs="+",
+        choices=list(JUGADORES),
+        help="jugadores a enfrentar (al menos dos; pueden repetirse)",
+    )
+    parser.add_argument("--partidas", type=int, default=100, help="partidas por cruce")
+    parser.add_argument(
+        "--tiempo", type=float, default=0.01, help="segundos por jugada"
+    )
+    parser.add_argument("--procesos", type=int, help="procesos del pool")
+    parser.add_argument(
+        "--apertura", type=int, default=4, help="jugadas aleatorias iniciales"
+    )
+    parser.add_argument("--semilla", type=int, default=0)
+    opciones = parser.parse_args(argumentos)
+
+    participantes = []
+    for nombre in opciones.jugadores:
+        repetidos = sum(p.fabrica is JUGADORES[nombre] for p in participantes)
+        etiqueta = f"{nombre}_{repetidos + 1}" if repetidos else nombre
+        participantes.append(Participante(etiqueta, JUGADORES[nombre]))
+
+    imprimir(
+        jugar_torneo(
+            participantes,
+            opciones.partidas,
+            opciones.tiempo,
+            opciones.procesos,
+            opciones.apertura,
+            opciones.semilla,
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,167 @@
+"""Módulo con la tabla de transposición de tamaño fijo para las búsquedas."""
+
+from typing import NamedTuple
+
+from src.enums import TipoCota
+
+
+class EntradaTransposicion(NamedTuple):
+    """
+    Resultado de búsqueda guardado para una posición.
+
+    Attributes:
+        clave: Hash Zobrist completo de la posición.
+        profundidad: Profundidad restante con la que se buscó la posición.
+        valor: Valor obtenido por la búsqueda.
+        cota: Cómo interpretar el valor (exacto, cota inferior o superior).
+        mejor_movimiento: Mejor movimiento encontrado, o None si no hay.
+        generacion: Búsqueda en la que se guardó la entrada.
+    """
+
+    clave: int
+    profundidad: int
+    valor: float
+    cota: TipoCota
+    mejor_movimiento: int | None
+    generacion: int
+
+
+class TablaTransposicion:
+    """
+    Tabla de transposición de tamaño fijo indexada por hash Zobrist.
+
+    Cada posición ocupa una única ranura, ``clave & (tamano - 1)``. Cuando dos
+    posiciones compiten por la misma ranura se conserva la de mayor profundidad,
+    salvo que la guardada pertenezca a una búsqueda anterior, en cuyo caso se
+    reemplaza siempre.
+
+    Attributes:
+        tamano: Número de ranuras (potencia de 2).
+        aciertos: Consultas que encontraron la posición.
+        fallos: Consultas que no la encontraron.
+        reemplazos: Entradas de otra posición que fueron sobrescritas.
+        generacion: Número de la búsqueda actual.
+    """
+
+    __slots__ = (
+        "tamano",
+        "aciertos",
+        "fallos",
+        "reemplazos",
+        "generacion",
+        "_mascara",
+        "_entradas",
+    )
+
+    tamano: int
+    aciertos: int
+    fallos: int
+    reemplazos: int
+    generacion: int
+
+    def __init__(self, tamano: int = 1 << 18) -> None:
+        """
+        Inicializa una tabla vacía.
+
+        Args:
+            tamano: Número de ranuras; se redondea a la potencia de 2 inferior.
+
+        Raises:
+            ValueError: Si el tamaño no es positivo.
+        """
+        if tamano <= 0:
+            raise ValueError("El tamaño de la tabla debe ser positivo.")
+
+        self.tamano = 1 << (tamano.bit_length() - 1)
+        self._mascara = self.tamano - 1
+        self._entradas: list[EntradaTransposicion | None] = [None] * self.tamano
+        self.generacion = 0
+        self.aciertos = 0
+        self.fallos = 0
+        self.reemplazos = 0
+
+    def buscar(self, clave: int) -> EntradaTransposicion | None:
+        """
+        Busca la entrada guardada para una posición.
+
+        Args:
+            clave: Hash Zobrist de la posición.
+
+        Returns:
+            La entrada de la posición, o None si no está en la tabla.
+        """
+        entrada = self._entradas[clave & self._mascara]
+        if entrada is not None and entrada.clave == clave:
+            self.aciertos += 1
+            return entrada
+        self.fallos += 1
+        return None
+
+    def guardar(
+        self,
+        clave: int,
+        profundidad: int,
+        valor: float,
+        cota: TipoCota,
+        mejor_movimiento: int | None = None,
+    ) -> None:
+        """
+        Guarda el resultado de una búsqueda aplicando la política de reemplazo.
+
+        Args:
+            clave: Hash Zobrist de la posición.
+            profundidad: Profundidad restante con la que se buscó la posición.
+            valor: Valor obtenido por la búsqueda.
+            cota: Cómo interpretar el valor.
+            mejor_movimiento: Mejor movimiento encontrado, si lo hay.
+        """
+        ranura = clave & self._mascara
+        actual = self._entradas[ranura]
+
+        if actual is not None:
+            if actual.clave == clave:
+                if mejor_movimiento is None:
+                    mejor_movimiento = actual.mejor_movimiento
+            elif (
+                actual.generacion == self.generacion
+                and actual.profundidad > profundidad
+            ):
+                return
+            else:
+                self.reemplazos += 1
+
+        self._entradas[ranura] = EntradaTransposicion(
+            clave, profundidad, valor, cota, mejor_movimiento, self.generacion
+        )
+
+    def nueva_busqueda(self) -> None:
+        """Marca el inicio de una búsqueda, envejeciendo las entradas anteriores."""
+        self.generacion += 1
+
+    def limpiar(self) -> None:
+        """Vacía la tabla y reinicia los contadores."""
+        self._entradas = [None] * self.tamano
+        self.generacion = 0
+        self.aciertos = 0
+        self.fallos = 0
+        self.reemplazos = 0
+
+    @property
+    def tasa_aciertos(self) -> float:
+        """
+        Calcula la proporción de consultas que encontraron la posición.
+
+        Returns:
+            Un valor entre 0 y 1, o 0 si aún no hubo consultas.
+        """
+        consultas = self.aciertos + self.fallos
+        return self.aciertos / consultas if consultas else 0.0
+
+    def __len__(self) -> int:
+        """
+        Cuenta las ranuras ocupadas.
+
+        Returns:
+            El número de entradas guardadas.
+        """
+        return sum(entrada is not None for entrada in self._entradas)
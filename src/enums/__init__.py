@@ -2,4 +2,6 @@
 
 from .colors import Colors
 from .estado_casilla import EstadoCasilla
+from .estado_jugada import EstadoJugada
 from .resultado import Resultado
+from .tipo_cota import TipoCota
@@ -0,0 +1,30 @@
+"""Módulo con la enumeración de resultados de un intento de jugada."""
+
+from enum import Enum, auto
+
+
+class EstadoJugada(Enum):
+    """
+    Enumeración de los posibles resultados de intentar una jugada.
+
+    La devuelve intentar_jugar() en lugar de lanzar excepciones: OK si la
+    jugada se realizó y, si no, el motivo por el que se rechazó.
+    """
+
+    OK = auto()
+    OCUPADA = auto()
+    FUERA_DE_RANGO = auto()
+    SUBGATO_TERMINADO = auto()
+    SUBGATO_NO_ESPECIFICADO = auto()
+    SUBGATO_NO_PERMITIDO = auto()
+    JUEGO_TERMINADO = auto()
+    INCONSISTENTE = auto()
+
+    def exitosa(self) -> bool:
+        """
+        Verifica si la jugada se realizó.
+
+        Returns:
+            True si el estado es OK, False en caso contrario.
+        """
+        return self is EstadoJugada.OK
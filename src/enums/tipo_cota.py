@@ -0,0 +1,18 @@
+"""Módulo con la enumeración de tipos de cota de una evaluación."""
+
+from enum import Enum, auto
+
+
+class TipoCota(Enum):
+    """
+    Enumeración de la precisión de un valor guardado en la tabla de transposición.
+
+    Define cómo debe interpretarse el valor de una búsqueda alfa-beta:
+        EXACTA: El valor es exacto.
+        INFERIOR: El valor real es mayor o igual (corte beta).
+        SUPERIOR: El valor real es menor o igual (ningún movimiento superó alfa).
+    """
+
+    EXACTA = auto()
+    INFERIOR = auto()
+    SUPERIOR = auto()
@@ -1,7 +1,9 @@
 """Paquete con las clases para comunicación por sockets."""
 
+from .async_server import AsyncConnection, AsyncSocketServer
 from .base_socket import BaseSocket
 from .client import SocketClient
+from .match_server import MatchServer, Room
 from .message_socket import MessageSocket
 from .server import SocketServer
 from .type_status import TypeStatus
@@ -0,0 +1,514 @@
+"""Módulo que contiene el servidor asyncio para muchos clientes a la vez.
+
+A diferencia de SocketServer, que atiende un único cliente y bloquea el proceso
+en cada llamada, AsyncSocketServer atiende miles de conexiones en un solo event
+loop. Cada conexión corre en su propia tarea y habla el mismo protocolo que
+BaseSocket (mensajes de MessageSocket con un encabezado de 4 bytes con la
+longitud, en JSON o en el binario negociado), así que SocketClient se conecta
+sin cambios.
+
+Contrapresión: cada envío espera a que el buffer de escritura de la conexión
+baje de ``limite_escritura`` (drain), de modo que un cliente lento frena solo a
+su propia tarea; y los datos se leen del socket únicamente cuando la tarea pide
+un mensaje, así que TCP frena al cliente que envía más rápido de lo que se
+procesa.
+
+Uso::
+
+    async def atender(conexion: AsyncConnection) -> None:
+        while (data := await conexion.receive_data()) is not None:
+            await conexion.respond_success()
+
+    async with AsyncSocketServer(atender) as server:
+        await server.serve_forever()
+"""
+
+import asyncio
+import json
+import socket
+import struct
+from collections.abc import Awaitable, Callable
+
+from .base_socket import TAMANO_MAXIMO_MENSAJE
+from .message_socket import PROTOCOLOS, MessageSocket
+from .type_status import TypeStatus
+
+_ENCABEZADO = struct.Struct("!I")
+
+LIMITE_ESCRITURA: int = 64 * 1024
+"""Bytes pendientes de envío a partir de los cuales un envío espera."""
+
+LIMITE_SIN_LEER: int = 1 << 20
+"""Bytes pendientes de envío a partir de los cuales send_nowait() aborta."""
+
+
+class AsyncConnection:
+    """
+    Conexión con un cliente dentro del event loop.
+
+    Ofrece la misma API de protocolo que BaseSocket (respond_success,
+    respond_error, send_data, receive_data, close), pero con corrutinas.
+
+    Attributes:
+        reader: El flujo de lectura de la conexión.
+        writer: El flujo de escritura de la conexión, None si está cerrada.
+        addr: La dirección (IP, puerto) del otro extremo.
+        tamano_maximo: Bytes máximos del payload de un mensaje recibido.
+        protocolo: El formato de los mensajes enviados, "json" o "binario".
+        limite_sin_leer: Bytes pendientes de envío a partir de los cuales
+            send_nowait() da por colgado al otro extremo.
+    """
+
+    __slots__ = (
+        "reader",
+        "writer",
+        "addr",
+        "tamano_maximo",
+        "protocolo",
+        "limite_sin_leer",
+        "_secuencia_recibida",
+    )
+
+    def __init__(
+        self,
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+        tamano_maximo: int = TAMANO_MAXIMO_MENSAJE,
+        limite_escritura: int = LIMITE_ESCRITURA,
+        limite_sin_leer: int = LIMITE_SIN_LEER,
+    ) -> None:
+        """
+        Envuelve los flujos de una conexión ya establecida.
+
+        Args:
+            reader: El flujo de lectura.
+            writer: El flujo de escritura.
+            tamano_maximo: Bytes máximos del payload de un mensaje recibido.
+            limite_escritura: Bytes pendientes a partir de los cuales un envío
+                espera a que el cliente lea.
+            limite_sin_leer: Bytes pendientes a partir de los cuales
+                send_nowait() aborta la conexión.
+        """
+        self.reader = reader
+        self.writer = writer
+        self.addr = writer.get_extra_info("peername")
+        self.tamano_maximo = tamano_maximo
+        self.protocolo = "json"
+        self.limite_sin_leer = limite_sin_leer
+        self._secuencia_recibida = None
+        writer.transport.set_write_buffer_limits(high=limite_escritura)
+
+        sock = writer.get_extra_info("socket")
+        if sock is not None and sock.family in (socket.AF_INET, socket.AF_INET6):
+            # Igual que SocketServer, detectar si el otro extremo desaparece
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+
+    @classmethod
+    async def connect(
+        cls, host="localhost", port=54321, protocolo="json"
+    ) -> "AsyncConnection":
+        """
+        Abre una conexión con un servidor, para clientes asíncronos.
+
+        Args:
+            host: La dirección IP o nombre del servidor, por defecto 'localhost'.
+            port: El puerto del servidor, por defecto 54321.
+            protocolo: El protocolo de envío a negociar, "json" (por defecto, sin
+                negociar) o "binario".
+
+        Returns:
+            La conexión establecida.
+        """
+        reader, writer = await asyncio.open_connection(host, port)
+        conexion = cls(reader, writer)
+        if protocolo != "json":
+            await conexion.negotiate_protocol(protocolo)
+        return conexion
+
+    # ---------- Bajo Nivel ----------
+    async def _send_json(self, data: dict):
+        """
+        Envía datos JSON con el encabezado de longitud y espera la contrapresión.
+
+        Args:
+            data: Diccionario a enviar en formato JSON.
+
+        Raises:
+            ConnectionError: Si la conexión está cerrada.
+        """
+        await self._send_payload(json.dumps(data).encode("utf-8"))
+
+    async def _send_payload(self, payload: bytes):
+        """
+        Envía un payload con el encabezado de longitud y espera la contrapresión.
+
+        Args:
+            payload: Los bytes a enviar.
+
+        Raises:
+            ConnectionError: Si la conexión está cerrada.
+        """
+        if self.writer is None:
+            raise ConnectionError("No connection established")
+        self.writer.write(_ENCABEZADO.pack(len(payload)) + payload)
+        await self.writer.drain()
+
+    async def _recv_json(self) -> dict:
+        """
+        Recibe un mensaje JSON completo.
+
+        Returns:
+            Diccionario con los datos JSON recibidos.
+        """
+        return json.loads((await self._recv_payload()).decode("utf-8"))
+
+    async def _recv_payload(self) -> bytes:
+        """
+        Recibe el payload de un mensaje completo.
+
+        Returns:
+            Los bytes del payload.
+
+        Raises:
+            ConnectionError: Si la conexión se cierra a mitad de un mensaje o el
+                mensaje supera tamano_maximo.
+        """
+        try:
+            header = await self.reader.readexactly(_ENCABEZADO.size)
+            (length,) = _ENCABEZADO.unpack(header)
+            if length > self.tamano_maximo:
+                raise ConnectionError(f"Message too large: {length} bytes")
+            return await self.reader.readexactly(length)
+        except asyncio.IncompleteReadError as e:
+            raise ConnectionError("Connection closed") from e
+
+    # ---------- Protocolo ----------
+    async def _send_message(
+        self, message: str | dict, status: TypeStatus, secuencia: int | None = None
+    ):
+        """
+        Envía un mensaje con estado mediante el protocolo de MessageSocket.
+
+        Args:
+            message: El mensaje a enviar (string o diccionario).
+            status: El estado del mensaje (TypeStatus).
+            secuencia: El número de secuencia del mensaje, None si no lleva.
+        """
+        if self.protocolo == "binario":
+            await self._send_payload(
+                MessageSocket.encode_binary(message, status, secuencia)
+            )
+        else:
+            await self._send_json(
+                MessageSocket.create_message(message, status, secuencia)
+            )
+
+    async def _receive_message(self) -> tuple[TypeStatus, str | dict]:
+        """
+        Recibe un mensaje, en JSON o en binario, y lo procesa.
+
+        Los mensajes de negociación se atienden aquí y no se devuelven (ver
+        BaseSocket._negociar). El número de secuencia del mensaje se recuerda
+        para repetirlo en la respuesta, como en BaseSocket.
+
+        Returns:
+            Una tupla (TypeStatus, mensaje) con el estado y contenido del mensaje.
+        """
+        while True:
+            status, message, secuencia = MessageSocket.decode_frame(
+                await self._recv_payload()
+            )
+            if status is not TypeStatus.NEGOCIACION:
+                self._secuencia_recibida = secuencia
+                return status, message
+            await self._negociar(message)
+
+    async def _negociar(self, message: dict):
+        """
+        Atiende un mensaje de negociación del protocolo de envío.
+
+        Args:
+            message: El contenido del mensaje de negociación.
+        """
+        if "protocolos" in message:
+            elegido = next(
+                (p for p in message["protocolos"] if p in PROTOCOLOS), "json"
+            )
+            await self._send_message({"protocolo": elegido}, TypeStatus.NEGOCIACION)
+            self.protocolo = elegido
+        else:
+            self.protocolo = message["protocolo"]
+
+    async def negotiate_protocol(self, protocolo: str = "binario"):
+        """
+        Pide al otro extremo usar un protocolo de envío, sin esperar la respuesta.
+
+        Args:
+            protocolo: El protocolo preferido, por defecto "binario".
+        """
+        await self._send_message(
+            {"protocolos": [protocolo, "json"]}, TypeStatus.NEGOCIACION
+        )
+
+    # ---------- API ----------
+    async def respond_success(self, message: str | dict = ""):
+        """
+        Envía una respuesta de éxito al remitente.
+
+        Args:
+            message: Mensaje de éxito a enviar (string o diccionario), vacío
+                por defecto.
+        """
+        await self._send_message(message, TypeStatus.SUCCESS, self._secuencia_recibida)
+
+    async def respond_error(self, message: str):
+        """
+        Envía una respuesta de error al remitente.
+
+        Args:
+            message: Mensaje de error a enviar.
+        """
+        await self._send_message(message, TypeStatus.ERROR, self._secuencia_recibida)
+
+    def send_nowait(self, message: str | dict, status: TypeStatus) -> bool:
+        """
+        Envía un mensaje sin esperar la contrapresión.
+
+        Sirve para avisos a un cliente que no deben frenar a quien los envía.
+        Si el cliente ya acumula más de limite_sin_leer bytes sin leer, se lo
+        da por colgado y la conexión se aborta en vez de seguir acumulando.
+
+        Args:
+            message: El mensaje a enviar (string o diccionario).
+            status: El estado del mensaje (TypeStatus).
+
+        Returns:
+            True si el mensaje quedó en el buffer de envío, False si la conexión
+            está cerrada o se abortó.
+        """
+        if self.writer is None or self.writer.transport.is_closing():
+            return False
+        transporte = self.writer.transport
+        if transporte.get_write_buffer_size() > self.limite_sin_leer:
+            transporte.abort()
+            return False
+
+        payload = MessageSocket.encode(message, status, self.protocolo == "binario")
+        self.writer.write(_ENCABEZADO.pack(len(payload)) + payload)
+        return True
+
+    async def send_data(self, data: str | dict):
+        """
+        Envía datos y espera una respuesta de confirmación.
+
+        Args:
+            data: Datos a enviar (string o diccionario).
+
+        Raises:
+            Exception: Si la respuesta es un error.
+        """
+        await self._send_message(data, TypeStatus.ENVIO_DATOS)
+
+        status, response = await self._receive_message()
+        if status == TypeStatus.ERROR:
+            raise Exception(response)
+
+    async def receive_data(self) -> str | dict | None:
+        """
+        Recibe datos del otro extremo.
+
+        Returns:
+            Los datos recibidos, o None si se recibe una señal de cierre.
+
+        Raises:
+            Exception: Si la respuesta es un error.
+        """
+        status, data = await self._receive_message()
+
+        if status == TypeStatus.CLOSE:
+            await self.close(avisar=False)
+            return None
+
+        if status == TypeStatus.ERROR:
+            raise Exception(data)
+        return data
+
+    async def close(self, avisar: bool = True):
+        """
+        Cierra la conexión, avisando antes al otro extremo.
+
+        Args:
+            avisar: Si se envía la señal de cierre antes de cerrar, por defecto
+                True.
+        """
+        if self.writer is None:
+            return
+
+        writer, self.writer = self.writer, None
+        try:
+            if avisar:
+                payload = MessageSocket.encode(
+                    "Connection closing",
+                    TypeStatus.CLOSE,
+                    self.protocolo == "binario",
+                )
+                writer.write(_ENCABEZADO.pack(len(payload)) + payload)
+            writer.close()
+            await writer.wait_closed()
+        except OSError:
+            # El cliente ya se había desconectado
+            pass
+
+
+Manejador = Callable[[AsyncConnection], Awaitable[None]]
+"""Corrutina que atiende una conexión hasta que termina."""
+
+
+class AsyncSocketServer:
+    """
+    Servidor asyncio que atiende muchas conexiones en un solo event loop.
+
+    Cada cliente aceptado se atiende en su propia tarea con la corrutina
+    ``manejador``; al terminar (o si lanza una excepción) la conexión se
+    cierra. Los clientes que llegan con ``max_connections`` conexiones abiertas
+    reciben un error y se desconectan.
+
+    Attributes:
+        manejador: La corrutina que atiende cada conexión.
+        host: La dirección de escucha.
+        port: El puerto de escucha; si se pidió 0, el asignado al iniciar.
+        max_connections: Conexiones simultáneas admitidas.
+        connections: Las conexiones abiertas.
+    """
+
+    def __init__(
+        self,
+        manejador: Manejador,
+        host="localhost",
+        port=54321,
+        max_connections: int = 10_000,
+        tamano_maximo: int = TAMANO_MAXIMO_MENSAJE,
+        limite_escritura: int = LIMITE_ESCRITURA,
+    ) -> None:
+        """
+        Configura el servidor; la escucha empieza con start().
+
+        Args:
+            manejador: Corrutina que atiende cada conexión.
+            host: La dirección IP del servidor, por defecto 'localhost'.
+            port: El puerto de escucha, por defecto 54321; 0 elige uno libre.
+            max_connections: Conexiones simultáneas admitidas, por defecto 10000.
+            tamano_maximo: Bytes máximos del payload de un mensaje recibido.
+            limite_escritura: Bytes pendientes por conexión a partir de los
+                cuales un envío espera.
+        """
+        self.manejador = manejador
+        self.host = host
+        self.port = port
+        self.max_connections = max_connections
+        self.connections: set[AsyncConnection] = set()
+        self._tamano_maximo = tamano_maximo
+        self._limite_escritura = limite_escritura
+        self._server: asyncio.Server | None = None
+        self._tareas: set[asyncio.Task] = set()
+
+    async def start(self):
+        """Empieza a escuchar conexiones entrantes."""
+        self._server = await asyncio.start_server(
+            self._atender, self.host, self.port, backlog=min(self.max_connections, 4096)
+        )
+        self.port = self._server.sockets[0].getsockname()[1]
+        print(f"Server listening on {self.host}:{self.port}")
+
+    async def serve_forever(self):
+        """
+        Atiende conexiones hasta que se cancele la tarea o se llame a close().
+
+        Raises:
+            RuntimeError: Si el servidor no se inició.
+        """
+        if self._server is None:
+            raise RuntimeError("The server has not been started")
+        try:
+            await self._server.serve_forever()
+        except asyncio.CancelledError:
+            if self._server is not None:
+                raise
+
+    async def _atender(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ):
+        """
+        Atiende una conexión aceptada, en su propia tarea.
+
+        Args:
+            reader: El flujo de lectura de la conexión.
+            writer: El flujo de escritura de la conexión.
+        """
+        conexion = AsyncConnection(
+            reader, writer, self._tamano_maximo, self._limite_escritura
+        )
+        if len(self.connections) >= self.max_connections:
+            try:
+                await conexion.respond_error("Server full")
+            except ConnectionError:
+                pass
+            await conexion.close(avisar=False)
+            return
+
+        tarea = asyncio.current_task()
+        self._tareas.add(tarea)
+        self.connections.add(conexion)
+        try:
+            await self.manejador(conexion)
+        except ConnectionError:
+            # El cliente se desconectó
+            pass
+        except asyncio.CancelledError:
+            # close() cancela las tareas; la conexión se cierra abajo
+            pass
+        except Exception as e:
+            try:
+                await conexion.respond_error(str(e))
+            except ConnectionError:
+                pass
+        finally:
+            self.connections.discard(conexion)
+            self._tareas.discard(tarea)
+            await conexion.close()
+
+    async def close(self):
+        """
+        Deja de escuchar, avisa el cierre a todas las conexiones y espera sus tareas.
+        """
+        if self._server is None:
+            return
+
+        server, self._server = self._server, None
+        server.close()
+        for tarea in list(self._tareas):
+            tarea.cancel()
+        await asyncio.gather(*self._tareas, return_exceptions=True)
+        await server.wait_closed()
+        print("Socket de escucha del servidor cerrado.")
+
+    async def __aenter__(self):
+        """
+        Inicia el servidor al entrar en un bloque async with.
+
+        Returns:
+            La instancia del servidor.
+        """
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        """
+        Cierra el servidor al salir del bloque async with.
+
+        Args:
+            exc_type: Tipo de excepción si ocurrió una.
+            exc_value: Valor de la excepción si ocurrió una.
+            traceback: Traceback de la excepción si ocurrió una.
+        """
+        await self.close()
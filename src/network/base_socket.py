@@ -4,11 +4,23 @@ import json
 import socket
 import struct
 from abc import ABC, abstractmethod
+from collections import deque
 from functools import wraps
 
-from .message_socket import MessageSocket
+from .message_socket import PROTOCOLOS, SECUENCIA_MAXIMA, MessageSocket
 from .type_status import TypeStatus
 
+TAMANO_BUFFER = 64 * 1024
+"""Tamaño inicial del buffer de lectura, en bytes."""
+
+TAMANO_MAXIMO_MENSAJE: int = 1 << 20
+"""Bytes máximos del payload de un mensaje; uno mayor cierra la conexión."""
+
+VENTANA: int = 32
+"""Mensajes de send_data_pipelined() sin confirmar admitidos por defecto."""
+
+_ENCABEZADO = struct.Struct("!I")
+
 
 class BaseSocket(ABC):
     """
@@ -17,11 +29,46 @@ class BaseSocket(ABC):
     Esta clase proporciona métodos de bajo nivel para enviar y recibir datos
     JSON a través de sockets, así como un protocolo de mensajes de alto nivel.
 
+    Los mensajes recibidos se aceptan en JSON o en binario (ver MessageSocket);
+    los enviados usan JSON salvo que se negocie el binario con
+    negotiate_protocol(), de modo que los clientes que solo hablan JSON siguen
+    funcionando.
+
+    Las lecturas pasan por un buffer reutilizable que se llena con
+    recv_into(): cada recv trae todos los bytes disponibles, y los mensajes
+    completos que ya estén en el buffer se entregan sin volver al socket. Los
+    payloads se devuelven como vistas sobre ese buffer, sin copiarlos, y dejan
+    de ser válidos en la siguiente lectura. Un encabezado que anuncia más de
+    ``tamano_maximo`` bytes se rechaza antes de reservar memoria, y tras un
+    mensaje grande el buffer vuelve a TAMANO_BUFFER.
+
+    send_data() espera la confirmación de cada mensaje antes de seguir.
+    send_data_pipelined() numera el mensaje y solo espera cuando ya hay
+    ``ventana`` mensajes sin confirmar, de modo que un enlace con mucha
+    latencia no limita el caudal; respond_success() y respond_error() repiten
+    el número del último mensaje recibido. Los mensajes del otro extremo que
+    llegan mientras se esperan confirmaciones se guardan para receive_data().
+
     Attributes:
         conn: El socket de conexión, None si no está conectado.
+        protocolo: El formato de los mensajes enviados, "json" o "binario".
+        tamano_maximo: Bytes máximos del payload de un mensaje recibido.
+        ventana: Mensajes de send_data_pipelined() que pueden estar sin
+            confirmar a la vez.
     """
 
     conn: socket.socket | None = None
+    protocolo: str = "json"
+    tamano_maximo: int = TAMANO_MAXIMO_MENSAJE
+    ventana: int = VENTANA
+    _vista: memoryview = memoryview(b"")
+    _inicio: int = 0
+    _fin: int = 0
+    _secuencia: int = 0
+    _secuencia_recibida: int | None = None
+    _pendientes: dict[int, None] | None = None
+    _fallidos: dict[int, str | dict] | None = None
+    _recibidos: deque | None = None
 
     def asegurar_conexion(func):
         """
@@ -45,6 +92,20 @@ class BaseSocket(ABC):
 
         return wrapper
 
+    def _fijar_ventana(self, ventana: int):
+        """
+        Fija la cantidad de mensajes de send_data_pipelined() sin confirmar.
+
+        Args:
+            ventana: Mensajes que pueden estar en vuelo a la vez.
+
+        Raises:
+            ValueError: Si la ventana es menor que 1.
+        """
+        if ventana < 1:
+            raise ValueError(f"Window must be at least 1, got {ventana}")
+        self.ventana = ventana
+
     # ---------- Bajo Nivel ----------
     @asegurar_conexion
     def _send_json(self, data: dict):
@@ -56,70 +117,236 @@ class BaseSocket(ABC):
         Args:
             data: Diccionario a enviar en formato JSON.
         """
-        payload = json.dumps(data).encode("utf-8")
-        header = struct.pack("!I", len(payload))
-        self.conn.sendall(header + payload)
+        self._send_payload(json.dumps(data).encode("utf-8"))
+
+    @asegurar_conexion
+    def _send_payload(self, payload: bytes):
+        """
+        Envía un payload con el encabezado que contiene su longitud.
+
+        Args:
+            payload: Los bytes a enviar.
+        """
+        self.conn.sendall(_ENCABEZADO.pack(len(payload)) + payload)
 
     def _recv_json(self) -> dict:
         """
         Recibe datos JSON desde el socket.
 
+        Returns:
+            Diccionario con los datos JSON recibidos.
+        """
+        return json.loads(str(self._recv_payload(), "utf-8"))
+
+    def _recv_payload(self) -> memoryview:
+        """
+        Recibe el payload de un mensaje.
+
         Lee primero el encabezado (4 bytes) para obtener la longitud,
         luego recibe exactamente esa cantidad de datos.
 
         Returns:
-            Diccionario con los datos JSON recibidos.
-        """
-        header = self._recv_exact(4)
-        length = struct.unpack("!I", header)[0]
+            Una vista del payload sobre el buffer de lectura, válida hasta la
+            siguiente lectura.
 
-        data = self._recv_exact(length)
+        Raises:
+            ConnectionError: Si la conexión se cierra a mitad de un mensaje o el
+                mensaje supera tamano_maximo.
+        """
+        length = _ENCABEZADO.unpack(self._recv_exact(4))[0]
+        if length > self.tamano_maximo:
+            raise ConnectionError(f"Message too large: {length} bytes")
 
-        return json.loads(data.decode("utf-8"))
+        return self._recv_exact(length)
 
     @asegurar_conexion
-    def _recv_exact(self, n: int) -> bytes:
+    def _recv_exact(self, n: int) -> memoryview:
         """
         Recibe exactamente n bytes del socket.
 
+        Los toma del buffer de lectura y solo llama a recv cuando no alcanzan,
+        por lo que varios mensajes llegados juntos se leen con una sola llamada.
+
         Args:
             n: Número de bytes a recibir.
 
         Returns:
-            Los bytes recibidos.
+            Una vista de los bytes recibidos, válida hasta la siguiente lectura.
 
         Raises:
             ConnectionError: Si la conexión se cierra antes de recibir todos los datos.
         """
-        data = b""
-        while len(data) < n:
-            chunk = self.conn.recv(n - len(data))
-            if not chunk:
+        if self._fin - self._inicio < n:
+            self._llenar(n)
+        inicio = self._inicio
+        self._inicio = inicio + n
+        return self._vista[inicio : self._inicio]
+
+    def _llenar(self, n: int):
+        """
+        Lee del socket hasta tener al menos n bytes pendientes en el buffer.
+
+        Mueve los bytes pendientes al inicio del buffer cuando no hay lugar al
+        final, y lo reemplaza por uno más grande si n no cabe, o por uno de
+        TAMANO_BUFFER si quedó agrandado por un mensaje anterior y ya no hace
+        falta. Cada recv_into pide todo el espacio libre, no solo lo que falta.
+
+        Args:
+            n: Número de bytes pendientes necesarios.
+
+        Raises:
+            ConnectionError: Si la conexión se cierra antes de tener n bytes.
+        """
+        pendientes = self._fin - self._inicio
+        if len(self._vista) < n:
+            tamano = max(n, 2 * len(self._vista), TAMANO_BUFFER)
+        elif len(self._vista) > TAMANO_BUFFER and max(n, pendientes) <= TAMANO_BUFFER:
+            tamano = TAMANO_BUFFER
+        else:
+            tamano = 0
+
+        if tamano:
+            buffer = bytearray(tamano)
+            buffer[:pendientes] = self._vista[self._inicio : self._fin]
+            self._vista = memoryview(buffer)
+            self._inicio, self._fin = 0, pendientes
+        elif len(self._vista) - self._inicio < n:
+            self._vista[:pendientes] = self._vista[self._inicio : self._fin]
+            self._inicio, self._fin = 0, pendientes
+
+        while self._fin - self._inicio < n:
+            leidos = self.conn.recv_into(self._vista[self._fin :])
+            if not leidos:
                 raise ConnectionError("Connection closed")
-            data += chunk
-        return data
+            self._fin += leidos
+
+    def _reiniciar_conexion(self):
+        """
+        Descarta el estado de la conexión anterior: el protocolo negociado, el
+        buffer de lectura, los mensajes guardados y la numeración de
+        send_data_pipelined().
+        """
+        self.protocolo = "json"
+        self._vista = memoryview(b"")
+        self._inicio = self._fin = 0
+        self._secuencia = 0
+        self._secuencia_recibida = None
+        self._pendientes = None
+        self._fallidos = None
+        self._recibidos = None
 
     # ---------- Protocolo ----------
-    def _send_message(self, message: str | dict, status: TypeStatus):
+    def _send_message(
+        self, message: str | dict, status: TypeStatus, secuencia: int | None = None
+    ):
         """
         Envía un mensaje con estado mediante el protocolo de MessageSocket.
 
         Args:
             message: El mensaje a enviar (string o diccionario).
             status: El estado del mensaje (TypeStatus).
+            secuencia: El número de secuencia del mensaje, None si no lleva.
         """
-        data = MessageSocket.create_message(message, status)
-        self._send_json(data)
+        if self.protocolo == "binario":
+            self._send_payload(MessageSocket.encode_binary(message, status, secuencia))
+        else:
+            self._send_json(MessageSocket.create_message(message, status, secuencia))
 
     def _receive_message(self) -> tuple[TypeStatus, str | dict]:
         """
-        Recibe un mensaje del socket y lo procesa.
+        Recibe un mensaje, en JSON o en binario, y lo procesa.
+
+        Devuelve primero los mensajes guardados mientras se esperaban
+        confirmaciones y recuerda el número de secuencia del mensaje para
+        repetirlo en la respuesta.
 
         Returns:
             Una tupla (TypeStatus, mensaje) con el estado y contenido del mensaje.
         """
-        data = self._recv_json()
-        return MessageSocket.parse_message(data)
+        if self._recibidos:
+            status, message, self._secuencia_recibida = self._recibidos.popleft()
+        else:
+            status, message, self._secuencia_recibida = self._recibir_mensaje()
+        return status, message
+
+    def _recibir_mensaje(self) -> tuple[TypeStatus, str | dict, int | None]:
+        """
+        Recibe un mensaje del socket con su número de secuencia.
+
+        Los mensajes de negociación se atienden aquí y no se devuelven.
+
+        Returns:
+            Una tupla (TypeStatus, mensaje, secuencia); la secuencia es None si
+            el mensaje no lleva.
+        """
+        while True:
+            status, message, secuencia = MessageSocket.decode_frame(
+                self._recv_payload()
+            )
+            if status is not TypeStatus.NEGOCIACION:
+                return status, message, secuencia
+            self._negociar(message)
+
+    def _esperar_confirmacion(self):
+        """
+        Recibe mensajes hasta confirmar uno enviado con send_data_pipelined().
+
+        Una respuesta con número de secuencia confirma ese mensaje; una sin él,
+        como las de un extremo que no numera, confirma el más antiguo, ya que
+        las respuestas llegan en orden. Los errores se guardan para
+        flush_pipeline() y cualquier otro mensaje para receive_data().
+
+        Raises:
+            ConnectionError: Si el otro extremo cierra con mensajes sin confirmar.
+        """
+        while True:
+            status, message, secuencia = self._recibir_mensaje()
+            if status is TypeStatus.SUCCESS or status is TypeStatus.ERROR:
+                if secuencia is None:
+                    secuencia = next(iter(self._pendientes))
+                if self._pendientes.pop(secuencia, False) is None:
+                    if status is TypeStatus.ERROR:
+                        self._fallidos[secuencia] = message
+                    return
+                continue
+
+            if self._recibidos is None:
+                self._recibidos = deque()
+            self._recibidos.append((status, message, secuencia))
+            if status is TypeStatus.CLOSE:
+                raise ConnectionError("Connection closed with unacknowledged data")
+
+    def _negociar(self, message: dict):
+        """
+        Atiende un mensaje de negociación del protocolo de envío.
+
+        Un pedido (``{"protocolos": [...]}``) se responde con el primero que
+        también figure en PROTOCOLOS, que pasa a usarse desde ese momento; una
+        respuesta (``{"protocolo": ...}``) cambia el protocolo propio.
+
+        Args:
+            message: El contenido del mensaje de negociación.
+        """
+        if "protocolos" in message:
+            elegido = next(
+                (p for p in message["protocolos"] if p in PROTOCOLOS), "json"
+            )
+            self._send_message({"protocolo": elegido}, TypeStatus.NEGOCIACION)
+            self.protocolo = elegido
+        else:
+            self.protocolo = message["protocolo"]
+
+    def negotiate_protocol(self, protocolo: str = "binario"):
+        """
+        Pide al otro extremo usar un protocolo de envío.
+
+        No espera la respuesta: mientras no llegue se sigue enviando JSON, que
+        el otro extremo siempre acepta, y el cambio ocurre al recibirla.
+
+        Args:
+            protocolo: El protocolo preferido, por defecto "binario".
+        """
+        self._send_message({"protocolos": [protocolo, "json"]}, TypeStatus.NEGOCIACION)
 
     # ---------- API ----------
     def respond_success(self, message: str = ""):
@@ -129,7 +356,7 @@ class BaseSocket(ABC):
         Args:
             message: Mensaje de éxito a enviar, vacío por defecto.
         """
-        self._send_message(message, TypeStatus.SUCCESS)
+        self._send_message(message, TypeStatus.SUCCESS, self._secuencia_recibida)
 
     def respond_error(self, message: str):
         """
@@ -138,7 +365,7 @@ class BaseSocket(ABC):
         Args:
             message: Mensaje de error a enviar.
         """
-        self._send_message(message, TypeStatus.ERROR)
+        self._send_message(message, TypeStatus.ERROR, self._secuencia_recibida)
 
     def send_data(self, data: str | dict):
         """
@@ -147,15 +374,64 @@ class BaseSocket(ABC):
         Args:
             data: Datos a enviar (string o diccionario).
 
+        Antes espera las confirmaciones pendientes de send_data_pipelined(); sus
+        errores quedan para flush_pipeline().
+
         Raises:
             Exception: Si la respuesta es un error.
         """
+        while self._pendientes:
+            self._esperar_confirmacion()
         self._send_message(data, TypeStatus.ENVIO_DATOS)
 
-        status, response = self._receive_message()
+        status, response, _ = self._recibir_mensaje()
         if status == TypeStatus.ERROR:
             raise Exception(response)
 
+    def send_data_pipelined(self, data: str | dict) -> int:
+        """
+        Envía datos numerados sin esperar su confirmación.
+
+        Solo espera, confirmando los mensajes más antiguos, cuando ya hay
+        ``ventana`` mensajes sin confirmar. Los errores no interrumpen el envío:
+        se informan en flush_pipeline().
+
+        Args:
+            data: Datos a enviar (string o diccionario).
+
+        Returns:
+            El número de secuencia del mensaje.
+
+        Raises:
+            ValueError: Si ventana es menor que 1.
+        """
+        if self.ventana < 1:
+            raise ValueError(f"Window must be at least 1, got {self.ventana}")
+        if self._pendientes is None:
+            self._pendientes = {}
+            self._fallidos = {}
+        while len(self._pendientes) >= self.ventana:
+            self._esperar_confirmacion()
+
+        secuencia = self._secuencia = (self._secuencia + 1) & SECUENCIA_MAXIMA
+        self._send_message(data, TypeStatus.ENVIO_DATOS, secuencia)
+        self._pendientes[secuencia] = None
+        return secuencia
+
+    def flush_pipeline(self) -> dict[int, str | dict]:
+        """
+        Espera las confirmaciones de todos los mensajes de send_data_pipelined().
+
+        Returns:
+            Los mensajes rechazados desde la llamada anterior, como un
+            diccionario de número de secuencia a respuesta de error; vacío si
+            todos se confirmaron con éxito.
+        """
+        while self._pendientes:
+            self._esperar_confirmacion()
+        fallidos, self._fallidos = self._fallidos or {}, {}
+        return fallidos
+
     def receive_data(self) -> str | dict | None:
         """
         Recibe datos desde el socket.
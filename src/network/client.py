@@ -3,7 +3,7 @@
 import socket
 from typing import override
 
-from .base_socket import BaseSocket
+from .base_socket import VENTANA, BaseSocket
 from .type_status import TypeStatus
 
 
@@ -21,16 +21,26 @@ class SocketClient(BaseSocket):
     conn: socket.socket
 
     @override
-    def __init__(self, host="localhost", port=54321):
+    def __init__(self, host="localhost", port=54321, protocolo="json", ventana=VENTANA):
         """
         Inicializa el cliente y establece la conexión con el servidor.
 
         Args:
             host: La dirección IP o nombre del servidor, por defecto 'localhost'.
             port: El puerto del servidor, por defecto 54321.
+            protocolo: El protocolo de envío a negociar, "json" (por defecto, sin
+                negociar) o "binario".
+            ventana: Mensajes de send_data_pipelined() sin confirmar admitidos,
+                por defecto VENTANA.
+
+        Raises:
+            ValueError: Si la ventana es menor que 1.
         """
+        self._fijar_ventana(ventana)
         self.conn = socket.create_connection((host, port))
         print(f"Connected to server at {host}:{port}")
+        if protocolo != "json":
+            self.negotiate_protocol(protocolo)
 
     @override
     def close(self):
@@ -0,0 +1,433 @@
+"""Módulo con el servidor de partidas de HyperCat con muchas salas por proceso.
+
+MatchServer empareja a los clientes de AsyncSocketServer en salas de dos
+jugadores. Cada sala tiene la partida autoritativa: el servidor valida cada
+jugada y envía la posición resultante a ambos jugadores.
+
+Protocolo (mensajes de MessageSocket, con datos como diccionarios):
+
+- El cliente envía ENVIO_DATOS con ``{"accion": "buscar"}`` para entrar a una
+  sala; la respuesta SUCCESS indica ``{"sala": id, "lado": "X" | "O"}``. El
+  primero en llegar juega con X.
+- El cliente envía JUGADA con ``{"fila": f, "columna": c}`` en coordenadas
+  globales [0-8] (o ENVIO_DATOS con ``{"accion": "jugar", "fila": f,
+  "columna": c}``); la respuesta es SUCCESS o ERROR con el nombre del
+  EstadoJugada (o del motivo) por el que se rechazó.
+- ``{"accion": "abandonar"}`` deja la sala; cerrar la conexión también.
+- El servidor envía ESTADO (ver Room.estado) a ambos jugadores al completarse
+  la sala y tras cada jugada, y ENVIO_DATOS con ``{"evento": "abandono"}`` o
+  ``{"evento": "expirada"}`` cuando la sala se cierra antes de terminar. El
+  servidor no espera confirmación de estos mensajes e ignora los SUCCESS que
+  reciba. Tampoco espera a que el cliente los lea (ver
+  AsyncConnection.send_nowait), así que un cliente que deja de leer no frena a
+  su rival ni a la limpieza de salas: su conexión se aborta.
+
+Con el protocolo binario negociado (ver MessageSocket), una jugada ocupa 6
+bytes con el encabezado y un estado 37.
+
+Un cliente de SocketClient debe jugar solo cuando el último estado indica su
+turno, para que la respuesta a su jugada no se cruce con un estado enviado.
+
+Uso::
+
+    async with MatchServer(port=54321) as server:
+        await server.serve_forever()
+"""
+
+import asyncio
+import itertools
+import logging
+import time
+from collections import OrderedDict
+
+from src.core import HyperCat
+from src.core.codec_posicion import a_bytes
+from src.enums import EstadoCasilla, EstadoJugada, Resultado
+
+from .async_server import AsyncConnection, AsyncSocketServer
+from .type_status import TypeStatus
+
+INACTIVIDAD_MAXIMA: float = 300.0
+"""Segundos sin jugadas tras los cuales una sala se cierra."""
+
+INTERVALO_LIMPIEZA: float = 10.0
+"""Segundos entre dos revisiones de salas inactivas."""
+
+_LADOS: tuple[EstadoCasilla, EstadoCasilla] = (EstadoCasilla.X, EstadoCasilla.O)
+
+_log = logging.getLogger(__name__)
+
+
+class Room:
+    """
+    Sala con una partida de HyperCat entre dos conexiones.
+
+    La partida no guarda su historial, que el servidor no necesita para
+    deshacer: las jugadas se conservan en ``jugadas``, un byte por jugada
+    (``fila * 9 + columna``), igual que archivo_partidas.
+
+    Attributes:
+        id: Identificador de la sala.
+        juego: La partida autoritativa.
+        jugadores: Las conexiones de X y de O; O es None mientras se espera.
+        jugadas: Las jugadas realizadas, un byte por jugada.
+        actividad: Instante (time.monotonic) de la última jugada o ingreso.
+    """
+
+    __slots__ = ("id", "juego", "jugadores", "jugadas", "actividad")
+
+    def __init__(self, id: int, jugador: AsyncConnection) -> None:
+        """
+        Crea una sala con su primer jugador, que juega con X.
+
+        Args:
+            id: Identificador de la sala.
+            jugador: La conexión del primer jugador.
+        """
+        self.id = id
+        self.juego = HyperCat()
+        self.jugadores: list[AsyncConnection | None] = [jugador, None]
+        self.jugadas = bytearray()
+        self.actividad = time.monotonic()
+
+    def completa(self) -> bool:
+        """
+        Verifica si la sala ya tiene a sus dos jugadores.
+
+        Returns:
+            True si ambos lados tienen una conexión.
+        """
+        return self.jugadores[1] is not None
+
+    def jugar(self, fila: int, columna: int) -> EstadoJugada:
+        """
+        Valida y aplica la jugada del jugador de turno.
+
+        Args:
+            fila: El índice global de la fila [0-8].
+            columna: El índice global de la columna [0-8].
+
+        Returns:
+            OK si se jugó, o el motivo por el que se rechazó.
+        """
+        if not (0 <= fila < 9 and 0 <= columna < 9):
+            return EstadoJugada.FUERA_DE_RANGO
+        juego = self.juego
+        sub_tablero = (fila // 3, columna // 3)
+        # intentar_jugar() usa el sub-tablero obligatorio sin mirar el pedido
+        if not juego.elegir_cualquiera and juego.gato_a_jugar_despues != sub_tablero:
+            if juego.resultado is not Resultado.EN_CURSO:
+                return EstadoJugada.JUEGO_TERMINADO
+            return EstadoJugada.SUBGATO_NO_PERMITIDO
+
+        estado = juego.intentar_jugar(fila % 3, columna % 3, *sub_tablero)
+        if estado is EstadoJugada.OK:
+            juego.historial.pop()
+            self.jugadas.append(fila * 9 + columna)
+            self.actividad = time.monotonic()
+        return estado
+
+    def estado(self, lado: int) -> dict:
+        """
+        Describe la posición para uno de los jugadores.
+
+        Args:
+            lado: 0 para X, 1 para O.
+
+        Returns:
+            Diccionario con la sala, el lado del jugador, el turno, la última
+            jugada (o None), el nombre del resultado y los 24 bytes de la
+            posición de codec_posicion.a_bytes.
+        """
+        ultima = divmod(self.jugadas[-1], 9) if self.jugadas else None
+        return {
+            "sala": self.id,
+            "lado": _LADOS[lado].name,
+            "turno": self.juego.turno.name,
+            "ultima": ultima,
+            "resultado": self.juego.resultado.name,
+            "posicion": a_bytes(self.juego),
+        }
+
+
+class MatchServer:
+    """
+    Servidor que aloja muchas partidas de HyperCat en un solo event loop.
+
+    Las salas se guardan en un OrderedDict por id, así que buscar una sala
+    cuesta O(1); el orden es el de la última actividad, de modo que la
+    limpieza periódica solo recorre las salas que ya expiraron.
+
+    Attributes:
+        server: El servidor de conexiones.
+        rooms: Las salas abiertas por id, de la menos a la más reciente.
+        inactividad: Segundos sin jugadas tras los cuales una sala se cierra.
+        intervalo: Segundos entre dos revisiones de salas inactivas.
+    """
+
+    def __init__(
+        self,
+        host="localhost",
+        port=54321,
+        max_connections: int = 20_000,
+        inactividad: float = INACTIVIDAD_MAXIMA,
+        intervalo: float = INTERVALO_LIMPIEZA,
+    ) -> None:
+        """
+        Configura el servidor; la escucha empieza con start().
+
+        Args:
+            host: La dirección IP del servidor, por defecto 'localhost'.
+            port: El puerto de escucha, por defecto 54321; 0 elige uno libre.
+            max_connections: Conexiones simultáneas admitidas, por defecto 20000
+                (10000 partidas).
+            inactividad: Segundos sin jugadas tras los cuales una sala se cierra.
+            intervalo: Segundos entre dos revisiones de salas inactivas.
+        """
+        self.server = AsyncSocketServer(self._atender, host, port, max_connections)
+        self.rooms: OrderedDict[int, Room] = OrderedDict()
+        self.inactividad = inactividad
+        self.intervalo = intervalo
+        self._esperando: Room | None = None
+        self._ids = itertools.count(1)
+        self._limpieza: asyncio.Task | None = None
+
+    @property
+    def port(self) -> int:
+        """
+        Obtiene el puerto de escucha.
+
+        Returns:
+            El puerto; si se pidió 0, el asignado al iniciar.
+        """
+        return self.server.port
+
+    def room(self, id: int) -> Room | None:
+        """
+        Busca una sala abierta por su id.
+
+        Args:
+            id: El identificador de la sala.
+
+        Returns:
+            La sala, o None si no existe o ya se cerró.
+        """
+        return self.rooms.get(id)
+
+    async def start(self):
+        """Empieza a escuchar conexiones y a cerrar las salas inactivas."""
+        await self.server.start()
+        self._limpieza = asyncio.create_task(self._limpiar())
+
+    async def serve_forever(self):
+        """Atiende conexiones hasta que se cancele la tarea o se llame a close()."""
+        await self.server.serve_forever()
+
+    async def close(self):
+        """Deja de limpiar salas y cierra el servidor y todas las conexiones."""
+        if self._limpieza is not None:
+            self._limpieza.cancel()
+            self._limpieza = None
+        await self.server.close()
+        self.rooms.clear()
+        self._esperando = None
+
+    async def __aenter__(self):
+        """
+        Inicia el servidor al entrar en un bloque async with.
+
+        Returns:
+            La instancia del servidor.
+        """
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        """
+        Cierra el servidor al salir del bloque async with.
+
+        Args:
+            exc_type: Tipo de excepción si ocurrió una.
+            exc_value: Valor de la excepción si ocurrió una.
+            traceback: Traceback de la excepción si ocurrió una.
+        """
+        await self.close()
+
+    async def _atender(self, conexion: AsyncConnection):
+        """
+        Atiende los pedidos de un cliente hasta que se desconecta.
+
+        Args:
+            conexion: La conexión del cliente.
+        """
+        sala: Room | None = None
+        lado = 0
+        try:
+            while True:
+                status, datos = await conexion._receive_message()
+                if status == TypeStatus.CLOSE:
+                    return
+                if status == TypeStatus.JUGADA:
+                    accion = "jugar"
+                elif status == TypeStatus.ENVIO_DATOS and isinstance(datos, dict):
+                    accion = datos.get("accion")
+                elif status == TypeStatus.ENVIO_DATOS:
+                    accion = None
+                else:
+                    # Confirmaciones de los estados enviados
+                    continue
+
+                activa = sala is not None and self.rooms.get(sala.id) is sala
+                match accion:
+                    case "buscar" if activa:
+                        await conexion.respond_error("YA_EN_SALA")
+                    case "buscar":
+                        sala, lado = self._buscar(conexion)
+                        await conexion.respond_success(
+                            {"sala": sala.id, "lado": _LADOS[lado].name}
+                        )
+                        if sala.completa():
+                            self._enviar_estado(sala)
+                    case "jugar" if activa:
+                        await self._jugar(sala, lado, conexion, datos)
+                    case "jugar":
+                        await conexion.respond_error("SIN_SALA")
+                    case "abandonar" if activa:
+                        await conexion.respond_success()
+                        self._cerrar_sala(sala, "abandono")
+                    case _:
+                        await conexion.respond_error("ACCION_INVALIDA")
+        finally:
+            if sala is not None and self.rooms.get(sala.id) is sala:
+                self._cerrar_sala(sala, "abandono")
+
+    def _buscar(self, conexion: AsyncConnection) -> tuple[Room, int]:
+        """
+        Ubica a un cliente en la sala que espera rival o en una nueva.
+
+        Args:
+            conexion: La conexión del cliente.
+
+        Returns:
+            La sala y el lado del cliente (0 para X, 1 para O).
+        """
+        sala = self._esperando
+        if sala is not None and self.rooms.get(sala.id) is sala:
+            self._esperando = None
+            sala.jugadores[1] = conexion
+            self._tocar(sala)
+            return sala, 1
+
+        sala = self._esperando = Room(next(self._ids), conexion)
+        self.rooms[sala.id] = sala
+        return sala, 0
+
+    async def _jugar(
+        self, sala: Room, lado: int, conexion: AsyncConnection, datos: dict
+    ):
+        """
+        Valida una jugada, responde al jugador y envía el estado a ambos.
+
+        Args:
+            sala: La sala del jugador.
+            lado: 0 para X, 1 para O.
+            conexion: La conexión del jugador.
+            datos: El pedido, con la fila y la columna globales.
+        """
+        fila, columna = datos.get("fila"), datos.get("columna")
+        if not sala.completa():
+            await conexion.respond_error("SIN_RIVAL")
+        elif sala.juego.turno is not _LADOS[lado]:
+            await conexion.respond_error("FUERA_DE_TURNO")
+        elif type(fila) is not int or type(columna) is not int:
+            await conexion.respond_error(EstadoJugada.FUERA_DE_RANGO.name)
+        elif (estado := sala.jugar(fila, columna)) is not EstadoJugada.OK:
+            await conexion.respond_error(estado.name)
+        else:
+            self._tocar(sala)
+            await conexion.respond_success()
+            self._enviar_estado(sala)
+            if sala.juego.resultado is not Resultado.EN_CURSO:
+                self._quitar(sala)
+
+    def _tocar(self, sala: Room):
+        """
+        Marca actividad en una sala y la mueve al final del orden de limpieza.
+
+        Args:
+            sala: La sala.
+        """
+        sala.actividad = time.monotonic()
+        self.rooms.move_to_end(sala.id)
+
+    def _quitar(self, sala: Room):
+        """
+        Quita una sala del servidor.
+
+        Args:
+            sala: La sala.
+        """
+        self.rooms.pop(sala.id, None)
+        if self._esperando is sala:
+            self._esperando = None
+
+    def _enviar_estado(self, sala: Room):
+        """
+        Envía la posición de la sala a sus jugadores, sin esperar confirmación.
+
+        Args:
+            sala: La sala.
+        """
+        estado = sala.estado(0)
+        self._notificar(
+            sala, [estado, {**estado, "lado": _LADOS[1].name}], TypeStatus.ESTADO
+        )
+
+    def _cerrar_sala(self, sala: Room, evento: str):
+        """
+        Quita una sala y avisa a sus jugadores por qué terminó.
+
+        Args:
+            sala: La sala.
+            evento: "abandono" o "expirada".
+        """
+        self._quitar(sala)
+        self._notificar(sala, [{"evento": evento, "sala": sala.id}] * 2)
+
+    def _notificar(
+        self,
+        sala: Room,
+        mensajes: list[dict],
+        status: TypeStatus = TypeStatus.ENVIO_DATOS,
+    ):
+        """
+        Envía un mensaje a cada jugador conectado de una sala, sin esperarlo.
+
+        Args:
+            sala: La sala.
+            mensajes: El mensaje para X y el mensaje para O.
+            status: El estado de los mensajes, por defecto ENVIO_DATOS.
+        """
+        for jugador, mensaje in zip(sala.jugadores, mensajes):
+            if jugador is not None:
+                jugador.send_nowait(mensaje, status)
+
+    async def _limpiar(self):
+        """
+        Cierra periódicamente las salas sin actividad reciente.
+
+        Un error al cerrar una sala se registra y no detiene la limpieza.
+        """
+        while True:
+            await asyncio.sleep(self.intervalo)
+            limite = time.monotonic() - self.inactividad
+            vencidas = []
+            for sala in self.rooms.values():
+                if sala.actividad > limite:
+                    break
+                vencidas.append(sala)
+            for sala in vencidas:
+                try:
+                    self._cerrar_sala(sala, "expirada")
+                except Exception:
+                    _log.exception("Error closing expired room %d", sala.id)
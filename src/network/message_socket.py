@@ -1,7 +1,75 @@
-"""Módulo que contiene la clase para crear y procesar mensajes de socket."""
+"""Módulo que contiene la clase para crear y procesar mensajes de socket.
+
+Los mensajes viajan en uno de dos formatos, y cada payload indica el suyo:
+
+- JSON: ``{"status": nombre, "message": ...}``; siempre empieza con ``{``.
+- Binario: un byte de tipo seguido del contenido. Los 3 bits bajos del tipo
+  son el valor de TypeStatus y los bits 3 y 4 la clase de contenido (vacío,
+  texto UTF-8 o JSON). JUGADA y ESTADO tienen un contenido fijo: 1 byte con
+  ``fila * 9 + columna`` y la instantánea de _ESTADO (32 bytes con los 24 de
+  codec_posicion). Un tipo nunca vale ``{``, así que decode() reconoce el
+  formato sin estado de conexión.
+
+Un mensaje puede llevar además un número de secuencia, para que su respuesta
+lo repita y el remitente pueda tener varios mensajes en vuelo: en JSON es la
+llave ``"id"`` y en binario el bit 5 del tipo seguido de 4 bytes antes del
+contenido. Sin número de secuencia, ambos formatos quedan como antes.
+
+Con JSON una jugada ocupa unos 55 bytes más el encabezado; en binario, 2.
+"""
+
+import json
+import struct
+
+from src.core.codec_posicion import TAMANO_POSICION
+from src.enums import Resultado
 
 from .type_status import TypeStatus
 
+PROTOCOLOS: tuple[str, ...] = ("binario", "json")
+"""Protocolos de envío admitidos, en orden de preferencia."""
+
+_LLAVE = ord("{")
+
+_VACIO, _TEXTO, _JSON = 0, 1 << 3, 2 << 3
+_CLASE = 0b11 << 3
+_STATUS = 0b111
+_CON_SECUENCIA = 1 << 5
+
+SECUENCIA_MAXIMA: int = 2**32 - 1
+"""Mayor número de secuencia que admite un mensaje."""
+
+_SECUENCIA = struct.Struct("!I")
+
+_CABECERA = struct.Struct("!BI")
+"""Byte de tipo seguido del número de secuencia."""
+
+_STATUS_POR_TIPO: tuple[TypeStatus | None, ...] = tuple(
+    next((s for s in TypeStatus if s.value == tipo & _STATUS), None)
+    for tipo in range(_CON_SECUENCIA << 1)
+)
+"""TypeStatus de cada byte de tipo válido, None si los 3 bits bajos no son uno."""
+
+_BYTE_TIPO: tuple[bytes, ...] = tuple(bytes((tipo,)) for tipo in range(1 << 8))
+
+_JUGADA = TypeStatus.JUGADA
+_TIPO_JUGADA = _JUGADA.value
+
+_JUGADAS: tuple[bytes, ...] = tuple(bytes((_TIPO_JUGADA, c)) for c in range(81))
+"""Payload binario de cada jugada sin secuencia, por casilla global."""
+
+_CASILLAS: tuple[tuple[int, int] | None, ...] = tuple(
+    divmod(c, 9) if c < 81 else None for c in range(1 << 8)
+)
+"""Fila y columna globales de cada byte de jugada, None si no es una casilla."""
+
+_ESTADO = struct.Struct(f"!IBBBB{TAMANO_POSICION}s")
+"""Sala, lado, turno, última jugada (255 si no hay), resultado y posición."""
+
+_SIN_JUGADA = 255
+_LADOS: tuple[str, str] = ("X", "O")
+_RESULTADOS: tuple[str, ...] = tuple(r.name for r in Resultado)
+
 
 class MessageSocket:
     """
@@ -12,18 +80,27 @@ class MessageSocket:
     """
 
     @staticmethod
-    def create_message(message: str | dict, status_code: TypeStatus) -> dict:
+    def create_message(
+        message: str | dict, status_code: TypeStatus, secuencia: int | None = None
+    ) -> dict:
         """
         Crea un mensaje estructurado para enviar a través del socket.
 
         Args:
             message: El contenido del mensaje (string o diccionario).
             status_code: El estado del mensaje (TypeStatus).
+            secuencia: El número de secuencia del mensaje, None si no lleva.
 
         Returns:
-            Diccionario con los campos 'status' y 'message'.
+            Diccionario con los campos 'status' y 'message', más 'id' si lleva
+            número de secuencia. La posición de un ESTADO se escribe en
+            hexadecimal.
         """
+        if status_code is TypeStatus.ESTADO:
+            message = {**message, "posicion": message["posicion"].hex()}
         response = {"status": status_code.name, "message": message}
+        if secuencia is not None:
+            response["id"] = secuencia
 
         return response
 
@@ -40,5 +117,202 @@ class MessageSocket:
         """
         status_code = TypeStatus[response["status"]]
         message = response["message"]
+        if status_code is TypeStatus.ESTADO:
+            message["posicion"] = bytes.fromhex(message["posicion"])
 
         return status_code, message
+
+    @staticmethod
+    def encode(
+        message: str | dict,
+        status_code: TypeStatus,
+        binario: bool,
+        secuencia: int | None = None,
+    ) -> bytes:
+        """
+        Codifica un mensaje como payload listo para enmarcar.
+
+        Args:
+            message: El contenido del mensaje.
+            status_code: El estado del mensaje (TypeStatus).
+            binario: True para el formato binario, False para JSON.
+            secuencia: El número de secuencia del mensaje, None si no lleva.
+
+        Returns:
+            Los bytes del payload.
+
+        Raises:
+            ValueError: Si una jugada binaria no está dentro del tablero.
+        """
+        if binario:
+            if status_code is _JUGADA and secuencia is None:
+                fila, columna = message["fila"], message["columna"]
+                if 0 <= fila < 9 and 0 <= columna < 9:
+                    return _JUGADAS[fila * 9 + columna]
+            return MessageSocket.encode_binary(message, status_code, secuencia)
+        return json.dumps(
+            MessageSocket.create_message(message, status_code, secuencia)
+        ).encode("utf-8")
+
+    @staticmethod
+    def decode(payload: bytes | memoryview) -> tuple[TypeStatus, str | dict]:
+        """
+        Decodifica un payload en cualquiera de los dos formatos.
+
+        Args:
+            payload: Los bytes del payload, sin el encabezado de longitud.
+
+        Returns:
+            Tupla (TypeStatus, mensaje) con el estado y contenido del mensaje.
+
+        Raises:
+            ValueError: Si el payload está vacío o su tipo no es válido.
+        """
+        if len(payload) == 2 and payload[0] == _TIPO_JUGADA:
+            casilla = _CASILLAS[payload[1]]
+            if casilla is not None:
+                return _JUGADA, {"fila": casilla[0], "columna": casilla[1]}
+        return MessageSocket.decode_frame(payload)[:2]
+
+    @staticmethod
+    def decode_frame(
+        payload: bytes | memoryview,
+    ) -> tuple[TypeStatus, str | dict, int | None]:
+        """
+        Decodifica un payload en cualquiera de los dos formatos, con su secuencia.
+
+        Args:
+            payload: Los bytes del payload, sin el encabezado de longitud.
+
+        Returns:
+            Tupla (TypeStatus, mensaje, secuencia); la secuencia es None si el
+            mensaje no lleva.
+
+        Raises:
+            ValueError: Si el payload está vacío o su tipo no es válido.
+        """
+        if not payload:
+            raise ValueError("Empty payload")
+        tipo = payload[0]
+        if tipo == _TIPO_JUGADA and len(payload) == 2:
+            casilla = _CASILLAS[payload[1]]
+            if casilla is not None:
+                return _JUGADA, {"fila": casilla[0], "columna": casilla[1]}, None
+        if tipo == _LLAVE:
+            response = json.loads(str(payload, "utf-8"))
+            return *MessageSocket.parse_message(response), response.get("id")
+        return MessageSocket.decode_binary(payload)
+
+    @staticmethod
+    def encode_binary(
+        message: str | dict, status_code: TypeStatus, secuencia: int | None = None
+    ) -> bytes:
+        """
+        Codifica un mensaje en el formato binario.
+
+        Args:
+            message: El contenido del mensaje. Para JUGADA, un diccionario con
+                fila y columna globales [0-8]; para ESTADO, uno con sala, lado,
+                turno, ultima, resultado y los bytes de la posición.
+            status_code: El estado del mensaje (TypeStatus).
+            secuencia: El número de secuencia del mensaje, None si no lleva.
+
+        Returns:
+            Los bytes del payload.
+
+        Raises:
+            ValueError: Si una jugada no está dentro del tablero.
+        """
+        tipo = status_code._value_
+        if status_code is _JUGADA:
+            fila, columna = message["fila"], message["columna"]
+            if not (0 <= fila < 9 and 0 <= columna < 9):
+                raise ValueError("Invalid move")
+            casilla = fila * 9 + columna
+            if secuencia is None:
+                return _JUGADAS[casilla]
+            contenido = _BYTE_TIPO[casilla]
+        elif status_code is TypeStatus.ESTADO:
+            ultima = message["ultima"]
+            contenido = _ESTADO.pack(
+                message["sala"],
+                _LADOS.index(message["lado"]),
+                _LADOS.index(message["turno"]),
+                _SIN_JUGADA if ultima is None else ultima[0] * 9 + ultima[1],
+                _RESULTADOS.index(message["resultado"]),
+                message["posicion"],
+            )
+        elif message == "" or message is None:
+            contenido = b""
+        elif isinstance(message, str):
+            tipo |= _TEXTO
+            contenido = message.encode("utf-8")
+        else:
+            tipo |= _JSON
+            contenido = json.dumps(message).encode("utf-8")
+
+        if secuencia is None:
+            return _BYTE_TIPO[tipo] + contenido
+        return _CABECERA.pack(tipo | _CON_SECUENCIA, secuencia) + contenido
+
+    @staticmethod
+    def decode_binary(
+        payload: bytes | memoryview,
+    ) -> tuple[TypeStatus, str | dict, int | None]:
+        """
+        Decodifica un payload en el formato binario.
+
+        Args:
+            payload: Los bytes del payload.
+
+        Returns:
+            Tupla (TypeStatus, mensaje, secuencia) con el estado, el contenido y
+            el número de secuencia del mensaje, None si no lleva.
+
+        Raises:
+            ValueError: Si el tipo no es válido o el contenido no tiene el tamaño
+                que corresponde.
+        """
+        tipo = payload[0]
+        status_code = _STATUS_POR_TIPO[tipo] if tipo < _CON_SECUENCIA << 1 else None
+        if status_code is None:
+            raise ValueError(f"Invalid message type: {tipo}")
+
+        if tipo & _CON_SECUENCIA:
+            if len(payload) < _CABECERA.size:
+                raise ValueError("Invalid sequence number")
+            secuencia = _SECUENCIA.unpack_from(payload, 1)[0]
+            inicio = _CABECERA.size
+        else:
+            secuencia = None
+            inicio = 1
+
+        if status_code is _JUGADA:
+            casilla = _CASILLAS[payload[inicio]] if len(payload) == inicio + 1 else None
+            if casilla is None:
+                raise ValueError("Invalid move")
+            return status_code, {"fila": casilla[0], "columna": casilla[1]}, secuencia
+        if status_code is TypeStatus.ESTADO:
+            if len(payload) - inicio != _ESTADO.size:
+                raise ValueError("Invalid state snapshot")
+            sala, lado, turno, ultima, resultado, posicion = _ESTADO.unpack_from(
+                payload, inicio
+            )
+            estado = {
+                "sala": sala,
+                "lado": _LADOS[lado],
+                "turno": _LADOS[turno],
+                "ultima": None if ultima == _SIN_JUGADA else list(divmod(ultima, 9)),
+                "resultado": _RESULTADOS[resultado],
+                "posicion": posicion,
+            }
+            return status_code, estado, secuencia
+
+        clase = tipo & _CLASE
+        if clase == _VACIO:
+            return status_code, "", secuencia
+        if clase == _TEXTO:
+            return status_code, str(payload[inicio:], "utf-8"), secuencia
+        if clase == _JSON:
+            return status_code, json.loads(str(payload[inicio:], "utf-8")), secuencia
+        raise ValueError(f"Invalid message type: {tipo}")
@@ -3,7 +3,7 @@
 import socket
 from typing import override
 
-from .base_socket import BaseSocket
+from .base_socket import VENTANA, BaseSocket
 from .type_status import TypeStatus
 
 
@@ -23,14 +23,20 @@ class SocketServer(BaseSocket):
     conn: socket.socket | None = None
 
     @override
-    def __init__(self, host="localhost", port=54321):
+    def __init__(self, host="localhost", port=54321, ventana=VENTANA):
         """
         Inicializa el servidor y lo pone en modo de escucha.
 
         Args:
             host: La dirección IP del servidor, por defecto 'localhost'.
             port: El puerto de escucha, por defecto 54321.
+            ventana: Mensajes de send_data_pipelined() sin confirmar admitidos,
+                por defecto VENTANA.
+
+        Raises:
+            ValueError: Si la ventana es menor que 1.
         """
+        self._fijar_ventana(ventana)
         self.server_socket = socket.create_server((host, port))
         self.server_socket.listen(1)
         print(f"Server listening on {host}:{port}")
@@ -51,6 +57,7 @@ class SocketServer(BaseSocket):
             raise RuntimeError("A client is already connected")
 
         self.conn, addr = self.server_socket.accept()
+        self._reiniciar_conexion()
         # Configuración Keep-Alive para detectar si la otra PC se desconecta físicamente
         self.conn.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
         print(f"Connection from {addr} has been established!")
@@ -12,9 +12,15 @@ class TypeStatus(Enum):
         ERROR: Mensaje de error.
         ENVIO_DATOS: Envío de datos.
         CLOSE: Señal de cierre de conexión.
+        NEGOCIACION: Pedido o respuesta del protocolo de envío (ver MessageSocket).
+        JUGADA: Una jugada de HyperCat en coordenadas globales.
+        ESTADO: Una instantánea de la posición de una partida.
     """
 
     SUCCESS = auto()
     ERROR = auto()
     ENVIO_DATOS = auto()
     CLOSE = auto()
+    NEGOCIACION = auto()
+    JUGADA = auto()
+    ESTADO = auto()
@@ -20,26 +20,28 @@ def print_gato(gato: BaseGato) -> None:
     if not isinstance(gato, BaseGato):
         raise ValueError("El objeto proporcionado no es una instancia de BaseGato.")
 
+    n = gato.tamano
     if isinstance(gato, Gato):
-        tamano = 3
+        tamano = n
     else:  # HyperCat
-        tamano = 9
+        tamano = n * n
 
+    tablero = gato.tablero
     for fila_iterator in range(tamano):
         fila_str = ""
 
-        fila = fila_iterator // 3 if tamano == 9 else fila_iterator
+        fila = fila_iterator if tamano == n else fila_iterator // n
 
-        if fila_iterator % 3 == 0 and fila_iterator != 0:
+        if fila_iterator % n == 0 and fila_iterator != 0:
             print("-" * (tamano * 4 + 2))
 
         for columna_iterator in range(tamano):
-            columna = columna_iterator // 3 if tamano == 9 else columna_iterator
+            columna = columna_iterator if tamano == n else columna_iterator // n
 
-            if columna_iterator % 3 == 0 and columna_iterator != 0:
+            if columna_iterator % n == 0 and columna_iterator != 0:
                 fila_str += " | "
 
-            casilla = gato.tablero[fila][columna]
+            casilla = tablero[fila][columna]
 
             match casilla:
                 # Casilla simple
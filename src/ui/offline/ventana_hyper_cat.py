@@ -98,15 +98,8 @@ class VentanaHyperCatOffline(VentanaBase):
         # Bloquear todos los botones primero
         self._bloquear_todos_botones()
 
-        # Habilitar los botones del siguiente sub-juego si no se puede elegir cualquiera
-        if not self.juego.elegir_cualquiera:
-            siguiente_fila, siguiente_columna = self.juego.gato_a_jugar_despues
-            self._activar_botones_no_ocupados_sub_juego(
-                siguiente_fila, siguiente_columna
-            )
-        # Si se puede elegir cualquier sub-juego, habilitar los que no estén terminados
-        else:
-            self._activar_botones_no_ocupados()
+        # Habilitar solo las casillas donde el siguiente jugador puede jugar
+        self._activar_movimientos_legales()
 
         # Verificar si el sub-juego fue reiniciado
         sub_juego_reiniciado = self.juego.tablero[fila][columna].reiniciado
@@ -146,43 +139,14 @@ class VentanaHyperCatOffline(VentanaBase):
         else:
             self._actualizar_turno()
 
-    def _activar_botones_no_ocupados(self):
-        """
-        Habilita todos los botones de sub-juegos no terminados.
-
-        Útil cuando el jugador puede elegir cualquier sub-juego.
+    def _activar_movimientos_legales(self):
         """
-        for fila_sub_gato in range(3):
-            for columna_sub_gato in range(3):
-                self._activar_botones_no_ocupados_sub_juego(
-                    fila_sub_gato, columna_sub_gato
-                )
+        Habilita los botones de las casillas donde se puede jugar a continuación.
 
-    def _activar_botones_no_ocupados_sub_juego(
-        self, fila_sub_gato: int, columna_sub_gato: int
-    ):
+        Las casillas se obtienen de HyperCat.movimientos_legales, por lo que respeta
+        el sub-juego obligatorio y omite los sub-juegos terminados.
         """
-        Habilita los botones disponibles de un sub-juego específicos.
-
-        Solo habilita casillas vacías de sub-juegos no terminados.
-
-        Args:
-            fila_sub_gato: Índice de fila del sub-juego (0-2).
-            columna_sub_gato: Índice de columna del sub-juego (0-2).
-        """
-        if sub_juego := self.juego.tablero[fila_sub_gato][columna_sub_gato]:
-            if sub_juego.terminado():
-                return
-
-        for i in range(3):
-            for j in range(3):
-                ocupado = sub_juego.tablero[i][j].ocupada()
-                state = "disabled" if ocupado else "normal"
-                bg = self._color_segun_cuadrante(
-                    fila_sub_gato * 3 + i,
-                    columna_sub_gato * 3 + j,
-                    activo=ocupado is False,
-                )
-                self.botones_tablero[fila_sub_gato * 3 + i][
-                    columna_sub_gato * 3 + j
-                ].config(state=state, bg=bg)
+        for i, j in self.juego.movimientos_legales():
+            self.botones_tablero[i][j].config(
+                state="normal", bg=self._color_segun_cuadrante(i, j, activo=True)
+            )